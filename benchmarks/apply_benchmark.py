@@ -0,0 +1,42 @@
+"""
+Compares FrameMap.corr(method='kendall') run one dataframe after another with the same call run
+over a thread and a process pool.
+
+The kendall correlation needs scipy.
+
+Usage: python benchmarks/apply_benchmark.py [rows] [columns] [frames] [workers]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from dexter import FrameMap, set_workers
+
+
+def timed_corr(framemap: FrameMap, workers: int = None, executor: str = 'thread') -> float:
+    set_workers(workers, executor)
+    start = time.perf_counter()
+    framemap.corr(method='kendall')
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    n_frames = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else -1
+
+    rng = np.random.default_rng(0)
+    framemap = FrameMap([pd.DataFrame(rng.random((rows, columns))) for _ in range(n_frames)],
+                        [f'df{i}' for i in range(n_frames)])
+    print(f'{n_frames} frames of {rows} rows x {columns} columns')
+
+    serial_time = timed_corr(framemap)
+    thread_time = timed_corr(framemap, workers, 'thread')
+    process_time = timed_corr(framemap, workers, 'process')
+    set_workers()
+
+    print(f'serial: {serial_time:.2f}s')
+    print(f'threads: {thread_time:.2f}s ({serial_time / thread_time:.1f}x)')
+    print(f'processes: {process_time:.2f}s ({serial_time / process_time:.1f}x)')
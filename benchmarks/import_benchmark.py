@@ -0,0 +1,48 @@
+"""
+Measures the time a new interpreter takes to import dexter and read files with it, against importing
+pandas alone, and checks that neither imports IPython. Exits with an error if dexter adds more than
+max_overhead seconds to the import of pandas, so it can guard the startup of worker processes.
+
+Usage: python benchmarks/import_benchmark.py [runs] [max_overhead]
+"""
+import subprocess
+import sys
+
+STATEMENTS = {
+    'pandas': 'import pandas',
+    'dexter': 'import dexter',
+    'dexter.readm_csv': 'import dexter; dexter.readm_csv',
+}
+
+
+def import_time(statement: str, runs: int) -> float:
+    """
+    Returns the best time of runs new interpreters running statement, raises an AssertionError
+    if IPython was imported
+    """
+    code = (f'import sys, time; start = time.perf_counter(); {statement}; '
+            f'print(time.perf_counter() - start, "IPython" in sys.modules)')
+    times = []
+
+    for _ in range(runs):
+        seconds, ipython = subprocess.check_output([sys.executable, '-c', code], text=True).split()
+        assert ipython == 'False', f'{statement} imported IPython'
+        times.append(float(seconds))
+
+    return min(times)
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_overhead = float(sys.argv[2]) if len(sys.argv) > 2 else 0.15
+
+    times = {name: import_time(statement, runs) for name, statement in STATEMENTS.items()}
+
+    for name, seconds in times.items():
+        print(f'{name}: {seconds * 1000:.0f}ms')
+
+    overhead = times['dexter.readm_csv'] - times['pandas']
+    print(f'dexter over pandas: {overhead * 1000:.0f}ms')
+
+    if overhead > max_overhead:
+        sys.exit(f'dexter adds {overhead * 1000:.0f}ms to the import of pandas, more than {max_overhead * 1000:.0f}ms')
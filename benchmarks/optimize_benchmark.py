@@ -0,0 +1,68 @@
+"""
+Compares dexter.optimizer.optimize with the previous column by column implementation
+on a wide dataframe.
+
+Usage: python benchmarks/optimize_benchmark.py [rows] [columns]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from dexter.optimizer import optimize
+
+
+def optimize_per_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The previous implementation of optimize, kept here as the baseline
+    """
+    floats = df.select_dtypes(include=['float64']).columns.tolist()
+    df[floats] = df[floats].apply(pd.to_numeric, downcast='float')
+
+    ints = df.select_dtypes(include=['int64']).columns.tolist()
+    df[ints] = df[ints].apply(pd.to_numeric, downcast='integer')
+
+    for col in df.select_dtypes(include=['object']):
+        if float(len(df[col].unique())) / len(df[col]) < 0.5:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+def wide_frame(rows: int, columns: int) -> pd.DataFrame:
+    """
+    Half float, 40% integer and 10% text columns
+    """
+    rng = np.random.default_rng(0)
+    n_floats, n_ints = columns // 2, columns * 2 // 5
+    n_objects = columns - n_floats - n_ints
+
+    data = {f'f{i}': rng.random(rows) * 10 ** (i % 6) for i in range(n_floats)}
+    data.update({f'i{i}': rng.integers(0, 10 ** (i % 10), rows) for i in range(n_ints)})
+    words = np.array([f'word{i}' for i in range(rows)], dtype=object)
+    data.update({f'o{i}': pd.Series(words[rng.integers(0, max(rows // (1 + i % 4), 1), rows)], dtype=object)
+                 for i in range(n_objects)})
+
+    return pd.DataFrame(data)
+
+
+def timed(func, df: pd.DataFrame):
+    start = time.perf_counter()
+    out = func(df)
+
+    return out, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    df = wide_frame(rows, columns)
+    print(f'{rows} rows x {columns} columns, {df.memory_usage(deep=True).sum() / 2 ** 20:.0f} MiB')
+
+    per_column, per_column_time = timed(optimize_per_column, df.copy())
+    vectorised, vectorised_time = timed(optimize, df.copy())
+
+    mismatches = (per_column.dtypes.astype(str) != vectorised.dtypes.astype(str)).sum()
+    print(f'per column: {per_column_time:.2f}s')
+    print(f'vectorised: {vectorised_time:.2f}s ({per_column_time / vectorised_time:.1f}x)')
+    print(f'columns with a different type: {mismatches}')
@@ -0,0 +1,44 @@
+"""
+Compares FrameMap.profile with calling the statistical methods it replaces one after another
+on a FrameMap of wide dataframes.
+
+Usage: python benchmarks/profile_benchmark.py [rows] [columns] [frames]
+"""
+import sys
+import time
+from dexter import FrameMap
+from optimize_benchmark import wide_frame
+
+
+def separate_methods(framemap: FrameMap) -> None:
+    framemap.dtypes()
+    framemap.multiple_missing()
+    framemap.nunique()
+    framemap.mode()
+    framemap.min(numeric_only=True)
+    framemap.max(numeric_only=True)
+    framemap.mean(numeric_only=True)
+    framemap.std(numeric_only=True)
+    framemap.memory_usage()
+
+
+def timed(func, framemap: FrameMap) -> float:
+    start = time.perf_counter()
+    func(framemap)
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    n_frames = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+    framemap = FrameMap([wide_frame(rows, columns) for _ in range(n_frames)], [f'df{i}' for i in range(n_frames)])
+    print(f'{n_frames} frames of {rows} rows x {columns} columns')
+
+    separate_time = timed(separate_methods, framemap)
+    profile_time = timed(FrameMap.profile, framemap)
+
+    print(f'separate methods: {separate_time:.2f}s')
+    print(f'profile: {profile_time:.2f}s ({separate_time / profile_time:.1f}x)')
@@ -1,5 +1,59 @@
-from dexter.framemap import FrameMap
-from dexter.framelist import FrameList
-from dexter.readmultiple import *
-from dexter.display import *
-from dexter.optimizer import optimize
+"""
+dexter
+------
+Data Exploration Terser. The submodules are imported when one of their names is first used,
+so that importing dexter (e.g. in every worker process of a pool) costs little more than pandas.
+
+"""
+import importlib
+
+# the public names and the submodule each one is imported from
+_EXPORTS = {
+    'FrameMap': 'dexter.framemap',
+    'FrameList': 'dexter.framelist',
+    'FrameCache': 'dexter.cache',
+    'set_workers': 'dexter.parallel',
+    'LazyFrame': 'dexter.lazy',
+    'ReadError': 'dexter.readmultiple',
+    'EXCEL_EXTENSIONS': 'dexter.readmultiple',
+    'readm_csv': 'dexter.readmultiple',
+    'readm_excel': 'dexter.readmultiple',
+    'readm_json': 'dexter.readmultiple',
+    'readm_pickle': 'dexter.readmultiple',
+    'readm_parquet': 'dexter.readmultiple',
+    'readm_feather': 'dexter.readmultiple',
+    'readm_bundle': 'dexter.readmultiple',
+    'set_display': 'dexter.display',
+    'optimize': 'dexter.optimizer',
+    'optimize_chunks': 'dexter.optimizer',
+    'infer_csv_schema': 'dexter.optimizer',
+    'profile': 'dexter.profiling',
+    'FrameSketch': 'dexter.approximate',
+    'sketch': 'dexter.approximate',
+    'ColumnCatalog': 'dexter.catalog',
+    'StreamingFrameMap': 'dexter.streaming',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    else:
+        # a submodule that was not imported yet, e.g. dexter.parallel.options
+        try:
+            value = importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    # later lookups find it without calling __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,291 @@
+"""
+Approximate
+-----------
+Approximate statistics of dataframes computed from mergeable sketches, in bounded memory.
+
+"""
+from typing import Iterable
+import numpy as np
+import pandas as pd
+from dexter.sketches import HyperLogLog, KLL, SpaceSaving
+
+SKETCHES = ('distinct', 'quantiles', 'top')
+
+
+class ColumnSketch:
+    """
+    The sketches of a single column: the count of values and missing values, mean, standard deviation,
+    min and max (exact, merged with the parallel variance formula), the number of distinct values
+    (HyperLogLog), the quantiles of numeric columns (KLL) and the most frequent values (SpaceSaving).
+
+    Parameters
+    ----------
+    numeric : bool
+        whether the column is numeric, only numeric columns have mean, standard deviation and quantiles
+    precision : int, default 14
+        precision of the HyperLogLog sketch
+    k : int, default 200
+        k of the KLL sketch
+    capacity : int, default 1024
+        capacity of the SpaceSaving sketch
+    sketches : tuple of {'distinct', 'quantiles', 'top'}, default all three
+        the sketches to be kept, the others are None
+    """
+
+    def __init__(self, numeric: bool, precision: int = 14, k: int = 200, capacity: int = 1024,
+                 sketches: tuple = SKETCHES):
+        self.numeric = numeric
+        self.rows = 0
+        self.count = 0
+        self.mean = np.nan
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.distinct = HyperLogLog(precision) if 'distinct' in sketches else None
+        self.quantiles = KLL(k) if numeric and 'quantiles' in sketches else None
+        self.top = SpaceSaving(capacity) if 'top' in sketches else None
+
+    @property
+    def std(self) -> float:
+        """
+        The sample standard deviation of the values added
+        """
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def _merge_moments_(self, count: int, mean: float, m2: float, low, high) -> None:
+        """
+        Merges the count, mean, sum of squared deviations, min and max of other values into the sketch
+        """
+        if not count:
+            return
+
+        if self.count:
+            total = self.count + count
+            delta = mean - self.mean
+            self.mean += delta * count / total
+            self.m2 += m2 + delta * delta * self.count * count / total
+            self.min, self.max = min(self.min, low), max(self.max, high)
+            self.count = total
+        else:
+            self.count, self.mean, self.m2, self.min, self.max = count, mean, m2, low, high
+
+    def update(self, series: pd.Series) -> 'ColumnSketch':
+        """
+        Adds the values of a series to the sketch
+
+        Returns
+        -------
+        ColumnSketch
+        """
+        values = series.dropna()
+        self.rows += len(series)
+
+        if self.numeric:
+            numbers = values.to_numpy(dtype='float64')
+            if len(numbers):
+                mean = numbers.mean()
+                self._merge_moments_(len(numbers), mean, float(((numbers - mean) ** 2).sum()), numbers.min(),
+                                     numbers.max())
+        else:
+            self.count += len(values)
+
+        for values_sketch in [self.distinct, self.quantiles, self.top]:
+            if values_sketch is not None:
+                values_sketch.update(values)
+
+        return self
+
+    def merge(self, other: 'ColumnSketch') -> 'ColumnSketch':
+        """
+        Merges the sketch of the same column in another chunk into this one
+
+        Returns
+        -------
+        ColumnSketch
+        """
+        if self.numeric:
+            self._merge_moments_(other.count, other.mean, other.m2, other.min, other.max)
+        else:
+            self.count += other.count
+
+        self.rows += other.rows
+
+        for values_sketch, other_sketch in [(self.distinct, other.distinct), (self.quantiles, other.quantiles),
+                                            (self.top, other.top)]:
+            if values_sketch is not None:
+                values_sketch.merge(other_sketch)
+
+        return self
+
+
+class FrameSketch(dict):
+    """
+    The sketches of every column of a dataframe, by column name.
+
+    A FrameSketch can be updated with the chunks of a file read with chunksize, or merged with the
+    FrameSketch of other chunks, so that the approximate statistics of a file larger than memory
+    can be computed.
+
+    The number of distinct values has a relative error of about 0.8%, the quantiles an error of about
+    1.3% of the rank and the counts of the most frequent values are too high by at most 1/1024 of the
+    number of values. Count, mean, standard deviation, min and max are exact.
+
+    Parameters
+    ----------
+    **kwargs
+        the precision, k, capacity and sketches kept for each column, see ColumnSketch
+
+    Example
+    -------
+    >>> sketch = FrameSketch()
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     sketch.update(chunk)
+    >>> sketch.describe()
+    _______
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self._options = kwargs
+
+    def update(self, df: pd.DataFrame) -> 'FrameSketch':
+        """
+        Adds the values of a dataframe (or a chunk of it) to the sketches of its columns
+
+        Returns
+        -------
+        FrameSketch
+        """
+        for name, series in df.items():
+            if name not in self:
+                numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+                self[name] = ColumnSketch(numeric, **self._options)
+
+            self[name].update(series)
+
+        return self
+
+    def merge(self, other: 'FrameSketch') -> 'FrameSketch':
+        """
+        Merges the sketches of another chunk of the same dataframe into this one
+
+        Returns
+        -------
+        FrameSketch
+        """
+        for name, sketch in other.items():
+            if name in self:
+                self[name].merge(sketch)
+            else:
+                self[name] = sketch
+
+        return self
+
+    def nunique(self) -> pd.Series:
+        """
+        Returns the approximate number of distinct non-null values of each column
+
+        Returns
+        -------
+        pd.Series
+        """
+        return pd.Series({name: sketch.distinct.count() for name, sketch in self.items()}, dtype='int64')
+
+    def quantile(self, q: float = 0.5) -> pd.Series:
+        """
+        Returns the approximate quantile q of each numeric column
+
+        Returns
+        -------
+        pd.Series
+        """
+        return pd.Series({name: sketch.quantiles.quantile(q) for name, sketch in self.items() if sketch.numeric},
+                         dtype='float64')
+
+    def median(self) -> pd.Series:
+        """
+        Returns the approximate median of each numeric column
+
+        Returns
+        -------
+        pd.Series
+        """
+        return self.quantile(0.5)
+
+    def mode(self) -> pd.DataFrame:
+        """
+        Returns the approximate most frequent value of each column, in a single row
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return pd.DataFrame({name: [sketch.top.top(1).index[0] if len(sketch.top.counts) else np.nan]
+                             for name, sketch in self.items()})
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Returns the same table as DataFrame.describe(include='all'), with the number of distinct
+        values, most frequent value and its frequency and the quantiles being approximate
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        rows = {}
+
+        for name, sketch in self.items():
+            top = sketch.top.top(1)
+            column = {'count': sketch.count}
+
+            if sketch.numeric:
+                quartiles = sketch.quantiles.quantile([0.25, 0.5, 0.75])
+                column.update({'mean': sketch.mean, 'std': sketch.std, 'min': sketch.min, '25%': quartiles[0],
+                               '50%': quartiles[1], '75%': quartiles[2], 'max': sketch.max})
+            else:
+                column.update({'unique': sketch.distinct.count(), 'top': top.index[0] if len(top) else np.nan,
+                               'freq': top.iloc[0] if len(top) else np.nan})
+
+            rows[name] = column
+
+        index = [row for row in ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+                 if any(row in column for column in rows.values())]
+
+        return pd.DataFrame(rows, index=index, columns=list(self))
+
+
+def sketch(frames: Iterable[pd.DataFrame], **kwargs) -> FrameSketch:
+    """
+    Receives a dataframe or an iterable of dataframes, such as the chunks of a file read with chunksize
+    Returns the FrameSketch of all their values
+
+    Parameters
+    ----------
+    frames : pd.DataFrame or Iterable[pd.DataFrame]
+        the dataframe or its chunks
+    **kwargs
+        the precision, k, capacity and sketches kept for each column, see ColumnSketch
+
+    Returns
+    -------
+    FrameSketch
+    """
+    frame_sketch = FrameSketch(**kwargs)
+
+    for df in [frames] if isinstance(frames, pd.DataFrame) else frames:
+        frame_sketch.update(df)
+
+    return frame_sketch
+
+
+# the sketches each approximate statistic needs
+_METHOD_SKETCHES = {'nunique': ('distinct',), 'median': ('quantiles',), 'mode': ('top',), 'describe': SKETCHES}
+
+
+def _approx_(df: pd.DataFrame, method: str):
+    """
+    Sketches a dataframe with only the sketches the FrameSketch method needs
+
+    Returns the result of the method
+    """
+    return getattr(sketch(df, sketches=_METHOD_SKETCHES[method]), method)()
@@ -0,0 +1,106 @@
+"""
+Arrow
+-----
+Reading and writing dataframes as Arrow tables: memory mapped Feather (Arrow IPC) files,
+filters pushed down to the Arrow readers and Arrow backed dataframes.
+
+"""
+from typing import List
+import pandas as pd
+from dexter.compat import _import_optional_
+from dexter.writers import _atomic_write_
+
+DTYPE_BACKENDS = (None, 'numpy_nullable', 'pyarrow')
+
+
+def _check_dtype_backend_(dtype_backend: str) -> None:
+    """
+    Raises a ValueError if dtype_backend is not one of DTYPE_BACKENDS
+    """
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f'dtype_backend must be one of {list(DTYPE_BACKENDS)}, got {dtype_backend!r}')
+
+
+def _filters_expression_(filters):
+    """
+    Receives filters in the format of pyarrow.parquet, a list of (column, op, value) tuples
+    that must all hold, or a list of such lists of which one must hold, or an Arrow expression
+
+    Returns the Arrow expression
+    """
+    pq = _import_optional_('pyarrow.parquet', 'filter rows', 'pyarrow')
+    ds = _import_optional_('pyarrow.dataset', 'filter rows', 'pyarrow')
+
+    if isinstance(filters, ds.Expression):
+        return filters
+
+    return pq.filters_to_expression(filters)
+
+
+def _table_to_pandas_(table, dtype_backend: str = None) -> pd.DataFrame:
+    """
+    Converts an Arrow table to a dataframe: with numpy types by default, pandas nullable types
+    for 'numpy_nullable' or, without copying the data, Arrow types (pd.ArrowDtype) for 'pyarrow'
+
+    Returns the dataframe
+    """
+    if dtype_backend == 'pyarrow':
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    if dtype_backend == 'numpy_nullable':
+        pa = _import_optional_('pyarrow', 'convert Arrow tables')
+        nullable = {pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype(),
+                    pa.int64(): pd.Int64Dtype(), pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(),
+                    pa.uint32(): pd.UInt32Dtype(), pa.uint64(): pd.UInt64Dtype(), pa.bool_(): pd.BooleanDtype(),
+                    pa.float32(): pd.Float32Dtype(), pa.float64(): pd.Float64Dtype(), pa.string(): pd.StringDtype(),
+                    pa.large_string(): pd.StringDtype()}
+
+        return table.to_pandas(types_mapper=nullable.get)
+
+    return table.to_pandas()
+
+
+def _read_feather_(path: str, columns: List[str] = None, filters=None, dtype_backend: str = None) -> pd.DataFrame:
+    """
+    Reads a Feather (Arrow IPC) file memory mapped, so that only the columns asked for are read from disk
+    The filters are applied to the Arrow table, before it is converted to a dataframe.
+
+    Returns the dataframe
+    """
+    feather = _import_optional_('pyarrow.feather', 'read feather files', 'pyarrow')
+    table = feather.read_table(path, columns=columns, memory_map=True)
+
+    if filters is not None:
+        table = table.filter(_filters_expression_(filters))
+
+    return _table_to_pandas_(table, dtype_backend)
+
+
+def _arrow_table_(df: pd.DataFrame, purpose: str):
+    """
+    Converts a dataframe to an Arrow table
+
+    Returns the table, or None if Arrow can not hold the dataframe (e.g. columns that are not
+    unique strings or object columns of mixed types)
+    """
+    if not (df.columns.is_unique and all(isinstance(col, str) for col in df.columns)):
+        return None
+
+    pa = _import_optional_('pyarrow', purpose)
+
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+
+def _write_feather_(df: pd.DataFrame, path: str, compression: str = 'uncompressed') -> None:
+    """
+    Writes a dataframe to a Feather (Arrow IPC) file, through a temporary file so that a half
+    written file is never read. Uncompressed files can be memory mapped when read back.
+    """
+    pa = _import_optional_('pyarrow', 'write feather files')
+    feather = _import_optional_('pyarrow.feather', 'write feather files', 'pyarrow')
+
+    _atomic_write_(lambda temporary: feather.write_feather(pa.Table.from_pandas(df), temporary,
+                                                           compression=compression), path)
@@ -0,0 +1,144 @@
+"""
+Bundle
+------
+Every dataframe of a FrameMap in a single file: a zip container holding one uncompressed
+Arrow IPC member per dataframe (pickle for dataframes Arrow can not hold) and a manifest.
+
+The members are stored without zip compression and their data starts at a 64 byte boundary
+of the file, so the bundle is memory mapped and each Arrow member is read in place, without
+copying its bytes.
+
+"""
+import json
+import pickle
+import struct
+import time
+import zipfile
+from typing import List, Tuple
+import pandas as pd
+from dexter.arrow import _arrow_table_, _filters_expression_, _table_to_pandas_
+from dexter.compat import _import_optional_
+from dexter.pushdown import _select_
+from dexter.writers import _atomic_write_
+
+BUNDLE_FORMAT = 'dexter.bundle'
+BUNDLE_VERSION = 1
+MANIFEST = 'manifest.json'
+
+# size of the fixed part of a zip local file header, followed by the member name and extra field
+_LOCAL_HEADER = 30
+# size of the zip64 extra field zipfile adds to the local header of a member opened with force_zip64
+_ZIP64_EXTRA = 20
+# the alignment Arrow expects of its buffers, and the id of the extra field padding the local headers,
+# the one used by Android's zipalign
+_ALIGNMENT = 64
+_PADDING_ID = 0xD935
+
+
+def _aligned_info_(bundle: zipfile.ZipFile, name: str) -> zipfile.ZipInfo:
+    """
+    Returns the ZipInfo of a member about to be written with force_zip64, its local header padded
+    with an extra field so that the data of the member starts at a multiple of _ALIGNMENT
+    """
+    info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o600 << 16
+
+    # the padding field is at least its 4 bytes of id and size
+    start = bundle.fp.tell() + _LOCAL_HEADER + len(name.encode('utf-8')) + _ZIP64_EXTRA + 4
+    padding = -start % _ALIGNMENT
+    info.extra = struct.pack('<HH', _PADDING_ID, padding) + bytes(padding)
+
+    return info
+
+
+def _write_bundle_(path: str, frames, names: List[str], compression: str = 'uncompressed') -> None:
+    """
+    Writes the dataframes (any iterable, read one at a time) and their names to a bundle,
+    through a temporary file so that a half written bundle is never read.
+    Arrow members are compressed with compression ('uncompressed', 'lz4' or 'zstd').
+    """
+    feather = _import_optional_('pyarrow.feather', 'write bundles', 'pyarrow')
+
+    def write(temporary: str) -> None:
+        entries = []
+
+        with zipfile.ZipFile(temporary, 'w', zipfile.ZIP_STORED) as bundle:
+            for i, (df, name) in enumerate(zip(frames, names)):
+                table = _arrow_table_(df, 'write bundles')
+                entry = {'name': str(name), 'rows': len(df), 'columns': [str(col) for col in df.columns]}
+
+                if table is not None:
+                    entry.update(member=f'frames/{i}.arrow', format='arrow')
+                    with bundle.open(_aligned_info_(bundle, entry['member']), 'w', force_zip64=True) as member:
+                        feather.write_feather(table, member, compression=compression)
+                else:
+                    entry.update(member=f'frames/{i}.pkl', format='pickle')
+                    with bundle.open(entry['member'], 'w', force_zip64=True) as member:
+                        pickle.dump(df, member, protocol=pickle.HIGHEST_PROTOCOL)
+
+                entries.append(entry)
+
+            manifest = {'format': BUNDLE_FORMAT, 'version': BUNDLE_VERSION, 'frames': entries}
+            bundle.writestr(MANIFEST, json.dumps(manifest, indent=1))
+
+    _atomic_write_(write, path)
+
+
+def _read_manifest_(path: str) -> Tuple[dict, dict]:
+    """
+    Reads the manifest of a bundle, raises a ValueError if the file is not a bundle
+
+    Returns the manifest and the offset of the data of each member
+    """
+    try:
+        with zipfile.ZipFile(path) as bundle:
+            manifest = json.loads(bundle.read(MANIFEST))
+            infos = bundle.infolist()
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError(f'{path} is not a dexter bundle, it is not a zip file with a {MANIFEST}') from None
+
+    if manifest.get('format') != BUNDLE_FORMAT or manifest.get('version', 0) > BUNDLE_VERSION:
+        raise ValueError(f'{path} is not a dexter bundle this version can read')
+
+    with open(path, 'rb') as file:
+        offsets = {}
+
+        for info in infos:
+            file.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack('<HH', file.read(4))
+            offsets[info.filename] = (info.header_offset + _LOCAL_HEADER + name_length + extra_length,
+                                      info.file_size)
+
+    return manifest, offsets
+
+
+def _read_member_(path: str, entry: dict, offset: Tuple[int, int], columns: List[str] = None, filters=None,
+                  dtype_backend: str = None) -> pd.DataFrame:
+    """
+    Reads the dataframe of a manifest entry from a bundle, memory mapped, at the given (offset, size)
+    The columns and filters are applied to the Arrow table, before it is converted to a dataframe.
+
+    Returns the dataframe
+    """
+    pa = _import_optional_('pyarrow', 'read bundles')
+    start, size = offset
+
+    # the buffer points into the mapped file and keeps the mapping alive after it is closed
+    with pa.memory_map(path) as source:
+        source.seek(start)
+        data = source.read_buffer(size)
+
+    if entry['format'] == 'pickle':
+        return _select_(pickle.loads(data), columns, filters)
+
+    table = pa.ipc.open_file(data).read_all()
+
+    # the filters may refer to columns that are not kept
+    if filters is not None:
+        table = table.filter(_filters_expression_(filters))
+
+    if columns is not None:
+        table = table.select(columns)
+
+    return _table_to_pandas_(table, dtype_backend)
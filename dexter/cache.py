@@ -0,0 +1,189 @@
+"""
+FrameCache
+----------
+A persistent on-disk cache of the dataframes read (and optimized) by the readm_* functions.
+
+"""
+import hashlib
+import os
+import uuid
+from typing import Callable, Optional
+import pandas as pd
+from dexter.arrow import _arrow_table_
+from dexter.compat import _import_optional_
+
+
+class FrameCache:
+    """
+    A folder of Arrow IPC (feather) files holding dataframes that were already read.
+
+    Entries are keyed on the absolute path, size and modification time of the source file and on
+    the arguments used to read it, so an entry is reused only while the file is unchanged.
+    Entries are written uncompressed and memory mapped when read back, so a hit costs about as
+    much as copying the data. When the folder grows over max_bytes, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    directory : str, default None
+        the folder of the cache, ~/.cache/dexter if None
+    max_bytes : int, default 4 GiB
+        the maximum total size of the cache
+
+    Example
+    -------
+    >>> cache = FrameCache('./.dexter_cache', max_bytes=2 ** 30)
+    >>> dataframes = readm_csv('./folder/', optimize=True, cache=cache)
+    _______
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = 4 * 2 ** 30):
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.cache', 'dexter')
+        self.max_bytes = max_bytes
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'FrameCache({self.directory!r}, max_bytes={self.max_bytes})'
+
+    def key(self, path: str, arguments: str = '') -> str:
+        """
+        Returns the key of a file read with the given arguments, a hash of its absolute
+        path, size, modification time and the arguments
+
+        Parameters
+        ----------
+        path : str
+        arguments : str, default ''
+            a description of how the file is read
+
+        Returns
+        -------
+        str
+        """
+        stat = os.stat(path)
+        fingerprint = f'{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{arguments}'
+
+        return hashlib.sha1(fingerprint.encode()).hexdigest()
+
+    def _path_(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.feather')
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached dataframe, or None if there is no entry for the key
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        pd.DataFrame or None
+        """
+        feather = _import_optional_('pyarrow.feather', 'use the FrameCache', 'pyarrow')
+        path = self._path_(key)
+
+        try:
+            table = feather.read_table(path, memory_map=True)
+            # the modification time of an entry is the time it was last used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return table.to_pandas()
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Stores a dataframe, then evicts the least recently used entries if the cache is too large
+        Dataframes Arrow can not hold (column names that are not unique strings, object columns of mixed
+        types) are skipped, the cache never fails a read.
+
+        Parameters
+        ----------
+        key : str
+        df : pd.DataFrame
+        """
+        feather = _import_optional_('pyarrow.feather', 'use the FrameCache', 'pyarrow')
+        table = _arrow_table_(df, 'use the FrameCache')
+
+        if table is None:
+            return
+
+        # written to a temporary file first, so that a half written entry is never read
+        temporary = self._path_(key) + f'.{uuid.uuid4().hex}.tmp'
+        feather.write_feather(table, temporary, compression='uncompressed')
+        os.replace(temporary, self._path_(key))
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache is not larger than max_bytes
+        """
+        entries = []
+
+        with os.scandir(self.directory) as files:
+            for file in files:
+                if file.name.endswith('.feather'):
+                    stat = file.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, file.path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # another process evicted it first
+                pass
+
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every entry of the cache
+        """
+        max_bytes, self.max_bytes = self.max_bytes, -1
+        self.evict()
+        self.max_bytes = max_bytes
+
+
+def _cached_read_(cache: FrameCache, loader: Callable, path: str) -> pd.DataFrame:
+    """
+    Reads a file through the cache: the cached dataframe is returned if the file did not change
+    since it was stored, otherwise the file is read with loader and stored
+
+    Returns the dataframe
+    """
+    # the loader is a partial of the reading function, its arguments are part of the key
+    arguments = _describe_((getattr(loader, 'func', loader), getattr(loader, 'args', ()),
+                            getattr(loader, 'keywords', {})))
+    key = cache.key(path, arguments)
+    df = cache.get(key)
+
+    if df is None:
+        df = loader(path)
+        cache.put(key, df)
+
+    return df
+
+
+def _describe_(value) -> str:
+    """
+    Returns a description of the arguments of a reader that is the same across sessions,
+    functions are described by their qualified name instead of their address
+    """
+    if callable(value):
+        return f'{getattr(value, "__module__", "")}.{getattr(value, "__qualname__", repr(value))}'
+
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{key!r}: {_describe_(item)}' for key, item in sorted(value.items(), key=str)) + '}'
+
+    if isinstance(value, (list, tuple)):
+        return '(' + ', '.join(_describe_(item) for item in value) + ')'
+
+    return repr(value)
@@ -0,0 +1,21 @@
+"""
+Compat
+------
+Handling of the optional dependencies of dexter.
+
+"""
+import importlib
+from types import ModuleType
+
+
+def _import_optional_(name: str, purpose: str, package: str = None) -> ModuleType:
+    """
+    Imports an optional dependency
+
+    Returns the module, or raises an ImportError explaining what it is needed for
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        package = package or name.split('.')[0]
+        raise ImportError(f'{package} is required to {purpose}, install it with: pip install {package}') from error
@@ -0,0 +1,60 @@
+"""
+Discovery
+---------
+Finding the files to be read in a folder, its subfolders and hive style partitions.
+
+"""
+import os
+from fnmatch import fnmatch
+from typing import Dict, List, Sequence, Union
+
+
+def _matching_extension_(name: str, extensions: Sequence[str]) -> Union[str, None]:
+    """
+    Returns the extension in extensions that name ends with, the longest one if more than one match
+    """
+    matches = [extension for extension in extensions if name.endswith(extension)]
+
+    return max(matches, key=len) if matches else None
+
+
+def _scan_files_(filepath: str, extensions: Sequence[str], recursive: bool = False,
+                 pattern: str = None) -> List[str]:
+    """
+    Lists the files in filepath with one of the extensions, using os.scandir so that the type of
+    each entry comes from the directory listing itself instead of one stat call per file
+    If recursive, the subfolders are listed as well, except hidden ones (e.g. .git). Hidden files are
+    listed like any other file.
+    If pattern is given, only the files whose relative path matches this glob pattern are kept.
+
+    Returns the sorted paths of the files, relative to filepath and separated by '/'
+    """
+    files, folders = [], ['']
+
+    while folders:
+        folder = folders.pop()
+
+        with os.scandir(os.path.join(filepath, folder)) as entries:
+            for entry in entries:
+                relative = folder + '/' + entry.name if folder else entry.name
+
+                if entry.is_dir():
+                    if recursive and not entry.name.startswith('.'):
+                        folders.append(relative)
+
+                elif _matching_extension_(entry.name, extensions) and (pattern is None or fnmatch(relative, pattern)):
+                    files.append(relative)
+
+    return sorted(files)
+
+
+def _partitions_(relative_path: str) -> Dict[str, str]:
+    """
+    Parses the hive style partition keys in the folders of a relative path,
+    e.g. 'dt=2026-10-01/region=eu/part-000.parquet' gives {'dt': '2026-10-01', 'region': 'eu'}
+
+    Returns a dictionary of partition key to value
+    """
+    folders = relative_path.split('/')[:-1]
+
+    return dict(folder.split('=', 1) for folder in folders if '=' in folder)
@@ -1,32 +1,144 @@
-from IPython.core.display import HTML
-from typing import List
+"""
+Display
+-------
+HTML rendering of a list of dataframes side by side, with a bounded cost: each dataframe is truncated
+to a number of rows and columns, only a page of dataframes is rendered at a time and the rendered
+tables are cached until their dataframe changes.
+
+"""
+import html
+import weakref
+from collections import OrderedDict
+from typing import List, Sequence
+import numpy as np
 import pandas as pd
 
+# the limits used when none are given, set with set_display
+options = {'max_rows': 10, 'max_columns': 20, 'max_frames': 20}
+
+# rendered tables, by id of the dataframe, with the fingerprint of what they show
+_CACHE_SIZE = 256
+_fragments = OrderedDict()
+
 
-def _to_html_str_(df_list: List[pd.DataFrame], name_list: List[str]):
+def set_display(max_rows: int = 10, max_columns: int = 20, max_frames: int = 20) -> None:
     """
-    Receives a list of dataframes and a list of names
+    Sets how much of a FrameMap or FrameList is rendered as HTML
 
-    Returns a string of a html table with each dataframe side by side and the names above it
+    Parameters
+    ----------
+    max_rows : int, default 10
+        rows shown of each dataframe, half from its head and half from its tail
+    max_columns : int, default 20
+        columns shown of each dataframe, half from its start and half from its end
+    max_frames : int, default 20
+        dataframes shown on each page, the others are shown by display(page=...)
+
+    Example
+    -------
+    >>> set_display(max_rows=20, max_frames=5)
+    >>> dataframes.display(page=1)
+    _______
+    """
+    for name, value in {'max_rows': max_rows, 'max_columns': max_columns, 'max_frames': max_frames}.items():
+        if value < 1:
+            raise ValueError(f'{name} must be a positive integer, got {value}')
+
+    options.update(max_rows=max_rows, max_columns=max_columns, max_frames=max_frames)
+
+
+def _shown_positions_(length: int, limit: int) -> np.ndarray:
+    """
+    Returns the positions of the rows (or columns) shown when at most limit of length are shown,
+    the first and the last ones
     """
+    if length <= limit:
+        return np.arange(length)
 
+    return np.r_[0:(limit + 1) // 2, length - limit // 2:length]
 
-    tables = (
-        ''.join(
-            ('<table><tr style="background-color:white;">',
-             ''.join([f'<td style="vertical-align:top">' + f'<h5 style="text-align:center">{name}</h5><br>' +
-                      table._repr_html_() + '</td>' for table, name in zip(df_list, name_list)]),
-             '</tr></table>')
-        )
-    )
+
+def _fingerprint_(df: pd.DataFrame, max_rows: int, max_columns: int):
+    """
+    Returns what the rendered table of a dataframe depends on: its shape and the labels, types and
+    hashed values of the cells shown, None if the values can not be hashed
+    """
+    shown = df.take(_shown_positions_(len(df), max_rows)).take(_shown_positions_(df.shape[1], max_columns), axis=1)
+
+    try:
+        cells = pd.util.hash_pandas_object(shown, index=True).to_numpy().tobytes()
+    except TypeError:
+        # e.g. lists in an object column
+        return None
+
+    return df.shape, tuple(map(str, shown.columns)), tuple(map(str, shown.dtypes)), cells
+
+
+def _render_frame_(df: pd.DataFrame, max_rows: int, max_columns: int) -> str:
+    """
+    Returns the HTML table of a dataframe truncated to max_rows and max_columns, from the cache if the
+    dataframe did not change since it was last rendered with these limits
+    """
+    key = (id(df), max_rows, max_columns)
+    fingerprint = _fingerprint_(df, max_rows, max_columns)
+    cached = _fragments.get(key)
+
+    # the id of a dataframe that was garbage collected may be reused by another one
+    if cached is not None and cached[0]() is df and fingerprint is not None and cached[1] == fingerprint:
+        _fragments.move_to_end(key)
+        return cached[2]
+
+    # pandas formats only the rows and columns shown
+    fragment = df.to_html(notebook=True, max_rows=max_rows, max_cols=max_columns, show_dimensions=True)
+
+    if fingerprint is not None:
+        _fragments[key] = (weakref.ref(df), fingerprint, fragment)
+        _fragments.move_to_end(key)
+
+        while len(_fragments) > _CACHE_SIZE:
+            _fragments.popitem(last=False)
+
+    return fragment
+
+
+def _to_html_str_(df_list: Sequence[pd.DataFrame], name_list: List[str], page: int = 0, max_rows: int = None,
+                  max_columns: int = None, max_frames: int = None) -> str:
+    """
+    Receives a sequence of dataframes and a list of names, only the dataframes on the page being indexed
+
+    Returns a string of a html table with each dataframe of the page side by side and the names above it,
+    followed by the number of pages if there is more than one
+    """
+    max_rows = max_rows or options['max_rows']
+    max_columns = max_columns or options['max_columns']
+    max_frames = max_frames or options['max_frames']
+
+    pages = max(1, -(-len(name_list) // max_frames))
+    if not 0 <= page < pages:
+        raise ValueError(f'page must be between 0 and {pages - 1}, got {page}')
+
+    start, stop = page * max_frames, min((page + 1) * max_frames, len(name_list))
+
+    cells = ''.join(f'<td style="vertical-align:top"><h5 style="text-align:center">{html.escape(str(name_list[i]))}'
+                    f'</h5><br>{_render_frame_(df_list[i], max_rows, max_columns)}</td>'
+                    for i in range(start, stop))
+    tables = f'<table><tr style="background-color:white;">{cells}</tr></table>'
+
+    if pages > 1:
+        tables += (f'<p>dataframes {start + 1} to {stop} of {len(name_list)} (page {page} of pages 0 to {pages - 1}, '
+                   f'display(page=...) shows the others)</p>')
 
     return f'<tr>{tables}</tr>'
 
 
-def _to_html_(df_list: List[pd.DataFrame], name_list: List[str]):
+def _to_html_(df_list: Sequence[pd.DataFrame], name_list: List[str], page: int = 0, max_rows: int = None,
+              max_columns: int = None, max_frames: int = None):
     """
-    Receives a list of dataframes and a list of names
+    Receives a sequence of dataframes and a list of names
 
-    Returns a html table with each dataframe side by side and the names above it
+    Returns a html table with each dataframe of the page side by side and the names above it
     """
-    return HTML(_to_html_str_(df_list, name_list))
+    # IPython takes a while to import, only the notebook display needs it
+    from IPython.core.display import HTML
+
+    return HTML(_to_html_str_(df_list, name_list, page, max_rows, max_columns, max_frames))
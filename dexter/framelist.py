@@ -28,4 +28,4 @@ class FrameList(list):
         """
         Return a HTML representation for a FrameList
         """
-        return _to_html_str_(self)
+        return _to_html_str_(self, [str(i) for i in range(len(self))])
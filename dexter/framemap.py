@@ -4,11 +4,23 @@ FrameMap
 Data in the form of a dictionary of dataframes, the keys are the names of the dataframes.
 
 """
+import os
 from typing import List
 import pandas as pd
 import numpy as np
 from dexter.display import _to_html_str_, _to_html_
+from dexter.lazy import LazyFrame
+from dexter.spill import MemoryBudget, SpilledFrame
 import dexter.optimizer
+import dexter.approximate
+import dexter.arrow
+import dexter.bundle
+import dexter.catalog
+import dexter.parallel
+import dexter.profiling
+import dexter.sql
+import dexter.union
+import dexter.writers
 
 
 class FrameMap(dict):
@@ -46,7 +58,7 @@ class FrameMap(dict):
         if not names:
             self.names = [str(i) for i in range(len(frames))]
 
-        for frame, name in zip(frames, names):
+        for frame, name in zip(frames, self.names):
             self[str(name)] = frame
 
     def __getattr__(self, key: str):
@@ -55,25 +67,197 @@ class FrameMap(dict):
     def __setattr__(self, key: str, value: pd.DataFrame) -> None:
         self[key] = value
 
+    def __getitem__(self, key: str):
+        value = super().__getitem__(key)
+
+        # lazy frames are read on first access and replaced by the dataframe
+        if isinstance(value, LazyFrame):
+            value = self._load_(value)
+
+        if self.memory_budget is not None and isinstance(value, pd.DataFrame):
+            self._touch_(key, value)
+
+        return value
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    @property
+    def frames(self) -> List[pd.DataFrame]:
+        """
+        List of the dataframes, lazy frames that were not read yet are read here
+        Under a memory budget, a sequence that reads each dataframe only when it is reached
+        """
+        if self.memory_budget is not None:
+            return _BudgetedFrames(self)
+
+        frames = super().get('frames')
+
+        for frame in frames:
+            if isinstance(frame, LazyFrame):
+                self._load_(frame)
+
+        return frames
+
+    def _load_(self, lazy_frame: LazyFrame) -> pd.DataFrame:
+        """
+        Reads a lazy frame and replaces it by the dataframe wherever it is referenced
+        """
+        frame = lazy_frame.load()
+        frames = super().get('frames')
+
+        if isinstance(lazy_frame, SpilledFrame) and self.memory_budget is not None:
+            self.memory_budget.reloads += 1
+
+        if isinstance(lazy_frame, SpilledFrame) and self.__dict__.get('_catalog') is not None:
+            # the same data read back, the catalog need not index it again
+            self.__dict__['_catalog']._retarget_(lazy_frame, frame)
+
+        for i, value in enumerate(frames):
+            if value is lazy_frame:
+                frames[i] = frame
+
+        for key, value in self.items():
+            if value is lazy_frame:
+                super().__setitem__(key, frame)
+
+                if self.memory_budget is not None:
+                    self._touch_(key, frame)
+
+        return frame
+
+    def _frame_at_(self, i: int) -> pd.DataFrame:
+        """
+        Returns the dataframe at position i, read if it is lazy or spilled, whatever the type of its name
+        """
+        value = super().get('frames')[i]
+
+        if isinstance(value, LazyFrame):
+            value = self._load_(value)
+
+        if self.memory_budget is not None and isinstance(value, pd.DataFrame):
+            self._touch_(str(self.names[i]), value)
+
+        return value
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Returns False if the dataframe with this name was not read from disk yet
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        bool
+        """
+        return not isinstance(super().__getitem__(name), LazyFrame)
+
+    # ------------ Memory Budget -------------
+
+    def set_memory_budget(self, max_bytes: int, directory: str = None) -> MemoryBudget:
+        """
+        Keeps the dataframes of the FrameMap under a memory budget. The least recently used dataframes are
+        spilled to disk when the budget is exceeded and read back (memory mapped) when accessed again.
+
+        Parameters
+        ----------
+        max_bytes : int
+            the memory the dataframes may use, None removes the budget
+        directory : str, default None
+            the folder the dataframes are spilled to, a temporary folder if None
+
+        Returns
+        -------
+        MemoryBudget
+            the budget, whose stats method shows the number of evictions and reloads
+        """
+        if max_bytes is None:
+            object.__setattr__(self, '_budget', None)
+            return None
+
+        budget = MemoryBudget(max_bytes, directory)
+        # FrameMap.__setattr__ would store it as a dataframe
+        object.__setattr__(self, '_budget', budget)
+
+        for name in self.names:
+            if self.is_loaded(name):
+                self._touch_(name, super().__getitem__(name))
+
+        return budget
+
+    @property
+    def memory_budget(self) -> MemoryBudget:
+        """
+        The MemoryBudget of the FrameMap, None if it has none
+        """
+        return self.__dict__.get('_budget')
+
+    def _touch_(self, name: str, frame: pd.DataFrame) -> None:
+        """
+        Marks a dataframe as the most recently used one, spilling others if the budget is exceeded
+        """
+        for victim in self.memory_budget.touch(name, frame):
+            self._spill_(victim)
+
+    def _spill_(self, name: str) -> None:
+        """
+        Writes a dataframe to the spill folder and replaces it by a SpilledFrame wherever it is referenced
+        """
+        frame = super().get(name)
+
+        if not isinstance(frame, pd.DataFrame) or name not in self.names:
+            # it was removed from the FrameMap, or is not in memory
+            self.memory_budget.forget(name)
+            return
+
+        spilled = self.memory_budget.spill(name, frame)
+
+        if self.__dict__.get('_catalog') is not None:
+            self.__dict__['_catalog']._retarget_(frame, spilled)
+        frames = super().get('frames')
+
+        for i, value in enumerate(frames):
+            if value is frame:
+                frames[i] = spilled
+
+        super().__setitem__(name, spilled)
+
     # ------------ Rendering Methods -------------
 
     def _repr_html_(self) -> str:
         """
-        Return a HTML representation for a FrameMap
+        Return a HTML representation for a FrameMap, the first page of display
         """
-        return _to_html_str_(self.frames, self.names)
+        return _to_html_str_(_BudgetedFrames(self), self.names)
 
-    def display(self) -> 'IPython.core.display.HTML':
+    def display(self, page: int = 0, max_rows: int = None, max_columns: int = None,
+                max_frames: int = None) -> 'IPython.core.display.HTML':
         """
         Receives a FrameMap.
         Returns a table which contains each IpyTable in an HTML cell.
 
+        Only a page of dataframes is rendered (and read, if lazy), each one truncated to its first and last
+        rows and columns. Rendered tables are cached, so displaying dataframes that did not change is free.
+
+        Parameters
+        ----------
+        page : int, default 0
+            the page of dataframes shown, from 0
+        max_rows : int, default None
+            rows shown of each dataframe, None uses the default set by dexter.set_display (10)
+        max_columns : int, default None
+            columns shown of each dataframe, None uses the default set by dexter.set_display (20)
+        max_frames : int, default None
+            dataframes on each page, None uses the default set by dexter.set_display (20)
+
         Returns
         -------
         IPython.core.display.HTML
         """
-
-        return _to_html_(self.frames, self.names)
+        # only the dataframes of the page are read from the sequence
+        return _to_html_(_BudgetedFrames(self), self.names, page, max_rows, max_columns, max_frames)
 
     # ------------ IO methods -------------
 
@@ -89,84 +273,289 @@ class FrameMap(dict):
         # uses old name if new_name given is None
         new_names = [self.names[i] if not new_names[i] else new_names[i] for i in range(len(self.names))]
 
-        for name, frame in zip(new_names, self.frames):
+        for old_name, name, frame in zip(self.names, new_names, super().get('frames')):
             if name in self.names:
                 del self[name]
 
             self[name] = frame
 
+            if self.memory_budget is not None:
+                self.memory_budget.rename(old_name, name)
+
         self.names = new_names
 
-    def to_csv(self, names=None) -> None:
+    def _batches_(self, workers: int = None):
+        """
+        Yields the dataframes in lists: all of them at once or, under a memory budget, only as many
+        as there are workers, so that no more dataframes than that are read at once
+        """
+        frames = self.frames
+
+        if self.memory_budget is None:
+            yield list(frames)
+            return
+
+        size = dexter.parallel._resolve_workers_(dexter.parallel.options['workers'] if workers is None else workers)
+
+        for start in range(0, len(frames), size):
+            yield [frames[i] for i in range(start, min(start + size, len(frames)))]
+
+    def _write_(self, writer, extension: str, names: List[str] = None, filepath: str = '.', workers: int = None,
+                executor: str = None, **kwargs) -> None:
+        """
+        Writes each dataframe to filepath/name + extension with the writer (a DataFrame method name
+        or a function receiving the dataframe, the path and kwargs), atomically and over the worker pool
+        """
+        if not names:
+            names = self.names
+
+        paths = iter([os.path.join(filepath, str(name) + extension) for name in names])
+
+        for batch in self._batches_(workers):
+            dexter.writers._write_frames_(writer, batch, [next(paths) for _ in batch], workers, executor, **kwargs)
+
+    def to_csv(self, names=None, filepath: str = '.', compression: str = None, workers: int = None,
+               executor: str = None, chunksize: int = None, max_bytes: int = None,
+               progress=False, **kwargs) -> None:
         """
         Receives a FrameMap
         Generates a csv file for each of the dataframes with its name.
+        Each file is written to a temporary file first and renamed when complete, so an interrupted
+        write never leaves a partial file behind.
+
+        With chunksize (or max_bytes) the dataframes are written in batches of rows, so that only the text
+        of a single batch is held in memory instead of that of the whole dataframe, and compressed as they
+        are written.
 
         Parameters
         ----------
         names : list[str], default None
+        filepath : str, default '.'
+            the folder the files are written to, created if needed
+        compression : {'gzip', 'bz2', 'xz', 'zstd', 'zip'}, default None
+            the compression of the files, whose extension is added to their names (e.g. df1.csv.gz)
+        workers : int, default None
+            number of files written concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread')
+        chunksize : int, default None
+            the number of rows written at a time, 100_000 if only max_bytes is given,
+            in that case compression must be one of 'gzip', 'bz2', 'xz' or 'zstd'
+        max_bytes : int, default None
+            splits each file into parts (df1.part-00000.csv, df1.part-00001.csv, ...) of about max_bytes
+            bytes on disk, each with the header. The limit is approximate: a part is closed before a batch that
+            would likely take it past max_bytes, bz2 and xz parts may exceed it by about a compressed block
+        progress : bool or Callable, default False
+            if True, the rows written and the rows per second are printed to stderr after every batch,
+            a (picklable, for processes) function receiving them in a dict is called instead if given
+        **kwargs
+            keyword arguments passed to DataFrame.to_csv
+
+        Example
+        -------
+        >>> dataframes.to_csv(filepath='./export', compression='gzip', chunksize=1_000_000,
+        ...                   max_bytes=2 ** 30, progress=True, workers=4)
+        _______
         """
-        if not names:
-            names = self.names
+        extension = '.csv' + dexter.writers._compression_extension_(compression)
 
-        for frame, name in zip(self.frames, names):
-            frame.to_csv(name + '.csv')
+        if chunksize is None and max_bytes is None:
+            self._write_('to_csv', extension, names, filepath, workers, executor, compression=compression,
+                         **kwargs)
+        else:
+            self._write_(dexter.writers._write_csv_batches_, extension, names, filepath, workers, executor,
+                         chunksize=chunksize or 100_000, compression=compression, max_bytes=max_bytes,
+                         progress=progress, **kwargs)
 
-    def to_excel(self, names=None) -> None:
+    def to_excel(self, names=None, filepath: str = '.', workers: int = None, executor: str = None,
+                 **kwargs) -> None:
         """
         Receives a FrameMap
         Generates a xlsx file for each of the dataframes with its name.
+        Each file is written to a temporary file first and renamed when complete.
 
         Parameters
         ----------
         names : list[str], default None
+        filepath : str, default '.'
+            the folder the files are written to, created if needed
+        workers : int, default None
+            number of files written concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread'),
+            excel writers hold the GIL so only 'process' writes in parallel
+        **kwargs
+            keyword arguments passed to DataFrame.to_excel
         """
-        if not names:
-            names = self.names
+        self._write_(dexter.writers._to_excel_, '.xlsx', names, filepath, workers, executor, **kwargs)
 
-        for frame, name in zip(self.frames, names):
-            frame.to_excel(name + '.xlsx')
+    def to_pickle(self, names=None, filepath: str = '.', compression: str = None, workers: int = None,
+                  executor: str = None, **kwargs) -> None:
+        """
+        Receives a FrameMap
+        Generates a pickle file for each of the dataframes with its name.
+        Each file is written to a temporary file first and renamed when complete.
+
+        Parameters
+        ----------
+        names : list[str], default None
+        filepath : str, default '.'
+            the folder the files are written to, created if needed
+        compression : {'gzip', 'bz2', 'xz', 'zstd', 'zip'}, default None
+            the compression of the files, whose extension is added to their names (e.g. df1.pkl.zst)
+        workers : int, default None
+            number of files written concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread')
+        **kwargs
+            keyword arguments passed to DataFrame.to_pickle
+        """
+        extension = '.pkl' + dexter.writers._compression_extension_(compression)
+        self._write_('to_pickle', extension, names, filepath, workers, executor, compression=compression, **kwargs)
 
-    def to_pickle(self, names=None) -> None:
+    def to_parquet(self, names=None, filepath: str = '.', compression: str = 'snappy', workers: int = None,
+                   executor: str = None, **kwargs) -> None:
         """
         Receives a FrameMap
-        Generates a xlsx file for each of the dataframes with its name.
+        Generates a parquet file for each of the dataframes with its name.
+        Each file is written to a temporary file first and renamed when complete.
 
         Parameters
         ----------
         names : list[str], default None
+        filepath : str, default '.'
+            the folder the files are written to, created if needed
+        compression : {'snappy', 'gzip', 'brotli', 'lz4', 'zstd'}, default 'snappy'
+            the compression codec of the column chunks, None for none
+        workers : int, default None
+            number of files written concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread'),
+            pyarrow releases the GIL while encoding
+        **kwargs
+            keyword arguments passed to DataFrame.to_parquet
         """
-        if not names:
-            names = self.names
+        self._write_('to_parquet', '.parquet', names, filepath, workers, executor, compression=compression, **kwargs)
 
-        for frame, name in zip(self.frames, names):
-            frame.to_pickle(name + '.pkl')
+    def to_feather(self, names=None, compression: str = 'uncompressed', filepath: str = '.', workers: int = None,
+                   executor: str = None) -> None:
+        """
+        Receives a FrameMap
+        Generates a feather (Arrow IPC) file for each of the dataframes with its name.
+        Uncompressed files are memory mapped by readm_feather, which then reads them without decoding.
+        Each file is written to a temporary file first and renamed when complete.
+
+        Parameters
+        ----------
+        names : list[str], default None
+        compression : {'uncompressed', 'lz4', 'zstd'}, default 'uncompressed'
+        filepath : str, default '.'
+            the folder the files are written to, created if needed
+        workers : int, default None
+            number of files written concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread'),
+            pyarrow releases the GIL while encoding
+        """
+        self._write_(dexter.arrow._write_feather_, '.feather', names, filepath, workers, executor,
+                     compression=compression)
 
-    def to_parquet(self, names=None) -> None:
+    def to_bundle(self, filepath: str, names=None, compression: str = 'uncompressed') -> None:
         """
         Receives a FrameMap
-        Generates a parquet file for each of the dataframes with its name.
+        Generates a single bundle file with all of the dataframes: a zip container with an Arrow IPC
+        member for each dataframe (pickle for those Arrow can not hold) and a manifest of their names,
+        rows and columns. The bundle is read back with readm_bundle, which memory maps it.
+        It is written to a temporary file first and renamed when complete.
 
         Parameters
         ----------
+        filepath : str
+            the path of the bundle, e.g. 'dataframes.dxb'
         names : list[str], default None
+        compression : {'uncompressed', 'lz4', 'zstd'}, default 'uncompressed'
+            the compression of the Arrow members, uncompressed members are read without decoding
+
+        Example
+        -------
+        >>> dataframes.to_bundle('./export/dataframes.dxb')
+        >>> dataframes = readm_bundle('./export/dataframes.dxb')
+        _______
         """
         if not names:
             names = self.names
 
-        for frame, name in zip(self.frames, names):
-            frame.to_parquet(name + '.parquet')
+        dexter.bundle._write_bundle_(filepath, self.frames, names, compression)
+
+    def refresh(self, append: bool = False) -> dict:
+        """
+        Updates a FrameMap returned by a readm_* function with the changes in its folder.
+        Frames are added for new files, read again for modified files and dropped for deleted files,
+        unchanged files are not read again. Only the frames read again are optimized, if the
+        FrameMap was read with optimize=True.
+
+        Parameters
+        ----------
+        append : bool, default False
+            if True, csv files that grew are treated as append only: only the bytes past their
+            previous size are read and appended to their frame
+
+        Returns
+        -------
+        dict
+            the names of the frames 'added', 'modified', 'appended' and 'removed'
+        """
+        import dexter.readmultiple
+
+        return dexter.readmultiple._refresh_(self, append)
 
-    def optimize(self) -> 'FrameMap':
+    def optimize(self, inplace: bool = False, report: bool = False, category_threshold: float = 0.5,
+                 nullable: bool = False, unsigned: bool = False, bools: bool = False, strings: str = None):
         """
         Receives a FrameMap
         Returns a FrameMap with all dataframes column types converted to the smallest possible type
+        The original dataframes are left untouched unless inplace is True.
+
+        Parameters
+        ----------
+        inplace : bool, default False
+            optimize the dataframes in place and return None
+        report : bool, default False
+            also return a FrameMap with the bytes saved on each column of each dataframe
+        category_threshold : float, default 0.5
+            text columns whose ratio of unique values to rows is below it become categories
+        nullable : bool, default False
+            if True, float columns holding only integers and missing values may become nullable integers
+        unsigned : bool, default False
+            if True, non negative integer columns may become unsigned integers
+        bools : bool, default False
+            if True, numeric columns holding only 0 and 1 become booleans
+        strings : str, default None
+            the type for text columns that do not become categories, such as 'string[pyarrow]'
 
         Returns
         -------
-        FrameMap
+        FrameMap or None
+            or a tuple with it and the FrameMap of reports if report is True
         """
-        return FrameMap([dexter.optimizer.optimize(df) for df in self.frames], self.names)
+        results = [
+            dexter.optimizer.optimize(df, inplace=inplace, report=report, category_threshold=category_threshold,
+                                      nullable=nullable, unsigned=unsigned, bools=bools, strings=strings)
+            for df in self.frames
+        ]
+        reports = FrameMap([result[1] for result in results], self.names) if report else None
+
+        if report:
+            results = [result[0] for result in results]
+
+        out = None if inplace else FrameMap(results, self.names)
+
+        return (out, reports) if report else out
 
     @property
     def T(self) -> 'FrameMap':
@@ -175,6 +564,125 @@ class FrameMap(dict):
         """
         return FrameMap([df.T for df in self.frames], self.names)
 
+    def apply(self, func, *args, workers: int = None, executor: str = None, **kwargs) -> 'FrameMap':
+        """
+        Applies a function (or a DataFrame method, by its name) to every dataframe in the FrameMap,
+        over a pool of threads or processes. With processes, each dataframe is shipped to the workers
+        through shared memory as an Arrow stream instead of being pickled (pickle is the fallback for
+        dataframes Arrow can not represent), so only the results are pickled back.
+
+        Parameters
+        ----------
+        func : str or Callable
+            the name of a DataFrame method, or a function receiving a dataframe (module level, to be picklable
+            by the process pool), args and kwargs
+        *args
+            positional arguments passed to func
+        workers : int, default None
+            number of dataframes processed concurrently, -1 for one per cpu,
+            None uses the default set by dexter.parallel.set_workers (serial unless changed)
+        executor : {'thread', 'process'} or concurrent.futures.Executor, default None
+            the kind of worker pool, None uses the default set by dexter.parallel.set_workers ('thread')
+        **kwargs
+            keyword arguments passed to func
+
+        Returns
+        -------
+        FrameMap
+            FrameMap with the result of func for each dataframe
+
+        Example
+        -------
+        >>> dataframes.apply('corr', method='kendall', workers=-1, executor='process')
+        _______
+        """
+        results = []
+
+        for batch in self._batches_(workers):
+            results += dexter.parallel._apply_(func, batch, args, kwargs, workers, executor)
+
+        return FrameMap(results, self.names)
+
+    def concat(self, key: str = None, ignore_index: bool = True) -> pd.DataFrame:
+        """
+        Receives a FrameMap
+        Returns a single dataframe with the rows of every dataframe, one after the other.
+
+        Unlike pd.concat, the types of the result are planned before anything is copied: numeric
+        columns get the smallest type that holds the values of every dataframe (int8 and int16 make int16,
+        Int8 and Int16 make Int16), categoricals keep being categoricals with the union of the categories,
+        and every column of the result is allocated once and filled in place.
+
+        Parameters
+        ----------
+        key : str, default None
+            the name of a categorical column, added first, with the name of the dataframe of each row
+        ignore_index : bool, default True
+            if True, the result has a new RangeIndex, otherwise the indexes of the dataframes one after the other
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Example
+        -------
+        >>> daily = readm_csv('./2026/', optimize=True)
+        >>> year = daily.concat(key='day')
+        _______
+        """
+        return dexter.union._union_frames_(self.frames, self.names, key, ignore_index)
+
+    def sql(self, query: str, params=None) -> pd.DataFrame:
+        """
+        Receives a FrameMap
+        Returns the result of a SQL query in which every dataframe is a table named after it, run by
+        an embedded DuckDB database (vectorized and multi-threaded, needs pip install duckdb).
+
+        Dataframes in memory are scanned in place, without being copied. Files of a FrameMap returned
+        by readm_parquet or readm_csv (lazy=True) that were not read yet are scanned by DuckDB directly,
+        reading only the columns and row groups the query needs, and are not loaded into the FrameMap.
+
+        Parameters
+        ----------
+        query : str
+            the query, names that are not plain identifiers are double quoted (e.g. "sub/orders")
+        params : list or dict, default None
+            the values of the ? (or $name) parameters of the query
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Example
+        -------
+        >>> dataframes = readm_parquet('./sales/', lazy=True)
+        >>> dataframes.names
+        ['customers.parquet', 'orders.parquet']
+        >>> dataframes.sql('select c.region, sum(o.total) from "orders.parquet" o '
+        ...                'join "customers.parquet" c using (customer_id) group by 1')
+        _______
+        """
+        return dexter.sql._sql_(self, query, params)
+
+    def _stat_(self, func: str, column: str = None, approx: bool = False, **kwargs) -> 'FrameMap':
+        """
+        Applies a DataFrame method to every dataframe, the arguments left as None are not passed so that
+        the defaults of the installed pandas version are used
+        If approx, the method of the FrameSketch of each dataframe is used instead and kwargs are ignored.
+
+        Returns a FrameMap with the results, series being turned into a single column table named column
+        """
+        if approx:
+            results = self.apply(dexter.approximate._approx_, func)
+        else:
+            results = self.apply(func, **{key: value for key, value in kwargs.items() if value is not None})
+
+        if column is None:
+            return results
+
+        return FrameMap([pd.DataFrame(result, columns=[column]) if isinstance(result, pd.Series) else result
+                         for result in results.frames], self.names)
+
     # ------------ Statistical Methods -------------
 
     def dtypes(self) -> 'FrameMap':
@@ -227,18 +735,79 @@ class FrameMap(dict):
 
             return FrameMap(missing_values_df_list, self.names)
 
-    def describe(self) -> 'FrameMap':
+    def describe(self, approx: bool = False) -> 'FrameMap':
         """
         Receives a FrameMap.
         Returns a list of dataframes with each showing the types of each column of each original
         dataframe.
 
+        Parameters
+        ----------
+        approx : bool, default False
+            if True, the number of unique values, the most frequent value and its frequency and the quartiles
+            are estimated with sketches (see dexter.approximate.FrameSketch for their errors) instead of hashing
+            and sorting every column
+
         Returns
         -------
         FrameMap
         """
 
-        return FrameMap([df.describe(include='all') for df in self.frames], self.names)
+        return self._stat_('describe', approx=approx, include='all')
+
+    def profile(self, workers: int = None, executor: str = None) -> 'FrameMap':
+        """
+        Receives a FrameMap.
+        Returns a table for each dataframe with the type, missing values, unique values, most frequent value,
+        min, max, mean, standard deviation and memory usage of each column, all computed in a single pass
+        over the data instead of one pass per statistic.
+
+        Parameters
+        ----------
+        workers : int, default None
+            number of dataframes profiled concurrently, None uses the default set by dexter.set_workers
+        executor : {'thread', 'process'}, default None
+            the kind of worker pool, None uses the default set by dexter.set_workers
+
+        Returns
+        -------
+        FrameMap
+        """
+        return self.apply(dexter.profiling.profile, workers=workers, executor=executor)
+
+    def catalog(self, workers: int = None, executor: str = None) -> 'dexter.catalog.ColumnCatalog':
+        """
+        Receives a FrameMap.
+        Returns the ColumnCatalog of its dataframes: the type, rows, missing values and (estimated) distinct
+        values of every column, and which columns share values with a given one, e.g. join keys.
+
+        The catalog is built on the first call and kept: later calls only read the dataframes that were added
+        or replaced since, and dataframes renamed with rename_frames keep their entries. Lazy frames are read
+        when they are first indexed.
+
+        Parameters
+        ----------
+        workers : int, default None
+            number of dataframes indexed concurrently, None uses the default set by dexter.set_workers
+        executor : {'thread', 'process'}, default None
+            the kind of worker pool, None uses the default set by dexter.set_workers
+
+        Returns
+        -------
+        ColumnCatalog
+
+        Example
+        -------
+        >>> catalog = dataframes.catalog()
+        >>> catalog.columns()
+        >>> catalog.overlaps('orders', 'customer_id')
+        _______
+        """
+        if self.__dict__.get('_catalog') is None:
+            # FrameMap.__setattr__ would store it as a dataframe
+            object.__setattr__(self, '_catalog', dexter.catalog.ColumnCatalog())
+
+        return self.__dict__['_catalog']._sync_(self, workers, executor)
 
     def head(self, n: int = 5) -> 'FrameMap':
         """
@@ -283,11 +852,10 @@ class FrameMap(dict):
         tables = []
 
         # appends dataframes out of total and each column's memory usage for each df in self
-        for df, name in zip(self.frames, self.names):
-            memory = df.memory_usage(deep=True)
+        for memory, name in zip(self._stat_('memory_usage', deep=True).frames, self.names):
             total = pd.Series(memory.sum(), index=[name])
 
-            tables.append(pd.DataFrame(total.append(memory), columns=['Memory']))
+            tables.append(pd.DataFrame(pd.concat([total, memory]), columns=['Memory']))
 
         return FrameMap(tables, self.names)
 
@@ -295,6 +863,7 @@ class FrameMap(dict):
         """
         Receives a FrameMap.
         Returns a table which contains the shapes of each df.
+        Lazy frames whose metadata has the number of rows (parquet) are not read.
 
         Returns
         -------
@@ -302,25 +871,61 @@ class FrameMap(dict):
         """
 
         # getting the shapes and names of each dataframe in self
-        shapes_list = [df.shape for df in self.frames]
+        shapes_list = []
+
+        for df in super().get('frames'):
+            if isinstance(df, LazyFrame):
+                metadata = df.metadata()
+                df = (metadata['rows'], metadata['columns']) if metadata['rows'] is not None else self._load_(df)
+
+            shapes_list.append(df.shape if isinstance(df, pd.DataFrame) else df)
+
         names_list = list(self.names)
 
         shapes_df = pd.DataFrame(shapes_list, columns=['rows', 'columns'], index=names_list)
 
         return FrameMap([shapes_df], self.names)
 
-    def nunique(self) -> 'FrameMap':
+    def metadata(self) -> 'FrameMap':
+        """
+        Receives a FrameMap.
+        Returns a table with the path, size in bytes, rows, columns and whether each df was loaded.
+        Lazy frames are not read, only the metadata that is cheap to get is shown.
+
+        Returns
+        -------
+        FrameMap
+        """
+        rows = []
+
+        for df in super().get('frames'):
+            if isinstance(df, LazyFrame):
+                metadata = df.metadata()
+                rows.append([metadata['path'], metadata['bytes'], metadata['rows'], metadata['columns'], False])
+            else:
+                rows.append([None, df.memory_usage(deep=True).sum(), df.shape[0], df.shape[1], True])
+
+        metadata_df = pd.DataFrame(rows, columns=['path', 'bytes', 'rows', 'columns', 'loaded'], index=list(self.names))
+
+        return FrameMap([metadata_df], self.names)
+
+    def nunique(self, approx: bool = False) -> 'FrameMap':
         """
         Receives a FrameMap.
         Returns a table which contains the number of non-null values of each column
 
+        Parameters
+        ----------
+        approx : bool, default False
+            if True, the counts are estimated with HyperLogLog sketches, with a relative error of about 0.8%
+
         Returns
         -------
         FrameMap
         """
 
         # getting the count of nunique values for each dataframe in self
-        return FrameMap([pd.DataFrame(df.nunique(), columns=['non-null']) for df in self.frames], self.names)
+        return self._stat_('nunique', 'non-null', approx=approx)
 
     def std(self, axis: int = None, skipna: bool = True, level: int = None, ddof: int = 1, numeric_only: bool = None) -> 'FrameMap':
         """
@@ -345,10 +950,7 @@ class FrameMap(dict):
         FrameMap
             FrameMap with each standard deviation of dataframes.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.std(axis, skipna, level, ddof, numeric_only), columns=['std']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('std', 'std', axis=axis, skipna=skipna, level=level, ddof=ddof, numeric_only=numeric_only)
 
     def mean(self, axis: int = None, skipna: bool = True, level: int = None, numeric_only: bool = None) -> 'FrameMap':
         """
@@ -371,12 +973,10 @@ class FrameMap(dict):
         FrameMap
             FrameMap with the means of each dataframe.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.mean(axis, skipna, level, numeric_only), columns=['mean']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('mean', 'mean', axis=axis, skipna=skipna, level=level, numeric_only=numeric_only)
 
-    def median(self, axis: int = None, skipna: bool = True, level: int = None, numeric_only: bool = None) -> 'FrameMap':
+    def median(self, axis: int = None, skipna: bool = True, level: int = None, numeric_only: bool = None,
+               approx: bool = False) -> 'FrameMap':
         """
         Returns the median for each dataframe in a framemap.
 
@@ -391,18 +991,19 @@ class FrameMap(dict):
         numeric_only : bool, default None
              Include only float, int, boolean columns. If None, will attempt to use everything, then use only numeric
              data.
+        approx : bool, default False
+            if True, the medians of the numeric columns are estimated with KLL sketches, with an error of about
+            1.3% of the rank, and the other arguments are ignored
 
         Returns
         -------
         FrameMap
             FrameMap with the medians of each dataframe.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.median(axis, skipna, level, numeric_only), columns=['median']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('median', 'median', approx=approx, axis=axis, skipna=skipna, level=level,
+                           numeric_only=numeric_only)
 
-    def mode(self, axis: int = 0, numeric_only: bool = None, dropna: bool = True):
+    def mode(self, axis: int = 0, numeric_only: bool = None, dropna: bool = True, approx: bool = False):
         """
         Returns the mode for each dataframe in a framemap.
 
@@ -415,16 +1016,16 @@ class FrameMap(dict):
              data.
         dropna : bool, default True
                 Don’t consider counts of NaN/NaT.
+        approx : bool, default False
+            if True, the most frequent value of each column is found with SpaceSaving sketches, which are
+            exact for values more frequent than 1/1024 of the rows, and the other arguments are ignored
 
         Returns
         -------
         FrameMap
             FrameMap with the modes of each dataframes.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.mode(axis, numeric_only, dropna), columns=['mode']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('mode', approx=approx, axis=axis, numeric_only=numeric_only, dropna=dropna)
 
     def min(self, axis: int = None, skipna: bool = True, level: int = None, numeric_only: bool = None) -> 'FrameMap':
         """
@@ -447,10 +1048,7 @@ class FrameMap(dict):
         FrameMap
             FrameMap with the min values of each dataframes.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.min(axis, skipna, level, numeric_only), columns=['min']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('min', 'min', axis=axis, skipna=skipna, level=level, numeric_only=numeric_only)
 
     def max(self, axis: int = None, skipna: bool = True, level: int = None, numeric_only: bool = None) -> 'FrameMap':
         """
@@ -473,10 +1071,7 @@ class FrameMap(dict):
         FrameMap
             FrameMap with the min values of each dataframes.
         """
-        return FrameMap(
-            [pd.DataFrame(frame.max(axis, skipna, level, numeric_only), columns=['max']) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('max', 'max', axis=axis, skipna=skipna, level=level, numeric_only=numeric_only)
 
     def corr(self, method: str = 'pearson', min_periods: int = 1) -> 'FrameMap':
         """
@@ -494,10 +1089,7 @@ class FrameMap(dict):
         FrameMap
             FrameMap of correlation matrices for dataframes.
         """
-        return FrameMap(
-            [frame.corr(method, min_periods) for frame in self.frames],
-            self.names
-        )
+        return self._stat_('corr', method=method, min_periods=min_periods)
 
     # ------------ Reindexing Methods -------------
 
@@ -531,9 +1123,32 @@ class FrameMap(dict):
 
         if inplace:
             for frame in self.frames:
-                frame.reset_index(level, drop, inplace, col_level, col_fill)
+                frame.reset_index(level=level, drop=drop, inplace=True, col_level=col_level, col_fill=col_fill)
 
         else:
-            out = FrameMap([frame.reset_index(level, drop, inplace, col_level, col_fill) for frame in self.frames])
+            # keywords, as newer pandas versions do not take these arguments by position
+            out = FrameMap([frame.reset_index(level=level, drop=drop, col_level=col_level, col_fill=col_fill)
+                            for frame in self.frames], self.names)
 
         return out
+
+
+class _BudgetedFrames:
+    """
+    The dataframes of a FrameMap under a memory budget, each one read (and the least recently used
+    ones spilled) only when it is reached, so that iterating over them does not need them all in memory
+    Also used to render a page of dataframes without reading the others.
+    """
+
+    def __init__(self, framemap: FrameMap):
+        self.framemap = framemap
+
+    def __len__(self) -> int:
+        return len(self.framemap.names)
+
+    def __getitem__(self, i: int) -> pd.DataFrame:
+        return self.framemap._frame_at_(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.framemap._frame_at_(i)
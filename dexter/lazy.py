@@ -0,0 +1,122 @@
+"""
+LazyFrame
+---------
+A placeholder for a dataframe that is only read from disk when first accessed.
+
+"""
+import os
+from typing import Callable
+import pandas as pd
+
+
+class LazyFrame:
+    """
+    A dataframe that has not been read yet.
+
+    Holds the path of the file and the function that reads it, the file is only read
+    when load is called. Cheap metadata (file size, column names and, for parquet, the
+    number of rows and the schema) is available without reading the body of the file.
+
+    Parameters
+    ----------
+    path : str
+        the path of the file
+    loader : Callable
+        a function that receives the path and returns the dataframe
+
+    Example
+    -------
+    >>> frame = LazyFrame('./folder/df1.csv', pd.read_csv)
+    >>> frame.metadata()['columns']
+    3
+    >>> df1 = frame.load()
+    _______
+    """
+
+    def __init__(self, path: str, loader: Callable):
+        self.path = path
+        self.loader = loader
+        self._metadata = None
+
+    def __repr__(self) -> str:
+        return f'LazyFrame({self.path!r})'
+
+    def load(self) -> pd.DataFrame:
+        """
+        Reads the file
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return self.loader(self.path)
+
+    def metadata(self) -> dict:
+        """
+        Returns the metadata of the file that can be known without reading its body:
+        path, bytes, rows, columns and schema (a dictionary of column name to type).
+        Unknown values are None.
+
+        Returns
+        -------
+        dict
+        """
+        if self._metadata is None:
+            self._metadata = {'path': self.path, 'bytes': os.path.getsize(self.path), 'rows': None, 'columns': None,
+                              'schema': None}
+            self._metadata.update(_file_metadata_(self.path))
+
+        return self._metadata
+
+
+def _file_metadata_(path: str) -> dict:
+    """
+    Reads the metadata of a file according to its extension
+
+    Returns a dictionary with the metadata that could be read
+    """
+    extension = os.path.splitext(path)[-1]
+
+    if extension == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return {}
+
+        # the footer of a parquet file has both the row count and the schema
+        parquet_metadata = pq.read_metadata(path)
+        schema = parquet_metadata.schema.to_arrow_schema()
+
+        return {
+            'rows': parquet_metadata.num_rows,
+            'columns': len(schema.names),
+            'schema': {name: str(dtype) for name, dtype in zip(schema.names, schema.types)},
+        }
+
+    if extension in ('.feather', '.arrow'):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return {}
+
+        # with the file memory mapped, the row counts of the batches are read without reading the data
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+        return {
+            'rows': rows,
+            'columns': len(reader.schema.names),
+            'schema': {name: str(dtype) for name, dtype in zip(reader.schema.names, reader.schema.types)},
+        }
+
+    if extension == '.csv':
+        # reading zero rows parses only the header
+        try:
+            header = pd.read_csv(path, nrows=0).columns
+        except pd.errors.EmptyDataError:
+            header = []
+
+        return {'columns': len(header), 'schema': {name: None for name in header}}
+
+    return {}
@@ -1,42 +1,610 @@
+import io
+import os
+import warnings
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import Iterable, List, Optional, Tuple, Union
+from dexter.sketches import HyperLogLog
+from dexter.union import _codes_dtype_
 
 
-def optimize(df: pd.DataFrame, datetime_features: List[str] = None) -> pd.DataFrame:
+def optimize(df: pd.DataFrame, datetime_features: List[str] = None, inplace: bool = False, report: bool = False,
+             category_threshold: float = 0.5, nullable: bool = False, unsigned: bool = False, bools: bool = False,
+             strings: str = None) -> Union[pd.DataFrame, None, Tuple[Optional[pd.DataFrame], pd.DataFrame]]:
     """
     Receives a dataframe
     Returns a dataframe with column types converted to the smallest possible type
 
+    Integer columns of any width get the smallest integer type that holds their range, float columns
+    become float32 when their values allow it and text columns with few unique values become categories.
+    The other options extend these types with pandas nullable integers, booleans, unsigned integers
+    and dedicated string types.
+
+    The ranges of the numeric columns are computed for whole blocks of columns at once and the
+    target types are chosen from them in bulk. Only the columns whose type changes are converted.
+
+    Unless inplace, the given dataframe is not modified: the new dataframe is built once out of the
+    converted columns and shares the unchanged ones with the original. If inplace, the converted
+    columns replace the original ones and nothing else is copied.
+
     Parameters
     ----------
     df : pd.DataFrame
         the pandas dataframe to be optimized
     datetime_features : List[str] default None
         list of features that can be converted to datetime
+    inplace : bool, default False
+        if True, converts the columns of df itself and returns None
+    report : bool, default False
+        if True, also returns a dataframe with the memory usage in bytes of each column before and
+        after the optimization and the bytes saved
+    category_threshold : float, default 0.5
+        text columns whose ratio of unique values to rows is below it become categories
+    nullable : bool, default False
+        if True, float columns holding only integers and missing values become pandas nullable
+        integers (Int8..Int64) when it saves memory and text columns of True/False become boolean
+    unsigned : bool, default False
+        if True, non negative integer columns may become unsigned integers (uint8..uint32)
+    bools : bool, default False
+        if True, numeric columns holding only 0 and 1 become bool (or boolean if they have missing values)
+    strings : str, default None
+        the type for text columns that do not become categories, such as 'string[pyarrow]'
 
     Returns
     -------
-    pd.DataFrame
+    pd.DataFrame or None
+        or a tuple with it and the report if report is True
     """
     # avoiding mutable default variables
     datetime_features = datetime_features or []
 
-    # converting float64 columns to the smallest possible precision
-    floats = df.select_dtypes(include=['float64']).columns.tolist()
-    df[floats] = df[floats].apply(pd.to_numeric, downcast='float')
+    if not df.columns.is_unique:
+        return _optimize_by_position_(df, datetime_features, inplace, report, category_threshold, nullable,
+                                      unsigned, bools, strings)
 
-    # converting int64 columns to the smallest possible precision
-    ints = df.select_dtypes(include=['int64']).columns.tolist()
-    df[ints] = df[ints].apply(pd.to_numeric, downcast='integer')
+    numpy_columns = [col for col, dtype in df.dtypes.items() if isinstance(dtype, np.dtype)]
 
-    # converting objects to categories or datetime objects
+    # converting float columns to the smallest possible precision
+    floats = df.select_dtypes(include=['floating']).columns.intersection(numpy_columns)
+    dtypes = _float_dtypes_(df, floats, nullable, unsigned, bools)
+
+    # converting integer columns to the smallest possible precision
+    ints = df.select_dtypes(include=['integer']).columns
+    dtypes.update(_int_dtypes_(df, ints.intersection(numpy_columns), unsigned, bools))
+    dtypes.update(_nullable_int_dtypes_(df, ints.difference(numpy_columns), unsigned, bools))
+
+    # converting objects to categories, datetime objects or the other text types
     for col in df.select_dtypes(include=['object']):
-        if col not in datetime_features:
-            num_unique_values = len(df[col].unique())
-            num_total_values = len(df[col])
-            if float(num_unique_values) / num_total_values < 0.5:
-                df[col] = df[col].astype('category')
+        if col in datetime_features:
+            dtypes[col] = 'datetime'
+        elif _is_low_cardinality_(df[col], category_threshold):
+            dtypes[col] = 'category'
+        elif nullable and pd.api.types.infer_dtype(df[col], skipna=True) == 'boolean':
+            dtypes[col] = 'boolean'
+        elif strings is not None and df[col].dtype != strings \
+                and pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            dtypes[col] = strings
+
+    before = df.memory_usage(deep=True) if report else None
+    converted = {col: _convert_(df[col], dtype) for col, dtype in dtypes.items()}
+
+    if inplace:
+        for col, values in converted.items():
+            df[col] = values
+        out = None
+
+    else:
+        # a single construction out of the columns, the unchanged ones are not copied
+        out = pd.DataFrame({col: converted.get(col, df[col]) for col in df.columns}, index=df.index, copy=False)
+
+    if not report:
+        return out
+
+    after = (df if inplace else out).memory_usage(deep=True)
+
+    return out, pd.DataFrame({'before': before, 'after': after, 'saved': before - after})
+
+
+def _optimize_by_position_(df: pd.DataFrame, datetime_features: List[str], inplace: bool, report: bool,
+                           *args) -> Union[pd.DataFrame, None, Tuple[Optional[pd.DataFrame], pd.DataFrame]]:
+    """
+    Optimizes a dataframe whose column labels are not unique, as labels can not pick its columns out:
+    the columns are optimized under their positions and get their labels back
+
+    Returns the same as optimize
+    """
+    positions = df.set_axis(pd.RangeIndex(df.shape[1]), axis=1)
+    features = [i for i, col in enumerate(df.columns) if col in datetime_features]
+    out = optimize(positions, features, False, report, *args)
+    out, changes = out if report else (out, None)
+
+    if changes is not None:
+        # the first row of the report is the index
+        changes.index = [label if isinstance(label, str) else df.columns[label] for label in changes.index]
+
+    if inplace:
+        for i in range(df.shape[1]):
+            if out.dtypes.iloc[i] != df.dtypes.iloc[i]:
+                df.isetitem(i, out.iloc[:, i])
+        out = None
+    else:
+        out = out.set_axis(df.columns, axis=1)
+
+    return (out, changes) if report else out
+
+
+def _convert_(col: pd.Series, dtype) -> pd.Series:
+    """
+    Converts a column to the type chosen by optimize
+
+    Returns the converted column
+    """
+    if isinstance(dtype, str) and dtype == 'datetime':
+        return pd.to_datetime(col)
+
+    return col.astype(dtype)
+
+
+# the columns of a block are converted to numpy together, this bounds the size of each block
+_BLOCK_COLUMNS = 256
+
+# columns with more rows than this have their cardinality estimated instead of counted
+_EXACT_NUNIQUE_ROWS = 1 << 16
+
+
+def _blocks_(df: pd.DataFrame, columns: pd.Index) -> Iterable[pd.Index]:
+    """
+    Splits columns into blocks of at most _BLOCK_COLUMNS columns of the same type
+    """
+    dtypes = df.dtypes[columns] if columns.is_unique else df[columns].dtypes
+
+    for dtype in dtypes.unique():
+        same_type = columns[(dtypes == dtype).to_numpy()]
+
+        for start in range(0, len(same_type), _BLOCK_COLUMNS):
+            yield same_type[start:start + _BLOCK_COLUMNS]
+
+
+# the integer types that can be chosen, signed first and then unsigned, by width
+_INT_LATTICE = [(np.int8, np.uint8), (np.int16, np.uint16), (np.int32, np.uint32)]
+
+
+def _smallest_int_(mins: np.ndarray, maxs: np.ndarray, unsigned: bool = False) -> np.ndarray:
+    """
+    Finds, for each column, the smallest integer type that holds the range between its min and max
+    Unsigned types are only used if unsigned is True and a signed type of the same width does not fit.
+
+    Returns an array with the numpy dtype of each column, or None if no type narrower than 64 bits fits
+    """
+    smallest = np.full(len(mins), None, dtype=object)
+    pending = np.ones(len(mins), dtype=bool)
+
+    for signed_dtype, unsigned_dtype in _INT_LATTICE:
+        for dtype in (signed_dtype, unsigned_dtype) if unsigned else (signed_dtype,):
+            info = np.iinfo(dtype)
+            fits = pending & (mins >= info.min) & (maxs <= info.max)
+            smallest[fits] = np.dtype(dtype)
+            pending &= ~fits
+
+    return smallest
+
+
+def _nullable_name_(dtype: np.dtype) -> str:
+    """
+    Returns the name of the pandas nullable integer type with the same width and sign as dtype
+    """
+    return ('UInt' if dtype.kind == 'u' else 'Int') + str(dtype.itemsize * 8)
+
+
+def _float_dtypes_(df: pd.DataFrame, columns: pd.Index, nullable: bool = False, unsigned: bool = False,
+                   bools: bool = False) -> dict:
+    """
+    Finds the float columns whose values fit in float32, with the same tolerance
+    used by pd.to_numeric(downcast='float')
+    If nullable, float columns holding only integers (and missing values) get the integer type
+    that uses the least memory, if bools the ones holding only 0 and 1 become boolean.
+
+    Returns a dictionary of column name to the new type
+    """
+    dtypes = {}
+
+    for block in _blocks_(df, columns):
+        values = df[block].to_numpy()
+        itemsize = values.dtype.itemsize
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            fits = np.isclose(values.astype(np.float32), values, rtol=0, atol=5e-4, equal_nan=True).all(axis=0)
+
+        sizes = np.where(fits, 4, itemsize)
+
+        if not (nullable or bools) or not len(values):
+            dtypes.update(dict.fromkeys(block[sizes < itemsize], 'float32'))
+            continue
+
+        missing = np.isnan(values)
+        has_missing = missing.any(axis=0)
+        integral = (missing | (np.isfinite(values) & (values == np.round(values)))).all(axis=0) & ~missing.all(axis=0)
+
+        with warnings.catch_warnings():
+            # columns with only missing values have no min nor max, they are not integral anyway
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mins, maxs = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+
+        smallest = _smallest_int_(np.where(integral, mins, np.inf), np.where(integral, maxs, np.inf), unsigned)
+
+        for i, col in enumerate(block):
+            if bools and integral[i] and mins[i] >= 0 and maxs[i] <= 1 and (nullable or not has_missing[i]):
+                dtypes[col] = 'boolean' if has_missing[i] else np.dtype(bool)
+
+            # nullable integers take one more byte per value for the mask
+            elif nullable and smallest[i] is not None and smallest[i].itemsize + has_missing[i] < sizes[i]:
+                dtypes[col] = _nullable_name_(smallest[i]) if has_missing[i] else smallest[i]
+
+            elif sizes[i] < itemsize:
+                dtypes[col] = 'float32'
+
+    return dtypes
+
+
+def _int_dtypes_(df: pd.DataFrame, columns: pd.Index, unsigned: bool = False, bools: bool = False) -> dict:
+    """
+    Finds the smallest integer type for each integer column out of its min and max
+    If bools, the columns holding only 0 and 1 become boolean.
+
+    Returns a dictionary of column name to the new type
+    """
+    dtypes = {}
+
+    if not len(df):
+        return dtypes
+
+    for block in _blocks_(df, columns):
+        values = df[block].to_numpy()
+        mins, maxs = values.min(axis=0), values.max(axis=0)
+        smallest = _smallest_int_(mins, maxs, unsigned)
+
+        for i, col in enumerate(block):
+            if bools and mins[i] >= 0 and maxs[i] <= 1:
+                dtypes[col] = np.dtype(bool)
+            elif smallest[i] is not None and smallest[i].itemsize < values.dtype.itemsize:
+                dtypes[col] = smallest[i]
+
+    return dtypes
+
+
+def _nullable_int_dtypes_(df: pd.DataFrame, columns: pd.Index, unsigned: bool = False, bools: bool = False) -> dict:
+    """
+    Finds the smallest nullable integer type (Int8..Int64, UInt8..UInt64) for each nullable integer column
+    If bools, the columns holding only 0, 1 and missing values become boolean.
+
+    Returns a dictionary of column name to the new type
+    """
+    dtypes = {}
+
+    for col in columns:
+        mins, maxs = df[col].min(), df[col].max()
+
+        # only missing values
+        if pd.isna(mins):
+            continue
+
+        smallest = _smallest_int_(np.array([mins]), np.array([maxs]), unsigned)[0]
+
+        if bools and mins >= 0 and maxs <= 1:
+            dtypes[col] = 'boolean'
+        elif smallest is not None and smallest.itemsize < df[col].dtype.itemsize:
+            dtypes[col] = _nullable_name_(smallest)
+
+    return dtypes
+
+
+def _is_low_cardinality_(col: pd.Series, ratio: float = 0.5) -> bool:
+    """
+    Returns True if the number of unique values is less than ratio times the number of values
+
+    Short columns are counted exactly. Long object columns are fed in blocks to a HyperLogLog sketch,
+    which stops as soon as the answer is certain and is only settled by an exact count when the
+    estimate is too close to the limit.
+    """
+    total = len(col)
+
+    if not total:
+        return False
+
+    limit = ratio * total
+
+    # extension arrays (such as arrow backed strings) already count their unique values fast
+    if total <= _EXACT_NUNIQUE_ROWS or col.dtype != object:
+        return len(col.unique()) < limit
+
+    hll, block_size = HyperLogLog(), max(_EXACT_NUNIQUE_ROWS, total // 8)
+    margin = 3 * hll.error
+
+    for start in range(0, total, block_size):
+        estimate = hll.update(col.iloc[start:start + block_size]).count()
+        remaining = total - start - block_size
+
+        if estimate * (1 - margin) >= limit:
+            return False
+
+        # even if every remaining value were new the limit would not be reached
+        if estimate * (1 + margin) + max(remaining, 0) < limit:
+            return True
+
+    return len(col.unique()) < limit
+
+
+def optimize_chunks(chunks: Iterable[pd.DataFrame], datetime_features: List[str] = None) -> pd.DataFrame:
+    """
+    Receives an iterable of dataframe chunks, such as the reader returned by pd.read_csv with chunksize
+    Returns a single dataframe with column types converted to the smallest possible type
+
+    The target types are inferred from the first chunk and every chunk is converted as soon as it is read,
+    so that only compacted chunks are kept and the peak memory is about the optimized size plus one chunk.
+    When a later chunk does not fit in the inferred type (larger integers, missing values in an integer
+    column), the type is promoted. Categories are unioned across chunks.
+
+    Parameters
+    ----------
+    chunks : Iterable[pd.DataFrame]
+        the chunks to be optimized and concatenated
+    datetime_features : List[str] default None
+        list of features that can be converted to datetime
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    datetime_features = datetime_features or []
+    chunk_list, schema = [], None
+
+    for chunk in chunks:
+        if schema is None:
+            # the first chunk decides which columns become categories or datetimes
+            optimize(chunk, datetime_features, inplace=True)
+            schema = chunk.dtypes.to_dict()
         else:
-            df[col] = pd.to_datetime(df[col])
+            chunk = _convert_chunk_(chunk, schema, datetime_features)
+
+        chunk_list.append(chunk)
+
+    if not chunk_list:
+        return pd.DataFrame()
+
+    return _concat_chunks_(chunk_list, schema)
+
+
+def append_chunk(df: pd.DataFrame, chunk: pd.DataFrame, datetime_features: List[str] = None) -> pd.DataFrame:
+    """
+    Receives an optimized dataframe and a chunk of new rows
+    Returns a new dataframe with the rows of the chunk appended, converted to the types of the dataframe
+
+    Types are promoted when the chunk does not fit in them and categories are unioned, the same
+    way as in optimize_chunks. The given dataframe is not modified.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        the optimized dataframe
+    chunk : pd.DataFrame
+        the new rows, with the same columns
+    datetime_features : List[str] default None
+        list of features that can be converted to datetime
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    schema = df.dtypes.to_dict()
+    datetime_features = list(datetime_features or []) + [col for col, dtype in schema.items() if dtype.kind == 'M']
+
+    return _concat_chunks_([df, _convert_chunk_(chunk, schema, datetime_features)], schema)
+
+
+def _concat_chunks_(chunk_list: List[pd.DataFrame], schema: dict) -> pd.DataFrame:
+    """
+    Concatenates converted chunks, after giving each of them the final types of schema and the
+    union of the categories of every chunk.
+    The result is built one column at a time and chunk_list is emptied, so that each column of the chunks
+    is released once it is copied and the chunks and the result are not both held whole.
+
+    Returns the concatenated dataframe
+    """
+    categories = {}
+
+    for chunk in chunk_list:
+        for col in chunk.select_dtypes(include=['category']):
+            categories[col] = categories[col].union(chunk[col].cat.categories) if col in categories \
+                else chunk[col].cat.categories
+
+    target = {col: pd.CategoricalDtype(categories[col]) if col in categories else dtype
+              for col, dtype in schema.items()}
+
+    index = chunk_list[0].index.append([chunk.index for chunk in chunk_list[1:]])
+
+    # the chunks are held column by column from here, so that each column of theirs is released once copied
+    parts = {col: [chunk[col] for chunk in chunk_list] for col in target}
+    chunk_list.clear()
+
+    columns = {col: _concat_column_(parts.pop(col), dtype) for col, dtype in target.items()}
+
+    # copy=False keeps the arrays just filled instead of copying them into blocks
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def _concat_column_(parts: List[pd.Series], dtype):
+    """
+    Concatenates the parts of a column into an array of type dtype allocated once, categories being recoded
+    to those of dtype. The parts are removed from the list as they are copied.
+
+    Returns the array
+    """
+    total = sum(len(part) for part in parts)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = np.empty(total, dtype=_codes_dtype_(dtype.categories))
+    elif isinstance(dtype, np.dtype):
+        values = np.empty(total, dtype=dtype)
+    else:
+        # extension arrays (nullable integers, strings) are concatenated from their parts
+        values = []
+
+    start = 0
+
+    while parts:
+        part = parts.pop(0)
+        part = part if part.dtype == dtype else part.astype(dtype)
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            values[start:start + len(part)] = part.cat.codes.to_numpy()
+        elif isinstance(dtype, np.dtype):
+            values[start:start + len(part)] = part.to_numpy()
+        else:
+            values.append(part.array)
+
+        start += len(part)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(values, dtype=dtype)
+
+    if not isinstance(dtype, np.dtype):
+        return type(values[0])._concat_same_type(values)
+
+    return values
+
+
+def _convert_chunk_(chunk: pd.DataFrame, schema: dict, datetime_features: List[str]) -> pd.DataFrame:
+    """
+    Converts a chunk to the types in schema, promoting (and updating) the type in schema when
+    the values of the chunk do not fit in it
+
+    Returns the converted chunk
+    """
+    for col, dtype in schema.items():
+        if col in datetime_features:
+            chunk[col] = pd.to_datetime(chunk[col])
+
+        elif isinstance(dtype, pd.CategoricalDtype):
+            chunk[col] = chunk[col].astype('category')
+
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'iuf' and chunk[col].dtype.kind in 'iuf':
+            # the smallest type for this chunk alone, the column gets the type that fits both
+            downcast = 'integer' if chunk[col].dtype.kind in 'iu' else 'float'
+            needed = pd.to_numeric(chunk[col], downcast=downcast).dtype
+            schema[col] = np.promote_types(dtype, needed)
+            chunk[col] = chunk[col].astype(schema[col])
+
+        elif isinstance(dtype, np.dtype) and dtype.kind != 'O' and chunk[col].dtype.kind != dtype.kind:
+            # e.g. text in a column that was all missing (float) in the first chunk, object holds both
+            schema[col] = np.dtype(object)
+
+    return chunk
+
+
+def infer_csv_schema(path: str, sample_bytes: int = 65536, datetime_features: List[str] = None,
+                     usecols: List[str] = None, float32: bool = False, **kwargs) -> dict:
+    """
+    Receives the path of a csv file
+    Returns the arguments for pd.read_csv that parse the file directly into compact types
+
+    The types are inferred from samples taken from the head, the middle and the tail of the file:
+    low cardinality text columns are parsed as category and dates are parsed while reading.
+    Integer and float columns are left to pandas, since a narrow type chosen from a sample would
+    silently overflow or round values further in the file, and are downcast afterwards by optimize,
+    which checks every value. Float columns are parsed as float32 only if float32 is True.
+
+    Parameters
+    ----------
+    path : str
+        the path of the csv file
+    sample_bytes : int, default 65536
+        the amount of bytes sampled from each of the head, middle and tail of the file
+    datetime_features : List[str] default None
+        list of features to be parsed as datetime, if None they are detected in the sample
+    usecols : List[str] default None
+        the columns to be read, all of them if None
+    float32 : bool, default False
+        if True, float columns whose sampled values fit in float32 are parsed as float32, values
+        outside of the sample are then rounded to float32 without being checked
+    **kwargs
+        other arguments for pd.read_csv, such as sep
+
+    Returns
+    -------
+    dict
+        with the keys dtype, parse_dates and usecols, ready to be passed to pd.read_csv
+
+    Example
+    -------
+    >>> schema = infer_csv_schema('./folder/df1.csv')
+    >>> df1 = pd.read_csv('./folder/df1.csv', **schema)
+    _______
+    """
+    sample = _sample_csv_(path, sample_bytes, usecols=usecols, **kwargs)
+    dtype, parse_dates = {}, []
+
+    for col in sample.select_dtypes(include=['float']) if float32 else []:
+        if pd.to_numeric(sample[col], downcast='float').dtype == np.float32:
+            dtype[col] = 'float32'
+
+    for col in sample.select_dtypes(include=['object']):
+        values = sample[col].dropna()
+
+        if col in (datetime_features or []) or (datetime_features is None and _is_datetime_(values)):
+            parse_dates.append(col)
+        elif len(values) and float(len(values.unique())) / len(sample[col]) < 0.5:
+            dtype[col] = 'category'
+
+    return {'dtype': dtype, 'parse_dates': parse_dates, 'usecols': usecols}
+
+
+def _sample_csv_(path: str, sample_bytes: int, **kwargs) -> pd.DataFrame:
+    """
+    Reads about sample_bytes from the head, the middle and the tail of a csv file
+    Partial lines at the edges of each sample are dropped.
+
+    Returns a dataframe with the rows of the samples
+    """
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as file:
+        header = file.readline()
+        head = file.tell()
+        blocks = [file.read(sample_bytes)]
+
+        # the middle and tail are only sampled when they do not overlap with the head
+        for offset in (size // 2, size - sample_bytes):
+            if offset > head + sample_bytes:
+                file.seek(offset)
+                file.readline()
+                blocks.append(file.read(sample_bytes))
+
+    samples = []
+
+    for block in blocks:
+        block = block[:block.rfind(b'\n') + 1] if b'\n' in block else block
+
+        try:
+            samples.append(pd.read_csv(io.BytesIO(header + block), **kwargs))
+        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+            # a sample starting inside a quoted field can not be parsed, the others are enough
+            continue
+
+    return pd.concat(samples, ignore_index=True) if samples else pd.read_csv(path, nrows=0, **kwargs)
+
+
+def _is_datetime_(values: pd.Series) -> bool:
+    """
+    Returns True if every value of a text column can be parsed as a date
+    """
+    if not len(values):
+        return False
+
+    with warnings.catch_warnings():
+        # pandas warns when it can not infer a single format, that is fine for a check
+        warnings.simplefilter('ignore')
 
-    return df
+        try:
+            return bool(pd.to_datetime(values, errors='coerce').notna().all())
+        except (TypeError, ValueError, OverflowError):
+            return False
@@ -0,0 +1,268 @@
+"""
+Parallel
+--------
+Helpers to fan work out over a pool of threads or processes.
+
+"""
+import gc
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Tuple, Union
+from dexter.compat import _import_optional_
+
+_EXECUTORS = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+def _resolve_workers_(workers: int = None) -> int:
+    """
+    Receives the number of workers asked by the user
+    None means serial execution and -1 means one worker per cpu
+
+    Returns the number of workers to be used
+    """
+    if workers is None:
+        return 1
+
+    if workers == -1:
+        return os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError(f'workers must be a positive integer or -1, got {workers}')
+
+    return workers
+
+
+def _map_(
+        func: Callable,
+        items: Iterable,
+        workers: int = None,
+        executor: Union[str, Executor] = 'thread'
+) -> Tuple[List[Any], List[Tuple[int, BaseException]]]:
+    """
+    Applies func to each item, either serially or over a pool of workers
+
+    Failures do not abort the remaining items, they are collected instead.
+
+    Parameters
+    ----------
+    func : Callable
+        function receiving a single item, must be picklable for the process executor
+    items : Iterable
+        the items to be processed
+    workers : int, default None
+        number of workers, None runs serially and -1 uses one worker per cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of pool, or an already running executor to be reused
+
+    Returns
+    -------
+    Tuple[List[Any], List[Tuple[int, BaseException]]]
+        the results in the same order as items (None where it failed) and the
+        (index, exception) pairs of the items that failed
+    """
+    items = list(items)
+    results, errors = [None] * len(items), []
+
+    # an executor given by the user is used as is and not shut down here
+    if isinstance(executor, Executor):
+        futures = [executor.submit(func, item) for item in items]
+        return _collect_(futures, results, errors)
+
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {list(_EXECUTORS)} or an Executor, got {executor!r}")
+
+    workers = min(_resolve_workers_(workers), max(len(items), 1))
+
+    # no need to pay for a pool when there is nothing to run concurrently
+    if workers == 1:
+        for i, item in enumerate(items):
+            try:
+                results[i] = func(item)
+            except Exception as error:
+                errors.append((i, error))
+
+        return results, errors
+
+    with _EXECUTORS[executor](max_workers=workers) as pool:
+        futures = [pool.submit(func, item) for item in items]
+        return _collect_(futures, results, errors)
+
+
+def _collect_(futures, results, errors):
+    """
+    Waits for the futures in submission order, storing results and errors
+    """
+    for i, future in enumerate(futures):
+        try:
+            results[i] = future.result()
+        except Exception as error:
+            errors.append((i, error))
+
+    return results, errors
+
+
+# the pool used by FrameMap.apply (and the statistical methods) when none is given
+options = {'workers': None, 'executor': 'thread'}
+
+
+def set_workers(workers: int = None, executor: str = 'thread') -> None:
+    """
+    Sets the default worker pool of FrameMap.apply, used by every FrameMap statistical method
+
+    Parameters
+    ----------
+    workers : int, default None
+        number of frames processed concurrently, None processes them one after another and -1 uses every cpu
+    executor : {'thread', 'process'}, default 'thread'
+        the kind of worker pool, the process pool ships the frames through shared memory
+
+    Example
+    -------
+    >>> set_workers(8, 'process')
+    >>> dataframes.corr(method='kendall')
+    _______
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {list(_EXECUTORS)}, got {executor!r}")
+
+    _resolve_workers_(workers)
+    options.update(workers=workers, executor=executor)
+
+
+def _call_(func: Union[str, Callable], df, args: tuple, kwargs: dict):
+    """
+    Calls func on df, func being either the name of a DataFrame method or a function receiving df
+    """
+    if isinstance(func, str):
+        return getattr(df, func)(*args, **kwargs)
+
+    return func(df, *args, **kwargs)
+
+
+def _apply_frame_(item):
+    """
+    Receives a (func, args, kwargs, df) tuple
+
+    Returns func applied to df
+    """
+    func, args, kwargs, df = item
+
+    return _call_(func, df, args, kwargs)
+
+
+def _apply_shared_(item) -> bytes:
+    """
+    Receives a (func, args, kwargs, name) tuple, name being the shared memory block the frame was
+    written to as an Arrow IPC stream, which is read without copying it out of the block
+
+    Returns the pickled result of func applied to the frame
+    """
+    import pyarrow as pa
+    from multiprocessing import shared_memory
+
+    func, args, kwargs, name = item
+    block = shared_memory.SharedMemory(name=name)
+    error = None
+
+    try:
+        df = pa.ipc.open_stream(pa.py_buffer(block.buf)).read_all().to_pandas()
+        # the result may still point into the block, it is pickled before the block is closed
+        result = pickle.dumps(_call_(func, df, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exception:
+        # the exception (its traceback, or its attributes) may keep views of the block alive,
+        # a copy of it is raised once the block is closed
+        try:
+            error = type(exception)(*exception.args)
+        except Exception:
+            error = RuntimeError(f'{type(exception).__name__}: {exception}')
+
+    df = None
+
+    try:
+        block.close()
+    except BufferError:
+        # the remaining views are only reachable through reference cycles
+        gc.collect()
+        block.close()
+
+    if error is not None:
+        raise error
+
+    return result
+
+
+def _to_shared_(df):
+    """
+    Writes a dataframe to a new shared memory block as an Arrow IPC stream
+
+    Returns the block, or None if the dataframe can not be represented in Arrow
+    """
+    from multiprocessing import shared_memory
+
+    pa = _import_optional_('pyarrow', 'share frames with worker processes')
+
+    if not df.columns.is_unique or not all(isinstance(col, str) for col in df.columns):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    # the size of the stream is known before anything is written to the block
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+
+    block = shared_memory.SharedMemory(create=True, size=max(mock.size(), 1))
+    with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(block.buf)), table.schema) as writer:
+        writer.write_table(table)
+
+    return block
+
+
+def _apply_item_(item):
+    """
+    Applies func to a frame shipped either through shared memory (by the name of the block) or pickled
+    """
+    return _apply_shared_(item) if isinstance(item[3], str) else _apply_frame_(item)
+
+
+def _apply_(func: Union[str, Callable], frames: list, args: tuple = (), kwargs: dict = None, workers: int = None,
+            executor: Union[str, Executor] = None) -> list:
+    """
+    Applies func to every frame over the given (or the default) worker pool
+    With processes, frames are shipped through shared memory as Arrow streams instead of being pickled,
+    frames that Arrow can not represent are pickled.
+
+    Returns the list of results, raises the first error found
+    """
+    kwargs = kwargs or {}
+    workers = options['workers'] if workers is None else workers
+    executor = executor or options['executor']
+
+    if executor != 'process' or _resolve_workers_(workers) == 1:
+        results, errors = _map_(_apply_frame_, [(func, args, kwargs, df) for df in frames], workers, executor)
+    else:
+        blocks = [_to_shared_(df) for df in frames]
+
+        try:
+            items = [(func, args, kwargs, df if block is None else block.name) for block, df in zip(blocks, frames)]
+            results, errors = _map_(_apply_item_, items, workers, executor)
+        finally:
+            for block in blocks:
+                if block is not None:
+                    block.close()
+                    block.unlink()
+
+        results = [pickle.loads(result) if block is not None and result is not None else result
+                   for block, result in zip(blocks, results)]
+
+    if errors:
+        raise errors[0][1]
+
+    return results
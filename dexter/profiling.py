@@ -0,0 +1,142 @@
+"""
+Profiling
+---------
+A summary of every column of a dataframe computed in a single pass over its data.
+
+"""
+import sys
+import warnings
+import numpy as np
+import pandas as pd
+from dexter.optimizer import _blocks_
+
+PROFILE_COLUMNS = ['type', 'missing', 'nunique', 'mode', 'min', 'max', 'mean', 'std', 'memory']
+
+
+def profile(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Receives a dataframe
+    Returns a table with the type, missing values, unique values, most frequent value, min, max,
+    mean, standard deviation and memory usage in bytes of each column
+
+    Each column is hashed once, which gives its missing values, unique values and mode together.
+    The min, max, mean and standard deviation of numeric columns are computed for whole blocks of
+    columns of the same type at once, and for the other columns min and max are taken from the
+    unique values only. Mean and standard deviation are NaN for columns that are not numeric.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        the pandas dataframe to be profiled
+
+    Returns
+    -------
+    pd.DataFrame
+        one row per column of df
+
+    Example
+    -------
+    >>> profile(df)
+          type  missing  nunique  mode  min    max      mean       std  memory
+    a  float64        1        3   0.5  0.5    2.0  1.166667  0.763763      32
+    b   object        0        2     x    x      y       NaN       NaN     186
+    _______
+    """
+    n_columns = df.shape[1]
+    hashed = np.empty((n_columns, 6), dtype=object)
+    stats = np.full((n_columns, 4), np.nan, dtype=object)
+
+    for i in range(n_columns):
+        hashed[i] = _hash_column_(df.iloc[:, i])
+
+    # min and max of numeric columns come from the blocks, the rest from the unique values
+    stats[:, :2] = hashed[:, 3:5]
+    positions = pd.RangeIndex(n_columns)
+    numeric = positions[[_is_numpy_numeric_(dtype) for dtype in df.dtypes]]
+
+    for block in _blocks_(df.set_axis(positions, axis=1), numeric):
+        stats[block] = _numeric_block_(df.iloc[:, block].to_numpy())
+
+    # pandas nullable numeric types can not be turned into a single numpy block
+    for i, dtype in enumerate(df.dtypes):
+        if not _is_numpy_numeric_(dtype) and pd.api.types.is_numeric_dtype(dtype):
+            values = df.iloc[:, i].to_numpy(dtype='float64', na_value=np.nan)
+            stats[i, 2:] = _numeric_block_(values[:, None])[0, 2:]
+
+    return pd.DataFrame({
+        'type': df.dtypes.to_numpy(),
+        'missing': hashed[:, 0].astype('int64'),
+        'nunique': hashed[:, 1].astype('int64'),
+        'mode': hashed[:, 2],
+        'min': stats[:, 0],
+        'max': stats[:, 1],
+        'mean': stats[:, 2].astype('float64'),
+        'std': stats[:, 3].astype('float64'),
+        'memory': hashed[:, 5].astype('int64'),
+    }, index=df.columns)
+
+
+def _is_numpy_numeric_(dtype) -> bool:
+    """
+    Returns True for numpy boolean, integer and float types
+    """
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+
+
+def _hash_column_(series: pd.Series) -> list:
+    """
+    Hashes the values of a column once
+
+    Returns its missing values, unique values, mode, min, max and memory usage in bytes, the min and max
+    being taken from the unique values (NaN if they can not be compared)
+    """
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+    missing, counts = counts[0], counts[1:]
+
+    # equal python objects have the same size, so the deep memory usage of an object column
+    # only needs the size of each unique value, and of the missing values
+    if series.dtype == object:
+        sizes = np.fromiter(map(sys.getsizeof, uniques), dtype=np.int64, count=len(uniques))
+        memory = 8 * len(series) + int(sizes @ counts) + sum(map(sys.getsizeof, series.array[codes < 0]))
+    else:
+        memory = series.memory_usage(index=False, deep=True)
+
+    if not len(uniques):
+        return [missing, 0, np.nan, np.nan, np.nan, memory]
+
+    try:
+        low, high = uniques.min(), uniques.max()
+    except (TypeError, ValueError):
+        low, high = np.nan, np.nan
+
+    return [missing, len(uniques), uniques[counts.argmax()], low, high, memory]
+
+
+def _numeric_block_(values: np.ndarray) -> np.ndarray:
+    """
+    Receives a 2d array with the values of columns of the same numeric type
+
+    Returns a 2d array with the min, max, mean and standard deviation of each column, NaN being skipped
+    """
+    booleans = values.dtype.kind == 'b'
+    if booleans:
+        values = values.view(np.uint8)
+
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        # columns that are all NaN give NaN and a warning, which is not needed here
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        if not len(values):
+            return np.full((values.shape[1], 4), np.nan, dtype=object)
+
+        if values.dtype.kind == 'f':
+            stats = [np.nanmin(values, axis=0), np.nanmax(values, axis=0), np.nanmean(values, axis=0),
+                     np.nanstd(values, axis=0, ddof=1)]
+        else:
+            stats = [values.min(axis=0), values.max(axis=0), values.mean(axis=0), values.std(axis=0, ddof=1)]
+
+    if booleans:
+        stats[:2] = [stats[0].astype(bool), stats[1].astype(bool)]
+
+    return np.array(stats, dtype=object).T
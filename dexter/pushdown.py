@@ -0,0 +1,95 @@
+"""
+Pushdown
+--------
+Column projection and row filters applied while files are read, chunk by chunk.
+
+"""
+import operator
+from typing import List, Sequence
+import numpy as np
+import pandas as pd
+
+# the operators of the filters, the same as those of pyarrow.parquet
+_OPERATORS = {
+    '==': operator.eq,
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, values: series.isin(values),
+    'not in': lambda series, values: ~series.isin(values),
+}
+
+
+def _disjunction_(filters) -> List[List[tuple]]:
+    """
+    Receives filters in the format of pyarrow.parquet, a list of (column, op, value) tuples that must
+    all hold or a list of such lists of which one must hold
+
+    Returns the filters as a list of lists
+    """
+    if not filters:
+        return []
+
+    return [filters] if isinstance(filters[0], tuple) else filters
+
+
+def _filter_columns_(filters) -> List[str]:
+    """
+    Returns the columns the filters refer to, in order of appearance
+    """
+    columns = [column for conjunction in _disjunction_(filters) for column, _, _ in conjunction]
+
+    return list(dict.fromkeys(columns))
+
+
+def _needed_columns_(columns: Sequence[str], filters) -> List[str]:
+    """
+    Returns the columns to be read from a file: the columns asked for and those the filters refer to
+    """
+    return list(dict.fromkeys(list(columns) + _filter_columns_(filters)))
+
+
+def _filter_mask_(df: pd.DataFrame, filters) -> np.ndarray:
+    """
+    Evaluates the filters on the rows of a dataframe, comparisons with missing values being False
+
+    Returns a boolean array, True for the rows to be kept
+    """
+    mask = np.zeros(len(df), dtype=bool)
+
+    for conjunction in _disjunction_(filters):
+        kept = np.ones(len(df), dtype=bool)
+
+        for column, op, value in conjunction:
+            if op not in _OPERATORS:
+                raise ValueError(f'unknown filter operator {op!r}, must be one of {list(_OPERATORS)}')
+
+            result = _OPERATORS[op](df[column], value)
+            kept &= result.to_numpy(dtype=bool, na_value=False)
+
+        mask |= kept
+
+    return mask
+
+
+def _select_(df: pd.DataFrame, columns: Sequence[str] = None, filters=None) -> pd.DataFrame:
+    """
+    Keeps the rows of a dataframe (or chunk) that pass the filters and then the given columns
+
+    Returns the dataframe
+    """
+    # take returns new dataframes rather than views, which can be optimized in place
+    if filters:
+        df = df.take(np.flatnonzero(_filter_mask_(df, filters)))
+
+    if columns is not None and list(df.columns) != list(columns):
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise KeyError(f'columns not found: {missing}')
+
+        df = df.take(df.columns.get_indexer(list(columns)), axis=1)
+
+    return df
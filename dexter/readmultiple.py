@@ -1,18 +1,50 @@
+import importlib.util
 import numpy as np
 import pandas as pd
 import os
+import warnings
+from functools import partial
+from dexter.arrow import _check_dtype_backend_, _read_feather_
+from dexter.bundle import _read_manifest_, _read_member_
+from dexter.cache import FrameCache, _cached_read_
+from dexter.discovery import _matching_extension_, _partitions_, _scan_files_
 from dexter.framemap import FrameMap
-from typing import List
-# TODO: optimize before appending to df_list
+from dexter.lazy import LazyFrame
+from dexter.parallel import _map_
+from dexter.pushdown import _needed_columns_, _select_
+from dexter.streaming import StreamingFrameMap
+import dexter.optimizer
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
-def _read_chunks_(df_chunk) -> pd.DataFrame:
+class ReadError(Exception):
+    """
+    Raised when one or more files could not be read by a readm_* function.
+
+    Every file is attempted before it is raised, the failures are kept in ``errors``
+    as a dictionary of file path to exception and the frames that were read successfully
+    in ``framemap``.
+    """
+
+    def __init__(self, errors: dict, framemap: FrameMap = None):
+        self.errors = errors
+        self.framemap = framemap
+
+        failures = '\n'.join(f'  {path}: {error!r}' for path, error in errors.items())
+        super().__init__(f'{len(errors)} file(s) could not be read:\n{failures}')
+
+
+def _read_chunks_(df_chunk, optimize: bool = False) -> pd.DataFrame:
     """
     Reads a chunks object of a pandas dataframe
     Receives the object of a pd.read with chunksize smaller than the size of the dataset
+    If optimize, each chunk is optimized before being appended, instead of the whole dataframe after
 
     Returns the dataframe
     """
+    if optimize:
+        return dexter.optimizer.optimize_chunks(df_chunk)
+
     chunk_list = [chunk for chunk in df_chunk]
     df = pd.concat(chunk_list)
 
@@ -23,28 +55,470 @@ def _reader_by_name_(filepath, df_names, extension):
     """
     Reads files with names in df_names and the proper extension in the filepath
 
-    Returns a numpy array with the dataframes ready to be read by pd.read_* functions
+    Returns a list with the paths of the dataframes ready to be read by pd.read_* functions
     """
     # Here the function uses the names of the dataframes to read the files
-    df_names = np.char.array(df_names)
-    filepath = np.full(df_names.shape, filepath)
+    return [os.path.join(filepath, str(name) + extension) for name in df_names]
 
-    return filepath + df_names + extension
 
+def _read_all_by_path_(filepath, extensions, recursive=False, pattern=None):
+    """
+    Reads files with one of the proper extensions in the filepath, and in its subfolders if recursive
+    If pattern is given, only files whose path relative to filepath matches this glob pattern are read
 
-def _read_all_by_path_(filepath, extension):
+    Returns a sorted list of the paths of the files relative to filepath
     """
-    Reads files with the proper extension in the filepath
+    # only files with the appropriate extension matter
+    return _scan_files_(filepath, extensions, recursive, pattern)
+
 
-    Returns a list of the names of the dataframes
+def _add_partitions_(df: pd.DataFrame, partitions: dict) -> pd.DataFrame:
     """
-    path, dirs, files = next(os.walk(filepath))
+    Adds a categorical column for each partition key, holding its value in every row
+    Keys that are already columns of the dataframe are left as they are.
 
-    # only files with the appropriate extension matter
-    return [file for file in files if os.path.splitext(file)[-1] == extension]
+    Returns the dataframe
+    """
+    for key, value in partitions.items():
+        if key not in df:
+            df[key] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[value])
+
+    return df
+
+
+def _read_file_(reader: Callable, path: str, chunksize: int = None, optimize: bool = False, schema: dict = None,
+                partitions: dict = None, projection: List[str] = None, predicate=None, **kwargs) -> pd.DataFrame:
+    """
+    Reads a single file with the given pd.read_* function
+    If chunksize is given, the chunks are read and concatenated here, so that the
+    whole read happens inside the worker.
+    If a predicate (filters in the format of pyarrow.parquet) or a projection (a list of columns) is given,
+    the rows that pass the filters and then the columns are kept, chunk by chunk if chunksize is given,
+    before anything else is done with the data.
+    If optimize, the dataframe (or each of its chunks) is optimized in the worker as well.
+    If a schema (extra reader arguments inferred from a sample) is given and the file does
+    not fit it, the file is read again without it.
+    If partitions are given, they are added as categorical columns.
+
+    Returns the dataframe
+    """
+    if partitions:
+        return _add_partitions_(_read_file_(reader, path, chunksize, optimize, schema, projection=projection,
+                                            predicate=predicate, **kwargs), partitions)
+
+    if schema is not None:
+        try:
+            return _read_file_(reader, path, chunksize, optimize, projection=projection, predicate=predicate,
+                               **{**kwargs, **schema})
+        except (ValueError, TypeError):
+            # a value outside of the sample did not fit the inferred types
+            return _read_file_(reader, path, chunksize, optimize, projection=projection, predicate=predicate,
+                               **{**kwargs, 'usecols': schema.get('usecols')})
+
+    if chunksize is not None:
+        return _read_chunks_(_read_selected_chunks_(reader, path, projection, predicate, chunksize=chunksize,
+                                                    **kwargs),
+                             optimize)
+
+    df = _select_(reader(path, **kwargs), projection, predicate)
+
+    if optimize:
+        # the dataframe was just read, nobody else holds a reference to it
+        dexter.optimizer.optimize(df, inplace=True)
+
+    return df
+
+
+def _read_selected_chunks_(reader: Callable, path: str, projection: List[str] = None, predicate=None,
+                           **kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Reads a file in chunks with the given pd.read_* function (kwargs having the chunksize)
+
+    Returns an iterator over the chunks, keeping the rows that pass the predicate and then the projection
+    """
+    with reader(path, **kwargs) as chunks:
+        for chunk in chunks:
+            yield _select_(chunk, projection, predicate)
+
+
+def _pushdown_(columns: List[str] = None, filters=None) -> dict:
+    """
+    Returns the projection and predicate arguments of _read_file_, only those that are given,
+    so that the arguments (and the cache keys) of reads without them do not change
+    """
+    return {key: value for key, value in {'projection': columns, 'predicate': filters}.items() if value}
+
+
+def _load_path_(item) -> pd.DataFrame:
+    """
+    Receives a (loader, path) pair
+
+    Returns the dataframe read by the loader
+    """
+    loader, path = item
+
+    return loader(path)
+
+
+def _readm_(filepath: str, df_names: List[str], extension: Union[str, Sequence[str]], reader: Callable,
+            strip_extension: bool = False, optimize: bool = False, workers: int = None, executor: str = 'thread',
+            errors: str = 'raise', lazy: bool = False, schemas: Callable = None, recursive: bool = False,
+            pattern: str = None, partitions: bool = False, cache: Union[str, FrameCache] = None,
+            memory_budget: int = None, union: Union[bool, str] = False,
+            **kwargs) -> Union[FrameMap, pd.DataFrame]:
+    """
+    Reads multiple files in a directory with the given pd.read_* function, returns a FrameMap
+    The files are read by a pool of workers when workers is given, and the FrameMap is assembled
+    in a deterministic name order regardless of which file finishes first.
+
+    Files are found by their extension (or any of a sequence of extensions), in the subfolders as
+    well if recursive, and filtered by a glob pattern on their relative path. Files in subfolders
+    are named by their relative path. If partitions, hive style folders (key=value) become columns.
+
+    Failures of single files are collected and, depending on errors, raised as a ReadError
+    after every file was attempted, warned about or ignored.
+
+    If optimize, every file is optimized right after being read (chunk by chunk when chunksize
+    is given), so the unoptimized dataframes are never all in memory at once.
+
+    If lazy, no file is read here, the FrameMap holds LazyFrames that are read (and optimized)
+    when first accessed.
+
+    If schemas is given, it receives the list of paths and returns a schema (extra reader arguments)
+    for each of them, these are kept in the schemas attribute of the FrameMap.
+
+    If a cache (or the folder of one) is given, files that did not change since they were last read
+    with the same arguments are loaded from it instead.
+
+    If a memory budget is given, the files are read lazily and the FrameMap keeps its dataframes under
+    the budget, spilling the least recently used ones to disk.
+
+    If union, the dataframes are concatenated with FrameMap.concat and the single dataframe is returned,
+    with a key column named union if it is a string.
+
+    The arguments and the fingerprint (size and modification time) of every file are kept in the
+    FrameMap, so that FrameMap.refresh can read again only what changed.
+
+    Returns a FrameMap
+    """
+    if errors not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"errors must be one of 'raise', 'warn' or 'ignore', got {errors!r}")
+
+    # reading every file up front is what a budget must avoid
+    lazy = lazy or memory_budget is not None
+
+    source = {
+        'filepath': filepath, 'df_names': df_names, 'strip_extension': strip_extension, 'recursive': recursive,
+        'extensions': (extension,) if isinstance(extension, str) else tuple(extension), 'pattern': pattern,
+        'reader': reader, 'optimize': optimize, 'schemas': schemas, 'partitions': partitions, 'lazy': lazy,
+        'cache': FrameCache(cache) if isinstance(cache, str) else cache, 'workers': workers, 'executor': executor,
+        'errors': errors, 'kwargs': kwargs, 'fingerprints': {},
+    }
+
+    files, df_names = _list_files_(source)
+    paths, df_list, schema_list, failures = _load_files_(source, files)
+
+    # files that failed are left out of the framemap, the others keep their order
+    failed = {i for i, _ in failures}
+    framemap = FrameMap(
+        [df for i, df in enumerate(df_list) if i not in failed],
+        [str(name) for i, name in enumerate(df_names) if i not in failed]
+    )
+
+    source['paths'] = [path for i, path in enumerate(paths) if i not in failed]
+    # FrameMap.__setattr__ would store these as dataframes
+    object.__setattr__(framemap, '_source', source)
+
+    if schemas is not None:
+        schema_list = [schema for i, schema in enumerate(schema_list) if i not in failed]
+        object.__setattr__(framemap, 'schemas', dict(zip(framemap.names, schema_list)))
+
+    if memory_budget is not None:
+        framemap.set_memory_budget(memory_budget)
+
+    _report_failures_(failures, paths, errors, framemap)
+
+    return _union_(framemap, union)
+
+
+def _union_(framemap: FrameMap, union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
+    """
+    Returns the FrameMap or, if union, its dataframes concatenated, with a key column named union if it is a string
+    """
+    if not union:
+        return framemap
+
+    return framemap.concat(key=union if isinstance(union, str) else None)
+
+
+def _list_files_(source: dict) -> Tuple[List[str], List[str]]:
+    """
+    Lists the files to be read according to the source arguments of a readm_* call
+
+    Returns the paths of the files relative to the folder and the names of their dataframes
+    """
+    extensions = source['extensions']
+
+    # Here the function uses the names of the dataframes to read the files
+    if source['df_names'] is not None:
+        df_names = [str(name) for name in source['df_names']]
+        return [name + extensions[0] for name in df_names], df_names
+
+    # If names are not given, the function just reads all data in folder
+    files = _read_all_by_path_(source['filepath'], extensions, source['recursive'], source['pattern'])
+
+    # note: read_csv keeps only the name, separate of the extension
+    df_names = [file[:-len(_matching_extension_(file, extensions))] if source['strip_extension'] else file
+                for file in files]
+
+    return files, df_names
+
+
+def _load_files_(source: dict, files: List[str]) -> Tuple[List[str], list, List[dict], list]:
+    """
+    Reads the files (or creates LazyFrames for them) according to the source arguments of a readm_* call
+    and stores the fingerprint of each file in the source, taken before it is read.
+
+    Returns the paths, the dataframes, the schemas and the (index, exception) pairs of the failures
+    """
+    paths = [os.path.join(source['filepath'], file) for file in files]
+    schemas = source['schemas']
+    schema_list = schemas(paths) if schemas is not None else [None] * len(paths)
+
+    loaders = [
+        partial(_read_file_, source['reader'], optimize=source['optimize'], schema=schema,
+                partitions=_partitions_(file) if source['partitions'] else None, **source['kwargs'])
+        for file, schema in zip(files, schema_list)
+    ]
+
+    if source['cache'] is not None:
+        loaders = [partial(_cached_read_, source['cache'], loader) for loader in loaders]
+
+    for path in paths:
+        source['fingerprints'][path] = _fingerprint_(path)
+
+    if source['lazy']:
+        return paths, [LazyFrame(path, loader) for path, loader in zip(paths, loaders)], schema_list, []
+
+    df_list, failures = _map_(_load_path_, zip(loaders, paths), source['workers'], source['executor'])
+
+    return paths, df_list, schema_list, failures
+
+
+def _stream_files_(filepath: str, df_names: List[str], extension: Union[str, Sequence[str]], reader: Callable,
+                   chunksize: int, strip_extension: bool = False, workers: int = None, executor: str = 'thread',
+                   recursive: bool = False, pattern: str = None, schemas: Callable = None,
+                   **kwargs) -> StreamingFrameMap:
+    """
+    Finds the files like _readm_, without reading them
+
+    Returns a StreamingFrameMap that reads each file in chunks of chunksize rows with the given pd.read_* function
+    """
+    if chunksize is None:
+        raise ValueError('stream=True needs a chunksize')
+
+    source = {
+        'filepath': filepath, 'df_names': df_names, 'strip_extension': strip_extension, 'recursive': recursive,
+        'extensions': (extension,) if isinstance(extension, str) else tuple(extension), 'pattern': pattern,
+    }
+
+    files, df_names = _list_files_(source)
+    paths = [os.path.join(filepath, file) for file in files]
+    schema_list = schemas(paths) if schemas is not None else [{}] * len(paths)
+
+    sources = [partial(_read_selected_chunks_, reader, path, chunksize=chunksize, **{**kwargs, **schema})
+               for path, schema in zip(paths, schema_list)]
+
+    return StreamingFrameMap(sources, df_names, workers, executor)
+
+
+def _fingerprint_(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Returns the size and modification time of a file, None if it does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _report_failures_(failures: list, paths: List[str], errors: str, framemap: FrameMap) -> None:
+    """
+    Raises a ReadError, warns or does nothing about the files that failed, according to errors
+    """
+    if not failures:
+        return
+
+    failures = {str(paths[i]): error for i, error in failures}
+
+    if errors == 'raise':
+        raise ReadError(failures, framemap)
+
+    if errors == 'warn':
+        warnings.warn(str(ReadError(failures)), stacklevel=4)
+
+
+def _refresh_(framemap: FrameMap, append: bool = False) -> dict:
+    """
+    Updates a FrameMap read by a readm_* function with the changes in its folder: frames are added
+    for new files, read again for modified ones and dropped for deleted ones. Unchanged files are
+    not read. If append, csv files that only grew are updated by reading the bytes past their
+    previous size.
+
+    Returns a dictionary with the names of the frames added, modified, appended and removed
+    """
+    source = vars(framemap).get('_source')
+
+    if source is None:
+        raise ValueError('only a FrameMap returned by a readm_* function can be refreshed')
+
+    files, df_names = _list_files_(source)
+    fingerprints = source['fingerprints']
+    frames, names = dict.get(framemap, 'frames'), framemap.names
+    position = {path: i for i, path in enumerate(source['paths'])}
+    changes = {'added': [], 'modified': [], 'appended': [], 'removed': []}
+    new_frames, new_names, new_paths, to_load = [], [], [], []
+
+    for file, name in zip(files, df_names):
+        path = os.path.join(source['filepath'], file)
+        fingerprint = _fingerprint_(path)
+
+        # a frame that is kept also keeps its name, even if it was renamed
+        if path in position:
+            frame, name = frames[position[path]], names[position[path]]
+            previous = fingerprints[path]
+
+            if fingerprint != previous and append and _can_append_(source, frame, previous, fingerprint):
+                frame = _append_csv_(source, path, frame, previous[0])
+                fingerprints[path] = fingerprint
+                changes['appended'].append(name)
+
+            elif fingerprint != previous:
+                to_load.append(len(new_frames))
+                changes['modified'].append(name)
+
+        else:
+            frame = None
+            to_load.append(len(new_frames))
+            changes['added'].append(name)
+
+        new_frames.append(frame)
+        new_names.append(name)
+        new_paths.append(path)
+
+    changes['removed'] = [names[i] for path, i in position.items() if path not in set(new_paths)]
+
+    for path in set(position).difference(new_paths):
+        del fingerprints[path]
+
+    _, df_list, schema_list, failures = _load_files_(source, [files[i] for i in to_load])
+
+    for i, df, schema in zip(to_load, df_list, schema_list):
+        new_frames[i] = df
+
+        if source['schemas'] is not None:
+            framemap.schemas[new_names[i]] = schema
+
+    # files that failed are dropped, like when the framemap was read
+    failed = {to_load[i] for i, _ in failures}
+    keep = [i for i in range(len(new_frames)) if i not in failed]
+
+    for name in names:
+        dict.pop(framemap, name, None)
+
+    framemap.frames = [new_frames[i] for i in keep]
+    framemap.names = [new_names[i] for i in keep]
+    source['paths'] = [new_paths[i] for i in keep]
+
+    for i in keep:
+        dict.__setitem__(framemap, new_names[i], new_frames[i])
+
+    _report_failures_(failures, [new_paths[i] for i in to_load], source['errors'], framemap)
+
+    return changes
+
+
+def _can_append_(source: dict, frame, previous: Tuple[int, int], fingerprint: Tuple[int, int]) -> bool:
+    """
+    Returns True if a file can be refreshed by reading only its new bytes: a csv file that grew,
+    whose dataframe is loaded and was neither read in chunks nor with partition columns
+    """
+    return (source['reader'] is pd.read_csv and fingerprint is not None and previous is not None
+            and fingerprint[0] > previous[0] and isinstance(frame, pd.DataFrame) and not source['partitions'])
 
 
-def readm_csv(filepath: str, df_names: List[str] = None, chunksize: int = None, optimize: bool = False) -> FrameMap:
+def _append_csv_(source: dict, path: str, frame: pd.DataFrame, offset: int) -> pd.DataFrame:
+    """
+    Reads the rows of a csv file past offset, the size of the file when the frame was read,
+    and appends them to the frame, converting them to the (optimized) types of the frame
+
+    Returns the new dataframe
+    """
+    kwargs = {key: value for key, value in source['kwargs'].items()
+              if key not in ('chunksize', 'usecols', 'projection', 'predicate')}
+    header = pd.read_csv(path, nrows=0, **kwargs).columns
+
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        tail = pd.read_csv(file, header=None, names=header, usecols=source['kwargs'].get('usecols'), **kwargs)
+
+    tail = _select_(tail, source['kwargs'].get('projection'), source['kwargs'].get('predicate'))
+
+    if isinstance(frame.index, pd.RangeIndex):
+        tail.index = pd.RangeIndex(frame.index.stop, frame.index.stop + len(tail) * frame.index.step,
+                                   frame.index.step)
+
+    if source['optimize']:
+        return dexter.optimizer.append_chunk(frame, tail)
+
+    return pd.concat([frame, tail])
+
+
+def _infer_csv_schemas_(paths: List[str], sample_bytes: int = 65536, schema: dict = None,
+                        usecols: List[str] = None) -> List[dict]:
+    """
+    Infers the schema of each csv file, files with the same header share the same schema
+    If a schema is given, it is used for every file instead.
+
+    Returns a list with the schema of each file
+    """
+    if schema is not None:
+        if usecols is not None:
+            schema = {
+                'dtype': {col: dtype for col, dtype in schema['dtype'].items() if col in usecols},
+                'parse_dates': [col for col in schema['parse_dates'] if col in usecols],
+                'usecols': usecols,
+            }
+
+        return [schema] * len(paths)
+
+    schema_by_header, schema_list = {}, []
+
+    for path in paths:
+        try:
+            header = tuple(pd.read_csv(path, nrows=0).columns)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            # the file is left to fail (or not) when it is actually read
+            schema_list.append(None)
+            continue
+
+        if header not in schema_by_header:
+            schema_by_header[header] = dexter.optimizer.infer_csv_schema(path, sample_bytes, usecols=usecols)
+
+        schema_list.append(schema_by_header[header])
+
+    return schema_list
+
+
+def readm_csv(filepath: str, df_names: List[str] = None, chunksize: int = None, optimize: bool = False,
+              workers: int = None, executor: str = 'process', errors: str = 'raise', lazy: bool = False,
+              extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+              partitions: bool = False, cache: Union[str, FrameCache] = None, infer_schema: bool = False,
+              sample_bytes: int = 65536, schema: dict = None, usecols: List[str] = None,
+              stream: bool = False, memory_budget: int = None, columns: List[str] = None,
+              filters=None, union: Union[bool, str] = False) -> Union[FrameMap, StreamingFrameMap, pd.DataFrame]:
     """
     Reads multiple files in a directory, returns a FrameMap
     If df_names == None, it iterates the whole directory.
@@ -64,44 +538,88 @@ def readm_csv(filepath: str, df_names: List[str] = None, chunksize: int = None,
         an integer to read the files in chunks
     optimize : bool, default False
         if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'process'
+        the kind of worker pool, csv parsing holds the GIL so processes are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.csv'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    infer_schema : bool, default False
+        if True, compact types are inferred from a sample of each file and passed to pd.read_csv,
+        so text and date columns are parsed once into their final types (numbers are downcast by optimize).
+        Files with the same header share the inferred schema, which is kept in the schemas attribute of the FrameMap
+    sample_bytes : int, default 65536
+        the amount of bytes sampled from each of the head, middle and tail of a file to infer its schema
+    schema : dict, default None
+        a schema (as returned by infer_csv_schema or found in FrameMap.schemas) to be used for every file
+    usecols : List[str], default None
+        the columns to be read, all of them if None
+    stream : bool, default False
+        if True, no dataframe is held in memory: a StreamingFrameMap is returned, whose statistics
+        are computed chunk by chunk (needs chunksize, optimize, lazy, partitions and cache do not apply)
+    columns : List[str], default None
+        the columns to be kept, in this order, the others are skipped by the parser (same as usecols)
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)]), applied to
+        each chunk as it is parsed when chunksize is given
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
     Returns
     -------
-    FrameMap
+    FrameMap, StreamingFrameMap or pd.DataFrame
     """
-    df_list, extension = [], '.csv'
-
-    # Here the function uses the names of the dataframes to read the files
-    if df_names is not None:
-        reader = _reader_by_name_(filepath, df_names, extension)
-        df_list = [pd.read_csv(i, chunksize=chunksize) for i in reader]
-
-    # If names are not given, the function just reads all data in folder
-    else:
-        df_names = []
-        files = _read_all_by_path_(filepath, extension)
-
-        for file in files:
-            temp_df = pd.read_csv(filepath + file, chunksize=chunksize)
-            df_list.append(temp_df)
-            # note: appended only the name, separate of the extension
-            df_names.append(os.path.splitext(file)[0])
-
-    # If chunk_size is given, df_list is actually a list of reader objects,
-    # Let's unpack these objects
-    if chunksize is not None:
-        df_list = [_read_chunks_(i) for i in df_list]
-
-    framemap = FrameMap(df_list, df_names)
-
-    # return memory optimized version if selected
-    if optimize:
-        framemap = framemap.optimize()
-
-    return framemap
-
-
-def readm_json(filepath: str, df_names: List[str] = None, chunksize: int = None, optimize: bool = False, lines: bool = False) -> FrameMap:
+    schemas = None
+    selected = columns if columns is not None else usecols
+    # usecols alone keeps the order of the file, columns the order asked for
+    pushdown = _pushdown_(selected, filters) if columns is not None or filters else {}
+
+    if selected is not None:
+        # the parser reads the columns the filters need as well, they are dropped after filtering
+        usecols = _needed_columns_(selected, filters)
+
+    if infer_schema or schema is not None:
+        schemas = partial(_infer_csv_schemas_, sample_bytes=sample_bytes, schema=schema, usecols=usecols)
+        usecols = None
+
+    if stream:
+        return _stream_files_(filepath, df_names, extensions or '.csv', pd.read_csv, chunksize, strip_extension=True,
+                              workers=workers, executor=executor, recursive=recursive, pattern=pattern,
+                              schemas=schemas, usecols=usecols, **pushdown)
+
+    return _readm_(filepath, df_names, extensions or '.csv', pd.read_csv, strip_extension=True, optimize=optimize,
+                   workers=workers, executor=executor, errors=errors, lazy=lazy, schemas=schemas, recursive=recursive,
+                   pattern=pattern, partitions=partitions, cache=cache, memory_budget=memory_budget,
+                   chunksize=chunksize, usecols=usecols, union=union, **pushdown)
+
+
+def readm_json(filepath: str, df_names: List[str] = None, chunksize: int = None, optimize: bool = False,
+               lines: bool = False, workers: int = None, executor: str = 'process', errors: str = 'raise',
+               lazy: bool = False, extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+               partitions: bool = False, cache: Union[str, FrameCache] = None,
+               stream: bool = False, memory_budget: int = None, columns: List[str] = None,
+               filters=None, union: Union[bool, str] = False) -> Union[FrameMap, StreamingFrameMap, pd.DataFrame]:
     """
     Reads multiple files in a directory, returns a FrameMap
     If df_names == None, it iterates the whole directory.
@@ -123,48 +641,187 @@ def readm_json(filepath: str, df_names: List[str] = None, chunksize: int = None,
         if True, returns memory optimized version of dataframes
     lines : bool, default False
         read the file as a json object per line
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'process'
+        the kind of worker pool, json parsing holds the GIL so processes are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.json'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    stream : bool, default False
+        if True, no dataframe is held in memory: a StreamingFrameMap is returned, whose statistics
+        are computed chunk by chunk (needs chunksize and lines, optimize, lazy, partitions and cache do not apply)
+    columns : List[str], default None
+        the columns to be kept, in this order
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)]), applied to
+        each chunk as it is parsed when chunksize is given
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
     Returns
     -------
-    FrameMap
+    FrameMap, StreamingFrameMap or pd.DataFrame
     """
-    df_list, extension = [], '.json'
+    # json objects are parsed whole, the rows and columns are selected right after, chunk by chunk
+    pushdown = _pushdown_(columns, filters)
 
-    # Here the function uses the names of the dataframes to read the files
-    if df_names is not None:
-        reader = _reader_by_name_(filepath, df_names, extension)
-        df_list = [pd.read_json(i, chunksize=chunksize, lines=lines) for i in reader]
+    if stream:
+        return _stream_files_(filepath, df_names, extensions or '.json', pd.read_json, chunksize, workers=workers,
+                              executor=executor, recursive=recursive, pattern=pattern, lines=lines, **pushdown)
 
-    # If names are not given, the function just reads all data in folder
+    return _readm_(filepath, df_names, extensions or '.json', pd.read_json, optimize=optimize, workers=workers,
+                   executor=executor, errors=errors, lazy=lazy, recursive=recursive, pattern=pattern,
+                   partitions=partitions, cache=cache, memory_budget=memory_budget, chunksize=chunksize,
+                   lines=lines, union=union, **pushdown)
+
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xlsm', '.xls', '.xlsb', '.ods')
+
+
+def _excel_engine_(engine: str = None) -> Optional[str]:
+    """
+    Returns the engine given or, if None, calamine when python-calamine is installed and pandas
+    (2.2 or later) supports it, None otherwise so that pandas picks the engine by the extension
+    """
+    if engine is not None:
+        return engine
+
+    version = tuple(int(part) for part in pd.__version__.split('.')[:2] if part.isdigit())
+
+    if version >= (2, 2) and importlib.util.find_spec('python_calamine') is not None:
+        return 'calamine'
+
+    return None
+
+
+def _sheet_list_(workbook: pd.ExcelFile, sheet_name) -> List[str]:
+    """
+    Returns the names of the sheets to be read: all of them if sheet_name is None, otherwise those in
+    the list sheet_name, given by name or by position
+    """
+    sheets = workbook.sheet_names
+
+    if sheet_name is None:
+        return sheets
+
+    return [sheets[sheet] if isinstance(sheet, int) else sheet for sheet in sheet_name]
+
+
+def _read_workbook_(path: str, sheet_name=None, engine: str = None, optimize: bool = False,
+                    partitions: dict = None) -> dict:
+    """
+    Opens a workbook once and reads the sheets asked for (see _sheet_list_) like _read_file_
+
+    Returns a dictionary of sheet name to dataframe
+    """
+    with pd.ExcelFile(path, **({'engine': engine} if engine else {})) as workbook:
+        return {str(sheet): _read_file_(workbook.parse, sheet, optimize=optimize, partitions=partitions)
+                for sheet in _sheet_list_(workbook, sheet_name)}
+
+
+def _list_sheets_(path: str, sheet_name=None, engine: str = None) -> List[str]:
+    """
+    Returns the names of the sheets of a workbook to be read (see _sheet_list_), without reading them
+    """
+    with pd.ExcelFile(path, **({'engine': engine} if engine else {})) as workbook:
+        return [str(sheet) for sheet in _sheet_list_(workbook, sheet_name)]
+
+
+def _readm_sheets_(filepath: str, df_names: List[str], extensions: Sequence[str], sheet_name=None,
+                   engine: str = None, optimize: bool = False, workers: int = None, executor: str = 'process',
+                   errors: str = 'raise', lazy: bool = False, recursive: bool = False, pattern: str = None,
+                   partitions: bool = False, memory_budget: int = None,
+                   union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
+    """
+    Finds the workbooks like _readm_ and reads every sheet asked for into its own dataframe, named
+    workbook/sheet. Each workbook is opened once for all of its sheets, workbooks are read by the pool
+    of workers. If lazy (or given a memory budget), only the names of the sheets are read here.
+    If union, the dataframes are concatenated like in _readm_.
+
+    Returns a FrameMap
+    """
+    if errors not in ('raise', 'warn', 'ignore'):
+        raise ValueError(f"errors must be one of 'raise', 'warn' or 'ignore', got {errors!r}")
+
+    source = {
+        'filepath': filepath, 'df_names': df_names, 'strip_extension': False, 'recursive': recursive,
+        'extensions': tuple(extensions), 'pattern': pattern,
+    }
+
+    files, workbook_names = _list_files_(source)
+    paths = [os.path.join(filepath, file) for file in files]
+    file_partitions = [_partitions_(file) if partitions else None for file in files]
+    lazy = lazy or memory_budget is not None
+
+    if lazy:
+        loaders = [partial(_list_sheets_, sheet_name=sheet_name, engine=engine) for _ in paths]
     else:
-        df_names = []
-        files = _read_all_by_path_(filepath, extension)
+        loaders = [partial(_read_workbook_, sheet_name=sheet_name, engine=engine, optimize=optimize,
+                           partitions=partition) for partition in file_partitions]
 
-        for file in files:
-            temp_df = pd.read_json(filepath + file, chunksize=chunksize, lines=lines)
-            df_list.append(temp_df)
-            df_names.append(file)
+    workbooks, failures = _map_(_load_path_, zip(loaders, paths), workers, executor)
+    failed = {i for i, _ in failures}
+    df_list, names = [], []
 
-    # If chunk_size is given, df_list is actually a list of reader objects,
-    # Let's unpack these objects
-    if chunksize is not None:
-        df_list = [_read_chunks_(i) for i in df_list]
+    for i, (path, workbook_name, workbook) in enumerate(zip(paths, workbook_names, workbooks)):
+        if i in failed:
+            continue
 
-    framemap = FrameMap(df_list, df_names)
+        for sheet in workbook:
+            if lazy:
+                reader = partial(pd.read_excel, sheet_name=sheet, **({'engine': engine} if engine else {}))
+                df_list.append(LazyFrame(path, partial(_read_file_, reader, optimize=optimize,
+                                                       partitions=file_partitions[i])))
+            else:
+                df_list.append(workbook[sheet])
 
-    # return memory optimized version if selected
-    if optimize:
-        framemap = framemap.optimize()
+            names.append(f'{workbook_name}/{sheet}')
 
-    return framemap
+    framemap = FrameMap(df_list, names)
 
+    if memory_budget is not None:
+        framemap.set_memory_budget(memory_budget)
 
-def readm_excel(filepath: str, df_names: List[str] = None, optimize: bool = False) -> FrameMap:
+    _report_failures_(failures, paths, errors, framemap)
+
+    return _union_(framemap, union)
+
+
+def readm_excel(filepath: str, df_names: List[str] = None, optimize: bool = False, workers: int = None,
+                executor: str = 'process', errors: str = 'raise', lazy: bool = False,
+                extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+                partitions: bool = False, cache: Union[str, FrameCache] = None,
+                memory_budget: int = None, sheet_name=0, engine: str = None,
+                union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
     """
     Reads multiple files in a directory, returns a FrameMap
     If df_names == None, it iterates the whole directory.
     If optimize == True, returns a memory optimized version
 
+    With sheet_name=None every sheet of every workbook becomes a dataframe of its own, named
+    workbook/sheet (e.g. 'report.xlsx/Summary'), each workbook being opened once for all of its sheets.
+
     Receives the path and optionally a list of the dataframes names.
 
     Returns a FrameMap
@@ -177,38 +834,138 @@ def readm_excel(filepath: str, df_names: List[str] = None, optimize: bool = Fals
         a list with the names of the files
     optimize : bool, default False
         if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'process'
+        the kind of worker pool, excel parsing holds the GIL so processes are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.xlsx', '.xlsm', '.xls', '.xlsb', '.ods'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again (a single sheet per workbook only)
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    sheet_name : str, int, list or None, default 0
+        the sheet read from each workbook, by name or position. None reads every sheet and a list the
+        sheets in it, each into a dataframe named workbook/sheet (cache and FrameMap.refresh do not apply)
+    engine : {'calamine', 'openpyxl', 'xlrd', 'pyxlsb', 'odf'}, default None
+        the engine that parses the workbooks, None uses calamine (much faster, reads every format)
+        if python-calamine is installed and otherwise lets pandas pick one by the extension
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
     Returns
     -------
-    FrameMap
+    FrameMap or pd.DataFrame
     """
-    df_list, extension = [], '.xlsx'
-
-    # Here the function uses the names of the dataframes to read the files
-    if df_names is not None:
-        reader = _reader_by_name_(filepath, df_names, extension)
-        df_list = [pd.read_excel(i) for i in reader]
-
-    # If names are not given, the function just reads all data in folder
-    else:
-        df_names = []
-        files = _read_all_by_path_(filepath, extension)
-
-        for file in files:
-            temp_df = pd.read_excel(filepath + file)
-            df_list.append(temp_df)
-            df_names.append(file)
-
-    framemap = FrameMap(df_list, df_names)
+    engine = _excel_engine_(engine)
+    extensions = extensions or EXCEL_EXTENSIONS
+
+    if sheet_name is None or isinstance(sheet_name, list):
+        return _readm_sheets_(filepath, df_names, extensions, sheet_name=sheet_name, engine=engine,
+                              optimize=optimize, workers=workers, executor=executor, errors=errors, lazy=lazy,
+                              recursive=recursive, pattern=pattern, partitions=partitions,
+                              memory_budget=memory_budget, union=union)
+
+    # older pandas versions do not know calamine, and the first sheet needs no argument
+    arguments = {key: value for key, value in {'sheet_name': sheet_name, 'engine': engine}.items()
+                 if value not in (None, 0)}
+
+    return _readm_(filepath, df_names, extensions, pd.read_excel, optimize=optimize, workers=workers,
+                   executor=executor, errors=errors, lazy=lazy, recursive=recursive, pattern=pattern,
+                   partitions=partitions, cache=cache, memory_budget=memory_budget, union=union, **arguments)
+
+
+def readm_pickle(filepath: str, df_names: List[str] = None, optimize: bool = False, workers: int = None,
+                 executor: str = 'thread', errors: str = 'raise', lazy: bool = False,
+                 extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+                 partitions: bool = False, cache: Union[str, FrameCache] = None,
+                 memory_budget: int = None, columns: List[str] = None, filters=None,
+                 union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
+    """
+    Reads multiple files in a directory, returns a FrameMap
+    If df_names == None, it iterates the whole directory.
+    If optimize == True, returns a memory optimized version
 
-    # return memory optimized version if selected
-    if optimize:
-        framemap = framemap.optimize()
+    Receives the path and optionally a list of the dataframes names.
 
-    return framemap
+    Returns a FrameMap
 
+    Parameters
+    ----------
+    filepath : str
+        the path of the folder to be read
+    df_names : List[str], default None
+        a list with the names of the files
+    optimize : bool, default False
+        if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of worker pool, unpickling is mostly I/O so threads are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.pkl'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    columns : List[str], default None
+        the columns to be kept, in this order
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)])
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
-def readm_pickle(filepath: str, df_names: List[str] = None, optimize: bool = False) -> FrameMap:
+    Returns
+    -------
+    FrameMap or pd.DataFrame
+    """
+    # a pickle is loaded whole, the rows and columns are selected in the worker, before optimizing
+    return _readm_(filepath, df_names, extensions or '.pkl', pd.read_pickle, optimize=optimize, workers=workers,
+                   executor=executor, errors=errors, lazy=lazy, recursive=recursive, pattern=pattern,
+                   partitions=partitions, cache=cache, memory_budget=memory_budget, union=union,
+                   **_pushdown_(columns, filters))
+
+
+def readm_parquet(filepath: str, df_names: List[str] = None, optimize: bool = False, workers: int = None,
+                  executor: str = 'thread', errors: str = 'raise', lazy: bool = False,
+                  extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+                  partitions: bool = False, cache: Union[str, FrameCache] = None,
+                  memory_budget: int = None, columns: List[str] = None, filters=None,
+                  dtype_backend: str = None, union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
     """
     Reads multiple files in a directory, returns a FrameMap
     If df_names == None, it iterates the whole directory.
@@ -226,81 +983,211 @@ def readm_pickle(filepath: str, df_names: List[str] = None, optimize: bool = Fal
         a list with the names of the files
     optimize : bool, default False
         if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of worker pool, pyarrow releases the GIL so threads are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.parquet'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    columns : List[str], default None
+        the columns to be read, the other column chunks are not read from disk
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)]), row groups
+        whose statistics rule them out are skipped without being read
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        'pyarrow' keeps the Arrow types (pd.ArrowDtype) instead of converting them to numpy types,
+        'numpy_nullable' uses the pandas nullable types, None the numpy types
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
     Returns
     -------
-    FrameMap
+    FrameMap or pd.DataFrame
+    """
+    _check_dtype_backend_(dtype_backend)
+    # older pandas versions do not know the arguments that are not given
+    arguments = {key: value for key, value in {'columns': columns, 'filters': filters,
+                                              'dtype_backend': dtype_backend}.items() if value is not None}
+
+    return _readm_(filepath, df_names, extensions or '.parquet', pd.read_parquet, optimize=optimize,
+                   workers=workers, executor=executor, errors=errors, lazy=lazy, recursive=recursive, pattern=pattern,
+                   partitions=partitions, cache=cache, memory_budget=memory_budget, union=union, **arguments)
+
+
+def readm_feather(filepath: str, df_names: List[str] = None, optimize: bool = False, workers: int = None,
+                  executor: str = 'thread', errors: str = 'raise', lazy: bool = False,
+                  extensions: List[str] = None, recursive: bool = False, pattern: str = None,
+                  partitions: bool = False, cache: Union[str, FrameCache] = None,
+                  memory_budget: int = None, columns: List[str] = None, filters=None,
+                  dtype_backend: str = None, union: Union[bool, str] = False) -> Union[FrameMap, pd.DataFrame]:
     """
-    df_list, extension = [], '.pkl'
+    Reads multiple Feather (Arrow IPC) files in a directory, returns a FrameMap
+    If df_names == None, it iterates the whole directory.
+    If optimize == True, returns a memory optimized version
 
-    # Here the function uses the names of the dataframes to read the files
-    if df_names is not None:
-        reader = _reader_by_name_(filepath, df_names, extension)
-        df_list = [pd.read_pickle(i) for i in reader]
+    The files are memory mapped, so only the columns asked for are read from disk. With
+    dtype_backend='pyarrow' the dataframes point to the mapped files instead of copying them,
+    which makes reading files written by FrameMap.to_feather (uncompressed) almost free.
 
-    # If names are not given, the function just reads all data in folder
-    else:
-        df_names = []
-        files = _read_all_by_path_(filepath, extension)
+    Receives the path and optionally a list of the dataframes names.
 
-        for file in files:
-            temp_df = pd.read_pickle(filepath + file)
-            df_list.append(temp_df)
-            df_names.append(file)
+    Returns a FrameMap
 
-    framemap = FrameMap(df_list, df_names)
+    Parameters
+    ----------
+    filepath : str
+        the path of the folder to be read
+    df_names : List[str], default None
+        a list with the names of the files
+    optimize : bool, default False
+        if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of worker pool, pyarrow releases the GIL so threads are used by default
+    errors : {'raise', 'warn', 'ignore'}, default 'raise'
+        what to do with the files that could not be read, every file is attempted before
+        a ReadError is raised
+    lazy : bool, default False
+        if True, files are only read when their dataframe is first accessed
+    extensions : List[str], default None
+        the extensions of the files to be read, ['.feather', '.arrow'] if None
+    recursive : bool, default False
+        if True, the files in subfolders are read as well and named by their relative path,
+        hidden subfolders (e.g. .git) are skipped
+    pattern : str, default None
+        a glob pattern that the path of a file, relative to filepath, must match to be read
+    partitions : bool, default False
+        if True, hive style folders in the path of a file (e.g. dt=2026-10-01/region=eu/) become
+        categorical columns of its dataframe
+    cache : str or FrameCache, default None
+        a FrameCache (or the folder of one) keeping the dataframes read, files that did not
+        change since they were cached are not read again
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the files are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    columns : List[str], default None
+        the columns to be read
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)]), applied to
+        the Arrow table before it is converted
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        'pyarrow' keeps the Arrow types (pd.ArrowDtype) without copying the data,
+        'numpy_nullable' uses the pandas nullable types, None the numpy types
+    union : bool or str, default False
+        if True, the dataframes are concatenated into a single dataframe (see FrameMap.concat), which is
+        returned instead of the FrameMap; a string is also the name of a key column with the name of
+        the dataframe of each row
 
-    # return memory optimized version if selected
-    if optimize:
-        framemap = framemap.optimize()
+    Returns
+    -------
+    FrameMap or pd.DataFrame
+    """
+    _check_dtype_backend_(dtype_backend)
 
-    return framemap
+    return _readm_(filepath, df_names, extensions or ('.feather', '.arrow'), _read_feather_, strip_extension=True,
+                   optimize=optimize, workers=workers, executor=executor, errors=errors, lazy=lazy,
+                   recursive=recursive, pattern=pattern, partitions=partitions, cache=cache,
+                   memory_budget=memory_budget, columns=columns, filters=filters, dtype_backend=dtype_backend,
+                   union=union)
 
 
-def readm_parquet(filepath: str, df_names: List[str] = None, optimize: bool = False) -> FrameMap:
+def readm_bundle(filepath: str, df_names: List[str] = None, optimize: bool = False, workers: int = None,
+                 executor: str = 'thread', lazy: bool = False, memory_budget: int = None,
+                 columns: List[str] = None, filters=None, dtype_backend: str = None) -> FrameMap:
     """
-    Reads multiple files in a directory, returns a FrameMap
-    If df_names == None, it iterates the whole directory.
+    Reads the dataframes of a bundle written by FrameMap.to_bundle, returns a FrameMap
+    If df_names == None, every dataframe of the bundle is read.
     If optimize == True, returns a memory optimized version
 
-    Receives the path and optionally a list of the dataframes names.
+    The bundle is opened once for its manifest and memory mapped, uncompressed Arrow members are
+    then read in place without copying their bytes.
+
+    Receives the path of the bundle and optionally a list of the dataframes names.
 
     Returns a FrameMap
 
     Parameters
     ----------
     filepath : str
-        the path of the folder to be read
+        the path of the bundle
     df_names : List[str], default None
-        a list with the names of the files
+        a list with the names of the dataframes to be read
     optimize : bool, default False
         if True, returns memory optimized version of dataframes
+    workers : int, default None
+        number of dataframes read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of worker pool, pyarrow releases the GIL so threads are used by default
+    lazy : bool, default False
+        if True, dataframes are only read when first accessed
+    memory_budget : int, default None
+        the memory in bytes the dataframes may use, the dataframes are then read when first accessed and the
+        least recently used dataframes are spilled to disk when it is exceeded, see FrameMap.set_memory_budget
+    columns : List[str], default None
+        the columns to be read
+    filters : List[Tuple] or List[List[Tuple]], default None
+        rows to keep, in the format of pyarrow.parquet (e.g. [('year', '>=', 2020)]), applied to
+        the Arrow table before it is converted
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        'pyarrow' keeps the Arrow types (pd.ArrowDtype) without copying the data,
+        'numpy_nullable' uses the pandas nullable types, None the numpy types
 
     Returns
     -------
     FrameMap
     """
-    df_list, extension = [], '.parquet'
+    _check_dtype_backend_(dtype_backend)
+    manifest, offsets = _read_manifest_(filepath)
+    entries = manifest['frames']
 
-    # Here the function uses the names of the dataframes to read the files
     if df_names is not None:
-        reader = _reader_by_name_(filepath, df_names, extension)
-        df_list = [pd.read_parquet(i) for i in reader]
+        by_name = {entry['name']: entry for entry in entries}
+        missing = [str(name) for name in df_names if str(name) not in by_name]
 
-    # If names are not given, the function just reads all data in folder
+        if missing:
+            raise KeyError(f'dataframes not found in {filepath}: {missing}')
+
+        entries = [by_name[str(name)] for name in df_names]
+
+    loaders = [
+        partial(_read_file_, partial(_read_member_, entry=entry, offset=offsets[entry['member']], columns=columns,
+                                     filters=filters, dtype_backend=dtype_backend), optimize=optimize)
+        for entry in entries
+    ]
+
+    if lazy or memory_budget is not None:
+        df_list = [LazyFrame(filepath, loader) for loader in loaders]
     else:
-        df_names = []
-        files = _read_all_by_path_(filepath, extension)
+        df_list, errors = _map_(_load_path_, [(loader, filepath) for loader in loaders], workers, executor)
 
-        for file in files:
-            temp_df = pd.read_parquet(filepath + file)
-            df_list.append(temp_df)
-            df_names.append(file)
+        if errors:
+            raise errors[0][1]
 
-    framemap = FrameMap(df_list, df_names)
+    framemap = FrameMap(df_list, [entry['name'] for entry in entries])
 
-    # return memory optimized version if selected
-    if optimize:
-        framemap = framemap.optimize()
+    if memory_budget is not None:
+        framemap.set_memory_budget(memory_budget)
 
     return framemap
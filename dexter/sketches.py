@@ -0,0 +1,468 @@
+"""
+Sketches
+--------
+Small, mergeable summaries of columns that answer approximate questions in a single pass.
+
+"""
+import numpy as np
+import pandas as pd
+
+
+def _hash_(values) -> np.ndarray:
+    """
+    Receives a series or array of any type
+
+    Returns an array with a 64 bits hash of each value
+    """
+    # categorize would factorize the values first, which costs as much as counting them exactly
+    return pd.util.hash_pandas_object(pd.Series(values), index=False, categorize=False).to_numpy()
+
+
+def _leading_zeros_(x: np.ndarray) -> np.ndarray:
+    """
+    Receives an array of uint64
+
+    Returns the number of leading zero bits of each value, counted over its top 53 bits
+    """
+    # the top 53 bits are exact as a float64, whose exponent is then their bit length
+    _, exponent = np.frexp((x >> np.uint64(11)).astype(np.float64))
+
+    return (53 - exponent).astype(np.uint8)
+
+
+class HyperLogLog:
+    """
+    Approximate count of distinct values.
+
+    The relative standard error of the count is about 1.04 / sqrt(2 ** precision),
+    0.8% for the default precision of 14, using 2 ** precision bytes of memory.
+    Sketches with the same precision can be merged, e.g. when a file is read in chunks.
+
+    Parameters
+    ----------
+    precision : int, default 14
+        number of bits of the hash used to choose a register, between 4 and 18
+
+    Example
+    -------
+    >>> hll = HyperLogLog()
+    >>> hll.update(df['col'])
+    >>> hll.count()
+    1021
+    _______
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f'precision must be between 4 and 18, got {precision}')
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def error(self) -> float:
+        """
+        The relative standard error of the count
+        """
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values) -> 'HyperLogLog':
+        """
+        Adds the values of a series or array to the sketch
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        return self._update_hashes_(_hash_(values))
+
+    def _update_hashes_(self, hashes: np.ndarray) -> 'HyperLogLog':
+        """
+        Adds values to the sketch by their 64 bits hashes (see _hash_)
+        """
+        if len(hashes):
+            # the first bits choose the register, the rank of the remaining bits is stored in it
+            index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+            rank = np.minimum(_leading_zeros_(hashes << np.uint64(self.precision)), 53 - self.precision) + 1
+
+            np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Merges another sketch with the same precision into this one
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        if other.precision != self.precision:
+            raise ValueError('only sketches with the same precision can be merged')
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+        return self
+
+    def count(self) -> int:
+        """
+        Returns the estimated number of distinct values
+
+        Returns
+        -------
+        int
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        # linear counting is more accurate while many registers are still empty
+        empty = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty:
+            estimate = m * np.log(m / empty)
+
+        return int(round(estimate))
+
+
+class MinHash:
+    """
+    Signature of the set of distinct values of a column, whose similarity to the signature of another
+    column estimates the Jaccard similarity of their sets of values (distinct values in both / distinct
+    values in either).
+
+    This is the one permutation variant: each hash goes to one of k bins and only the smallest hash of
+    each bin is kept, so a value is hashed once rather than k times. The standard error of the
+    similarity is about sqrt(J * (1 - J) / k), 3% for the default k of 256, using 8 * k bytes of memory.
+    Signatures with the same k can be merged, e.g. when a file is read in chunks.
+
+    Parameters
+    ----------
+    k : int, default 256
+        number of bins of the signature
+
+    Example
+    -------
+    >>> left, right = MinHash(), MinHash()
+    >>> left.update(orders['customer_id'])
+    >>> right.update(customers['id'])
+    >>> left.jaccard(right)
+    0.41
+    _______
+    """
+
+    EMPTY = np.iinfo(np.uint64).max
+
+    def __init__(self, k: int = 256):
+        if k < 1:
+            raise ValueError(f'k must be a positive integer, got {k}')
+
+        self.k = k
+        self.signature = np.full(k, self.EMPTY, dtype=np.uint64)
+
+    def update(self, values) -> 'MinHash':
+        """
+        Adds the values of a series or array to the signature
+
+        Returns
+        -------
+        MinHash
+        """
+        return self._update_hashes_(_hash_(values))
+
+    def _update_hashes_(self, hashes: np.ndarray) -> 'MinHash':
+        """
+        Adds values to the signature by their 64 bits hashes (see _hash_)
+        """
+        if len(hashes):
+            # the last bits choose the bin, the order within a bin is given by the first bits
+            np.minimum.at(self.signature, (hashes % np.uint64(self.k)).astype(np.intp), hashes)
+
+        return self
+
+    def merge(self, other: 'MinHash') -> 'MinHash':
+        """
+        Merges another signature with the same k into this one
+
+        Returns
+        -------
+        MinHash
+        """
+        if other.k != self.k:
+            raise ValueError('only signatures with the same k can be merged')
+
+        np.minimum(self.signature, other.signature, out=self.signature)
+
+        return self
+
+    def jaccard(self, other: 'MinHash') -> float:
+        """
+        Returns the estimated Jaccard similarity of the values added to both signatures, NaN if both are empty
+
+        Returns
+        -------
+        float
+        """
+        return float(_jaccard_(self.signature[np.newaxis], other.signature)[0])
+
+
+def _jaccard_(signatures: np.ndarray, signature: np.ndarray) -> np.ndarray:
+    """
+    Receives a 2d array with a MinHash signature in each row and another signature with the same k
+
+    Returns the estimated Jaccard similarity of each row to the signature, NaN for rows where both are empty
+    """
+    # the bins empty in both sets say nothing about their similarity
+    both_empty = (signatures == MinHash.EMPTY) & (signature == MinHash.EMPTY)
+    matches = np.count_nonzero((signatures == signature) & ~both_empty, axis=1)
+    bins = signature.shape[-1] - np.count_nonzero(both_empty, axis=1)
+
+    return np.where(bins > 0, matches / np.maximum(bins, 1), np.nan)
+
+
+def _batches_(values, size: int = 1 << 20):
+    """
+    Splits a series or array into slices of at most size values, so that the exact
+    work done on each slice (sorting, counting) needs a bounded amount of memory
+    """
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class KLL:
+    """
+    Approximate quantiles of numeric values.
+
+    The values are kept in levels of compactors, the values in level h standing for 2 ** h values
+    each. When a level holds more than its capacity, its sorted values are halved, every other one
+    moving up a level. The error on the rank of a quantile is about 2.3 / k ** 0.97 of the number
+    of values, 1.3% for the default k of 200, using O(k) memory whatever the number of values.
+    Sketches with the same k can be merged, e.g. when a file is read in chunks.
+
+    Parameters
+    ----------
+    k : int, default 200
+        capacity of the top level, larger values are more accurate and use more memory
+    seed : int, default None
+        seed of the random choices made when compacting, for reproducible results
+
+    Example
+    -------
+    >>> kll = KLL()
+    >>> kll.update(df['col'])
+    >>> kll.quantile(0.5)
+    41.8
+    _______
+    """
+
+    def __init__(self, k: int = 200, seed: int = None):
+        if k < 8:
+            raise ValueError(f'k must be at least 8, got {k}')
+
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def error(self) -> float:
+        """
+        The approximate normalized rank error of the quantiles
+        """
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity_(self, level: int) -> int:
+        """
+        Returns the number of values a level can hold, which shrinks by 2/3 for each level below the top one
+        """
+        depth = len(self.levels) - level - 1
+
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress_(self) -> None:
+        """
+        Compacts the levels until none of them holds more than its capacity
+        """
+        compacted = True
+
+        while compacted:
+            compacted = False
+
+            for level in range(len(self.levels)):
+                values = self.levels[level]
+
+                if len(values) <= self._capacity_(level):
+                    continue
+
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                # one value is left behind if there is an odd number of them
+                values = np.sort(values)
+                odd = len(values) % 2
+                promoted = values[odd + self._rng.integers(2)::2]
+
+                self.levels[level] = values[:odd]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                compacted = True
+
+    def update(self, values) -> 'KLL':
+        """
+        Adds the values of a numeric series or array to the sketch, missing values are skipped
+
+        Returns
+        -------
+        KLL
+        """
+        for batch in _batches_(pd.Series(values, copy=False)):
+            batch = batch.to_numpy(dtype='float64', na_value=np.nan)
+            batch = batch[~np.isnan(batch)]
+
+            self.n += len(batch)
+            self.levels[0] = np.concatenate([self.levels[0], batch])
+            self._compress_()
+
+        return self
+
+    def merge(self, other: 'KLL') -> 'KLL':
+        """
+        Merges another sketch with the same k into this one
+
+        Returns
+        -------
+        KLL
+        """
+        if other.k != self.k:
+            raise ValueError('only sketches with the same k can be merged')
+
+        self.levels += [np.empty(0)] * (len(other.levels) - len(self.levels))
+
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+
+        self.n += other.n
+        self._compress_()
+
+        return self
+
+    def quantile(self, q):
+        """
+        Returns the approximate quantile(s) q, between 0 and 1, NaN if no values were added
+
+        Parameters
+        ----------
+        q : float or array-like of float
+
+        Returns
+        -------
+        float or np.ndarray
+        """
+        q = np.asarray(q, dtype=float)
+
+        if not self.n:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values), 2 ** level) for level, values in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        ranks = np.cumsum(weights[order])
+
+        # the first value whose cumulative weight reaches the rank asked for
+        positions = np.searchsorted(ranks, q * ranks[-1], side='left')
+        result = values[order][np.minimum(positions, len(values) - 1)]
+
+        return result if q.ndim else float(result)
+
+
+class SpaceSaving:
+    """
+    Approximate counts of the most frequent values.
+
+    At most capacity values are tracked. Their counts are upper bounds of the true counts, too high
+    by at most error, which is never more than the number of values added divided by capacity.
+    Any value more frequent than that is guaranteed to be tracked.
+    Sketches with the same capacity can be merged, e.g. when a file is read in chunks.
+
+    Parameters
+    ----------
+    capacity : int, default 1024
+        number of values tracked
+
+    Example
+    -------
+    >>> top = SpaceSaving()
+    >>> top.update(df['col'])
+    >>> top.top(3)
+    b    512
+    a    301
+    c     97
+    dtype: int64
+    _______
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError(f'capacity must be a positive integer, got {capacity}')
+
+        self.capacity = capacity
+        self.n = 0
+        self.error = 0
+        self.counts = pd.Series([], dtype='int64')
+
+    def _truncate_(self, counts: pd.Series, error: int) -> None:
+        """
+        Keeps the capacity largest counts, the largest count dropped becoming the error if it is larger
+        """
+        if len(counts) > self.capacity:
+            counts = counts.sort_values(ascending=False, kind='stable')
+            error = max(error, int(counts.iloc[self.capacity]))
+            counts = counts.iloc[:self.capacity]
+
+        self.counts, self.error = counts.astype('int64'), error
+
+    def update(self, values) -> 'SpaceSaving':
+        """
+        Adds the values of a series or array to the sketch, missing values are skipped
+
+        Returns
+        -------
+        SpaceSaving
+        """
+        for batch in _batches_(pd.Series(values, copy=False)):
+            batch_sketch = SpaceSaving(self.capacity)
+            batch_sketch.n = int(batch.count())
+            batch_sketch._truncate_(batch.value_counts(sort=False), 0)
+
+            self.merge(batch_sketch)
+
+        return self
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """
+        Merges another sketch with the same capacity into this one
+
+        Returns
+        -------
+        SpaceSaving
+        """
+        if other.capacity != self.capacity:
+            raise ValueError('only sketches with the same capacity can be merged')
+
+        # a value not tracked by a sketch may have been seen up to its error times
+        values = self.counts.index.union(other.counts.index, sort=False)
+        counts = (self.counts.reindex(values, fill_value=self.error)
+                  + other.counts.reindex(values, fill_value=other.error))
+
+        self.n += other.n
+        self._truncate_(counts, self.error + other.error)
+
+        return self
+
+    def top(self, k: int = 10) -> pd.Series:
+        """
+        Returns the k most frequent values and their (upper bound) counts, most frequent first
+
+        Returns
+        -------
+        pd.Series
+        """
+        return self.counts.sort_values(ascending=False, kind='stable').iloc[:k]
@@ -0,0 +1,172 @@
+"""
+MemoryBudget
+------------
+Keeps the dataframes of a FrameMap under a memory budget by spilling the least recently used ones to disk.
+
+"""
+import os
+import shutil
+import tempfile
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import List
+import pandas as pd
+from dexter.arrow import _arrow_table_
+from dexter.compat import _import_optional_
+from dexter.lazy import LazyFrame
+
+
+class SpilledFrame(LazyFrame):
+    """
+    A dataframe that was written to the spill folder of a MemoryBudget and is read back,
+    memory mapped, when it is accessed again. The spill file is removed once it is read.
+    """
+
+    def __repr__(self) -> str:
+        return f'SpilledFrame({self.path!r})'
+
+
+def _read_spill_(path: str) -> pd.DataFrame:
+    """
+    Reads a spill file, memory mapped if it is an Arrow file, and removes it
+
+    Returns the dataframe
+    """
+    if path.endswith('.feather'):
+        feather = _import_optional_('pyarrow.feather', 'spill dataframes to disk', 'pyarrow')
+        df = feather.read_table(path, memory_map=True).to_pandas()
+    else:
+        df = pd.read_pickle(path)
+
+    try:
+        os.remove(path)
+    except OSError:
+        # the file is still mapped (e.g. on Windows), it goes away with the spill folder
+        pass
+
+    return df
+
+
+class MemoryBudget:
+    """
+    The memory budget of a FrameMap.
+
+    The deep memory usage of every dataframe in memory is tracked, in the order they were last accessed.
+    When a dataframe is accessed and the total goes over max_bytes, the least recently used dataframes are
+    written to the spill folder (as uncompressed Arrow files, or pickles for dataframes Arrow can not
+    hold) and replaced by SpilledFrames, which are read back when they are accessed again.
+
+    Parameters
+    ----------
+    max_bytes : int
+        the memory the dataframes may use, a single dataframe larger than this is still kept in memory
+        while it is the one being used
+    directory : str, default None
+        the spill folder, a temporary folder removed with the MemoryBudget if None
+
+    Example
+    -------
+    >>> budget = dataframes.set_memory_budget(8 * 2 ** 30)
+    >>> dataframes.describe()
+    >>> budget.stats()
+    {'max_bytes': 8589934592, 'used_bytes': 7516192768, 'in_memory': 12, 'spilled': 30, 'evictions': 41, 'reloads': 11}
+    _______
+    """
+
+    def __init__(self, max_bytes: int, directory: str = None):
+        if max_bytes < 0:
+            raise ValueError(f'max_bytes must not be negative, got {max_bytes}')
+
+        self.max_bytes = max_bytes
+        self.sizes = OrderedDict()
+        self.evictions = 0
+        self.reloads = 0
+
+        if directory is None:
+            self.directory = tempfile.mkdtemp(prefix='dexter-spill-')
+            weakref.finalize(self, shutil.rmtree, self.directory, ignore_errors=True)
+        else:
+            self.directory = directory
+            os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'MemoryBudget({self.max_bytes}, directory={self.directory!r})'
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        The memory used by the dataframes in memory, as measured when each one was loaded
+        """
+        return sum(self.sizes.values())
+
+    def touch(self, name: str, df: pd.DataFrame) -> List[str]:
+        """
+        Marks a dataframe as the most recently used, measuring it if it is not tracked yet
+
+        Returns the names of the dataframes that must be spilled to get back under the budget
+        """
+        if name not in self.sizes:
+            self.sizes[name] = int(df.memory_usage(deep=True).sum())
+
+        self.sizes.move_to_end(name)
+        total, victims = self.used_bytes, []
+
+        for other, size in self.sizes.items():
+            if total <= self.max_bytes:
+                break
+
+            if other != name:
+                victims.append(other)
+                total -= size
+
+        return victims
+
+    def forget(self, name: str) -> None:
+        """
+        Stops tracking a dataframe, e.g. when it is removed from the FrameMap
+        """
+        self.sizes.pop(name, None)
+
+    def rename(self, old_name: str, new_name: str) -> None:
+        """
+        Tracks a dataframe under a new name, keeping its place in the order of use
+        """
+        if old_name in self.sizes:
+            self.sizes = OrderedDict((new_name if name == old_name else name, size)
+                                     for name, size in self.sizes.items())
+
+    def spill(self, name: str, df: pd.DataFrame) -> SpilledFrame:
+        """
+        Writes a dataframe to the spill folder and stops tracking it
+
+        Returns the SpilledFrame that reads it back
+        """
+        path = os.path.join(self.directory, uuid.uuid4().hex)
+
+        table = _arrow_table_(df, 'spill dataframes to disk')
+
+        if table is not None:
+            feather = _import_optional_('pyarrow.feather', 'spill dataframes to disk', 'pyarrow')
+            path += '.feather'
+            feather.write_feather(table, path, compression='uncompressed')
+        else:
+            path += '.pkl'
+            df.to_pickle(path)
+
+        self.sizes.pop(name, None)
+        self.evictions += 1
+
+        return SpilledFrame(path, _read_spill_)
+
+    def stats(self) -> dict:
+        """
+        Returns the budget, the memory used, the number of dataframes in memory and spilled, and how many
+        times dataframes were spilled (evictions) and read back (reloads)
+
+        Returns
+        -------
+        dict
+        """
+        return {'max_bytes': self.max_bytes, 'used_bytes': self.used_bytes, 'in_memory': len(self.sizes),
+                'spilled': self.evictions - self.reloads, 'evictions': self.evictions, 'reloads': self.reloads}
@@ -0,0 +1,84 @@
+"""
+SQL
+---
+SQL queries over the dataframes of a FrameMap, run by an embedded DuckDB database.
+
+"""
+import re
+from typing import Optional
+import pandas as pd
+from dexter.compat import _import_optional_
+from dexter.lazy import LazyFrame
+
+# the readers whose files DuckDB scans itself, with the arguments that do not change what is read
+_SCANS = {pd.read_parquet: 'read_parquet', pd.read_csv: 'read_csv_auto'}
+_IGNORED_ARGUMENTS = ('chunksize',)
+
+
+def _quote_(text: str, quote: str) -> str:
+    """
+    Returns the text between quotes, with the quotes in it doubled
+    """
+    return quote + text.replace(quote, quote * 2) + quote
+
+
+def _scan_(framemap, i: int) -> Optional[str]:
+    """
+    Returns the DuckDB function call that reads the file of the dataframe at position i, if it was not
+    read yet and the FrameMap was read by readm_parquet or readm_csv with nothing that changes the values
+    read (columns, filters, schemas, partitions), None otherwise
+    """
+    source = vars(framemap).get('_source')
+    frame = dict.get(framemap, 'frames')[i]
+
+    if source is None or type(frame) is not LazyFrame or source['reader'] not in _SCANS:
+        return None
+
+    arguments = {key for key, value in source['kwargs'].items() if value is not None} - set(_IGNORED_ARGUMENTS)
+
+    if source['partitions'] or source['schemas'] is not None or arguments:
+        return None
+
+    return f"{_SCANS[source['reader']]}({_quote_(frame.path, chr(39))})"
+
+
+def _mentions_(query: str, name: str) -> bool:
+    """
+    Returns True if the query mentions a table name, double quoted or as a whole (case insensitive)
+    identifier, e.g. f1 is mentioned by 'select * from F1' but not by 'select * from f10'
+    """
+    if _quote_(name, '"') in query:
+        return True
+
+    return re.search(rf'(?<![\w$"]){re.escape(name)}(?![\w$"])', query, flags=re.IGNORECASE) is not None
+
+
+def _sql_(framemap, query: str, params=None) -> pd.DataFrame:
+    """
+    Runs a query in a new in-memory DuckDB database where every dataframe of the FrameMap that the
+    query mentions is a table named after it. Dataframes in memory are scanned in place, without copying,
+    and files that were not read yet are scanned by DuckDB itself (see _scan_), which reads only the
+    columns and row groups the query needs.
+
+    Returns the result of the query
+    """
+    duckdb = _import_optional_('duckdb', 'run sql queries')
+    connection = duckdb.connect()
+
+    try:
+        # only the dataframes the query mentions are registered, so that the others are not read
+        for i, name in enumerate(framemap.names):
+            if not _mentions_(query, str(name)):
+                continue
+
+            scan = _scan_(framemap, i)
+
+            if scan is not None:
+                connection.execute(f'CREATE VIEW {_quote_(str(name), chr(34))} AS SELECT * FROM {scan}')
+            else:
+                # by position, as the names of a FrameMap are not always keys (e.g. int names)
+                connection.register(str(name), framemap._frame_at_(i))
+
+        return connection.execute(query, params).df()
+    finally:
+        connection.close()
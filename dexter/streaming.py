@@ -0,0 +1,278 @@
+"""
+StreamingFrameMap
+-----------------
+Statistics of files read in chunks, computed without ever holding a whole dataframe in memory.
+
+"""
+from typing import Callable, Iterator, List
+import pandas as pd
+from dexter.approximate import FrameSketch
+from dexter.framemap import FrameMap
+from dexter.parallel import _map_
+
+
+class StreamSummary:
+    """
+    The mergeable summary of the chunks of a file: the number of rows, the memory usage of each column
+    and of the index, and the FrameSketch of the columns (count, mean, standard deviation, min, max and
+    HyperLogLog distinct count of each column)
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.memory = pd.Series([], dtype='int64')
+        self.sketch = FrameSketch(sketches=('distinct',))
+
+    def update(self, chunk: pd.DataFrame) -> 'StreamSummary':
+        """
+        Adds a chunk to the summary
+
+        Returns
+        -------
+        StreamSummary
+        """
+        memory = chunk.memory_usage(deep=True)
+
+        # the whole dataframe would have a single RangeIndex, of constant size, not one per chunk
+        if isinstance(chunk.index, pd.RangeIndex) and self.rows:
+            memory['Index'] = 0
+
+        self.rows += len(chunk)
+        self.memory = self.memory.add(memory, fill_value=0).astype('int64')
+        self.sketch.update(chunk)
+
+        return self
+
+    def merge(self, other: 'StreamSummary') -> 'StreamSummary':
+        """
+        Merges the summary of other chunks of the same file into this one
+
+        Returns
+        -------
+        StreamSummary
+        """
+        self.rows += other.rows
+        self.memory = self.memory.add(other.memory, fill_value=0).astype('int64')
+        self.sketch.merge(other.sketch)
+
+        return self
+
+    def column_stat(self, stat: str) -> pd.Series:
+        """
+        Returns an attribute of the ColumnSketch of each column, such as 'count', 'mean' or 'std'
+        """
+        return pd.Series({name: getattr(column, stat) for name, column in self.sketch.items()}, dtype='object')
+
+
+def _summarize_(open_chunks: Callable[[], Iterator[pd.DataFrame]]) -> StreamSummary:
+    """
+    Receives a function that opens the chunk iterator of a file
+
+    Returns the StreamSummary of all its chunks
+    """
+    summary = StreamSummary()
+
+    for chunk in open_chunks():
+        summary.update(chunk)
+
+    return summary
+
+
+class StreamingFrameMap:
+    """
+    A FrameMap whose dataframes are never held in memory: each file is read chunk by chunk and its
+    statistics are computed incrementally, with mergeable accumulators (count, mean and variance with
+    the parallel form of Welford's algorithm, min, max, memory and a HyperLogLog distinct count).
+
+    The files are read in a single pass the first time a statistic is asked for, and every statistic
+    comes from that pass. The numeric statistics (mean, std, min, max) cover numeric columns only.
+
+    Parameters
+    ----------
+    sources : List[Callable]
+        one function per dataframe, each opening a new iterator over its chunks (must be picklable
+        to be run by the process executor, e.g. functools.partial(pd.read_csv, path, chunksize=10 ** 6))
+    names : List[str]
+        the names of the dataframes
+    workers : int, default None
+        number of files read concurrently, None reads them one after another and -1 uses every cpu
+    executor : {'thread', 'process'} or concurrent.futures.Executor, default 'thread'
+        the kind of worker pool
+
+    Example
+    -------
+    >>> dataframes = readm_csv('./folder', chunksize=1_000_000, stream=True)
+    >>> dataframes.shapes()
+    >>> dataframes.std()
+    _______
+    """
+
+    def __init__(self, sources: List[Callable], names: List[str], workers: int = None, executor: str = 'thread'):
+        self.sources = list(sources)
+        self.names = [str(name) for name in names]
+        self.workers = workers
+        self.executor = executor
+        self._summaries = None
+
+    def __repr__(self) -> str:
+        return f'StreamingFrameMap({self.names!r})'
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def chunks(self, name: str) -> Iterator[pd.DataFrame]:
+        """
+        Returns a new iterator over the chunks of the dataframe called name
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+        """
+        return self.sources[self.names.index(name)]()
+
+    def summaries(self) -> List[StreamSummary]:
+        """
+        Reads every file, chunk by chunk, the first time it is called
+
+        Returns
+        -------
+        List[StreamSummary]
+            the summary of each dataframe
+        """
+        if self._summaries is None:
+            summaries, errors = _map_(_summarize_, self.sources, self.workers, self.executor)
+
+            if errors:
+                raise errors[0][1]
+
+            self._summaries = summaries
+
+        return self._summaries
+
+    def refresh(self) -> None:
+        """
+        Discards the summaries, the files are read again the next time a statistic is asked for
+        """
+        self._summaries = None
+
+    def collect(self) -> FrameMap:
+        """
+        Reads every dataframe whole, for files that turned out to fit in memory
+
+        Returns
+        -------
+        FrameMap
+        """
+        return FrameMap([pd.concat(list(source())) for source in self.sources], self.names)
+
+    def _column_stat_(self, stat: str, column: str) -> FrameMap:
+        """
+        Returns a FrameMap with a single column table of a ColumnSketch attribute of the numeric columns
+        of each dataframe
+        """
+        tables = []
+
+        for summary in self.summaries():
+            numeric_columns = [name for name, sketch in summary.sketch.items() if sketch.numeric]
+            values = summary.column_stat(stat)[numeric_columns].astype('float64')
+
+            tables.append(pd.DataFrame(values, columns=[column]))
+
+        return FrameMap(tables, self.names)
+
+    def shapes(self) -> FrameMap:
+        """
+        Returns a table which contains the shapes of each df.
+
+        Returns
+        -------
+        FrameMap
+        """
+        shapes = [(summary.rows, len(summary.sketch)) for summary in self.summaries()]
+
+        return FrameMap([pd.DataFrame(shapes, columns=['rows', 'columns'], index=self.names)], self.names)
+
+    def multiple_missing(self) -> FrameMap:
+        """
+        Returns a table for each dataframe with the amount of missing values of each column.
+
+        Returns
+        -------
+        FrameMap
+        """
+        tables = []
+
+        for summary in self.summaries():
+            missing = {name: sketch.rows - sketch.count for name, sketch in summary.sketch.items()}
+            tables.append(pd.DataFrame([missing], index=['missing']))
+
+        return FrameMap(tables, self.names)
+
+    def mean(self) -> FrameMap:
+        """
+        Returns the means of the numeric columns of each dataframe.
+
+        Returns
+        -------
+        FrameMap
+        """
+        return self._column_stat_('mean', 'mean')
+
+    def std(self) -> FrameMap:
+        """
+        Returns the sample standard deviations of the numeric columns of each dataframe.
+
+        Returns
+        -------
+        FrameMap
+        """
+        return self._column_stat_('std', 'std')
+
+    def min(self) -> FrameMap:
+        """
+        Returns the min values of the numeric columns of each dataframe.
+
+        Returns
+        -------
+        FrameMap
+        """
+        return self._column_stat_('min', 'min')
+
+    def max(self) -> FrameMap:
+        """
+        Returns the max values of the numeric columns of each dataframe.
+
+        Returns
+        -------
+        FrameMap
+        """
+        return self._column_stat_('max', 'max')
+
+    def memory_usage(self) -> FrameMap:
+        """
+        Returns a table for each dataframe with its total memory usage and that of each column,
+        as if the whole dataframe was in memory.
+
+        Returns
+        -------
+        FrameMap
+        """
+        tables = []
+
+        for summary, name in zip(self.summaries(), self.names):
+            total = pd.Series(summary.memory.sum(), index=[name])
+            tables.append(pd.DataFrame(pd.concat([total, summary.memory]), columns=['Memory']))
+
+        return FrameMap(tables, self.names)
+
+    def nunique(self) -> FrameMap:
+        """
+        Returns the approximate number of distinct non-null values of each column of each dataframe,
+        estimated with HyperLogLog sketches with a relative error of about 0.8%.
+
+        Returns
+        -------
+        FrameMap
+        """
+        return FrameMap([pd.DataFrame(summary.sketch.nunique(), columns=['non-null']) for summary in self.summaries()],
+                        self.names)
@@ -0,0 +1,202 @@
+"""
+Union
+-----
+Concatenation of dataframes with (mostly) the same columns into a single dataframe, with a merged
+schema planned up front and every output column allocated once and filled in place.
+
+"""
+from typing import List, Sequence
+import numpy as np
+import pandas as pd
+
+
+def _plan_dtype_(dtypes: list, complete: bool):
+    """
+    Receives the types of a column in each dataframe that has it and whether every dataframe has it
+
+    Returns the type of the column in the union: the smallest numeric type holding every value
+    (a float if some dataframes lack the column), a categorical type with the union of the
+    categories (in order of appearance), the common type or object
+    """
+    first = dtypes[0]
+
+    if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+        if all(dtype == first for dtype in dtypes):
+            return first
+
+        # a dict keeps the categories in order of appearance, the union is no longer ordered
+        categories = {}
+        for dtype in dtypes:
+            categories.update(dict.fromkeys(dtype.categories.tolist()))
+
+        return pd.CategoricalDtype(pd.Index(list(categories)))
+
+    if all(isinstance(dtype, np.dtype) for dtype in dtypes):
+        kinds = {dtype.kind for dtype in dtypes}
+
+        if kinds <= set('iuf'):
+            dtype = np.result_type(*dtypes)
+            # the missing rows need a float, the smallest one that still holds every integer exactly
+            return dtype if complete or dtype.kind == 'f' else np.promote_types(dtype, np.float16)
+
+        if kinds == {'b'} and complete:
+            return first
+
+        if kinds <= set('Mm') and len(set(dtypes)) == 1:
+            return first
+
+        return np.dtype(object)
+
+    if all(dtype == first for dtype in dtypes):
+        return first
+
+    if all(_numeric_kind_(dtype) for dtype in dtypes):
+        return _plan_nullable_dtype_(dtypes)
+
+    return np.dtype(object)
+
+
+def _numeric_kind_(dtype) -> str:
+    """
+    Returns the kind ('b', 'i', 'u' or 'f') of a numpy, nullable (Int8, boolean, ...) or Arrow numeric
+    or boolean type, None for any other type
+    """
+    if isinstance(dtype, (pd.CategoricalDtype, pd.SparseDtype)) or dtype.kind not in 'biuf':
+        return None
+
+    return dtype.kind
+
+
+def _plan_nullable_dtype_(dtypes: list):
+    """
+    Receives numeric and boolean types, at least one of them nullable or Arrow, that are not all equal
+
+    Returns the type pandas concatenates them to: the nullable (or Arrow, if all are Arrow) type of the
+    smallest numpy type holding every value, object if booleans are mixed with numbers
+    """
+    kinds = {_numeric_kind_(dtype) for dtype in dtypes}
+
+    if 'b' in kinds and len(kinds) > 1:
+        return np.dtype(object)
+
+    numpy_dtype = np.result_type(*[getattr(dtype, 'numpy_dtype', dtype) for dtype in dtypes])
+
+    if all(isinstance(dtype, pd.ArrowDtype) for dtype in dtypes):
+        import pyarrow as pa
+        return pd.ArrowDtype(pa.from_numpy_dtype(numpy_dtype))
+
+    # pd.array gives numpy numbers and booleans their nullable type, e.g. int16 -> Int16
+    return pd.array(np.empty(0, dtype=numpy_dtype)).dtype
+
+
+def _plan_schema_(frames: List[pd.DataFrame]) -> dict:
+    """
+    Returns the type of every column of the union (see _plan_dtype_), in order of first appearance
+    """
+    found = {}
+
+    for df in frames:
+        for col, dtype in df.dtypes.items():
+            found.setdefault(col, []).append(dtype)
+
+    return {col: _plan_dtype_(dtypes, len(dtypes) == len(frames)) for col, dtypes in found.items()}
+
+
+def _codes_dtype_(categories: pd.Index) -> np.dtype:
+    """
+    Returns the integer type pandas uses for the codes of a categorical with these categories
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if len(categories) < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+
+def _union_column_(frames: List[pd.DataFrame], col, dtype, lengths: np.ndarray):
+    """
+    Allocates the column of the union once and copies the values of each dataframe into its rows,
+    categorical codes being translated to the unioned categories
+
+    Returns the array of the column
+    """
+    stops = np.cumsum(lengths)
+    starts = stops - lengths
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = np.empty(stops[-1], dtype=_codes_dtype_(dtype.categories))
+
+        for df, start, stop in zip(frames, starts, stops):
+            if col not in df.columns:
+                codes[start:stop] = -1
+                continue
+
+            values = df[col].array
+            recode = dtype.categories.get_indexer(values.categories)
+            # -1 (missing) stays -1, the last position of the appended -1 is never a category
+            codes[start:stop] = np.append(recode, -1)[values.codes]
+
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
+    if isinstance(dtype, np.dtype):
+        values = np.empty(stops[-1], dtype=dtype)
+        missing = np.array('NaT', dtype=dtype) if dtype.kind in 'Mm' else np.nan
+
+        for df, start, stop in zip(frames, starts, stops):
+            # to object, nullable values keep their own type and missing value (e.g. 1 and NA, not 1.0 and nan)
+            values[start:stop] = (df[col].to_numpy(dtype=dtype if dtype.kind == 'O' else None)
+                                  if col in df.columns else missing)
+
+        return values
+
+    # extension types are concatenated by pandas, which handles their missing values
+    parts = [df[col] if col in df.columns else pd.Series(np.nan, index=pd.RangeIndex(length), dtype=object)
+             for df, length in zip(frames, lengths)]
+    union = pd.concat(parts, ignore_index=True)
+
+    return (union if union.dtype == dtype else union.astype(dtype)).array
+
+
+def _union_frames_(frames: Sequence[pd.DataFrame], names: List[str] = None, key: str = None,
+                   ignore_index: bool = True) -> pd.DataFrame:
+    """
+    Concatenates the rows of the dataframes, planning the types of the union up front so that no
+    column is upcast more than needed and categoricals stay categoricals. Each column of the union
+    is allocated once and filled in place.
+    If key is given, a categorical column with that name and the name of the dataframe of each row
+    is added as the first column.
+
+    Returns the dataframe
+    """
+    frames = list(frames)
+
+    if not frames:
+        return pd.DataFrame()
+
+    lengths = np.array([len(df) for df in frames], dtype=np.int64)
+    dtypes = frames[0].dtypes
+
+    if key is not None and key in {col for df in frames for col in df.columns}:
+        raise ValueError(f'key {key!r} is already a column of the dataframes')
+
+    if all(df.columns.equals(frames[0].columns) and df.dtypes.equals(dtypes) for df in frames):
+        # nothing to plan, pandas concatenates whole blocks of columns of the same type at once
+        union = pd.concat(frames, ignore_index=ignore_index)
+    else:
+        schema = _plan_schema_(frames)
+        columns = {col: _union_column_(frames, col, dtype, lengths) for col, dtype in schema.items()}
+
+        if ignore_index:
+            index = pd.RangeIndex(int(lengths.sum()))
+        else:
+            index = frames[0].index.append([df.index for df in frames[1:]])
+
+        # copy=False keeps the arrays just filled instead of copying them into blocks
+        union = pd.DataFrame(columns, index=index, copy=False)
+
+    if key is not None:
+        names = [str(name) for name in (names if names is not None else range(len(frames)))]
+        codes = np.repeat(np.arange(len(frames), dtype=_codes_dtype_(pd.Index(names))), lengths)
+        union.insert(0, key, pd.Categorical.from_codes(codes, categories=names))
+
+    return union
@@ -0,0 +1,205 @@
+"""
+Writers
+-------
+Writing dataframes to files over a pool of workers, through temporary files so that a write
+interrupted halfway never leaves a partial file behind.
+
+"""
+import bz2
+import contextlib
+import gzip
+import lzma
+import os
+import sys
+import time
+import uuid
+from typing import Callable, Iterator, List, Union
+import pandas as pd
+from dexter.compat import _import_optional_
+import dexter.parallel
+
+# the extension pandas infers each compression of text and pickle files from
+COMPRESSION_EXTENSIONS = {None: '', 'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst', 'zip': '.zip'}
+
+
+def _compression_extension_(compression: str) -> str:
+    """
+    Returns the extension added to the files written with a compression, raises a ValueError
+    if pandas can not write it
+    """
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f'compression must be one of {list(COMPRESSION_EXTENSIONS)}, got {compression!r}')
+
+    return COMPRESSION_EXTENSIONS[compression]
+
+
+def _atomic_write_(write: Callable, path: str, *args, **kwargs) -> None:
+    """
+    Calls write with a temporary path (and args and kwargs) in the folder of path, created if needed,
+    and renames the temporary file to path once it is complete. The temporary file is removed if
+    the write fails.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    temporary = f'{path}.{uuid.uuid4().hex}.tmp'
+
+    try:
+        write(temporary, *args, **kwargs)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _to_excel_(df: pd.DataFrame, path: str, **kwargs) -> None:
+    """
+    Writes a dataframe to an xlsx file atomically, through a file object as pandas picks the excel
+    engine by the extension of a path and temporary files have none
+    """
+    def write(temporary: str) -> None:
+        with open(temporary, 'wb') as file:
+            df.to_excel(file, **kwargs)
+
+    _atomic_write_(write, path)
+
+
+def _write_item_(item) -> None:
+    """
+    Receives a (writer, dataframe, path, kwargs) tuple, the writer being the name of a DataFrame
+    method (e.g. 'to_csv'), called here through a temporary file, or a function receiving the dataframe,
+    the path and kwargs that writes atomically itself
+
+    Writes the dataframe to the path
+    """
+    writer, df, path, kwargs = item
+
+    if isinstance(writer, str):
+        _atomic_write_(lambda temporary: getattr(df, writer)(temporary, **kwargs), path)
+    else:
+        writer(df, path, **kwargs)
+
+
+def _write_frames_(writer: Union[str, Callable], frames: List[pd.DataFrame], paths: List[str], workers: int = None,
+                   executor: str = None, **kwargs) -> None:
+    """
+    Writes every dataframe to its path with the writer (see _write_item_) over the given (or the default)
+    worker pool
+
+    Raises the first error found, after every write was attempted
+    """
+    workers = dexter.parallel.options['workers'] if workers is None else workers
+    executor = executor or dexter.parallel.options['executor']
+
+    items = [(writer, df, path, kwargs) for df, path in zip(frames, paths)]
+    _, errors = dexter.parallel._map_(_write_item_, items, workers, executor)
+
+    if errors:
+        raise errors[0][1]
+
+
+def _compressor_(file, compression: str):
+    """
+    Receives a binary file open for writing
+
+    Returns a file object compressing what is written to it into file, closing it does not close file
+    """
+    if compression is None:
+        return contextlib.nullcontext(file)
+
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=file, mode='wb')
+
+    if compression == 'bz2':
+        return bz2.BZ2File(file, 'wb')
+
+    if compression == 'xz':
+        return lzma.LZMAFile(file, 'wb')
+
+    if compression == 'zstd':
+        zstandard = _import_optional_('zstandard', 'write zstd compressed csv files')
+        return zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+
+    raise ValueError(f"compression must be one of [None, 'gzip', 'bz2', 'xz', 'zstd'] to write in batches, "
+                     f"got {compression!r}")
+
+
+def _part_paths_(path: str, extension: str) -> Iterator[str]:
+    """
+    Yields the paths of the parts of a file, e.g. df1.part-00000.csv.gz, df1.part-00001.csv.gz, ...
+    """
+    stem = path[:-len(extension)] if path.endswith(extension) else path
+    part = 0
+
+    while True:
+        yield f'{stem}.part-{part:05d}{extension}'
+        part += 1
+
+
+def _print_progress_(progress: dict) -> None:
+    """
+    Prints the progress of a batched write to stderr
+    """
+    print(f"{progress['path']}: {progress['rows']}/{progress['total']} rows, "
+          f"{progress['rows_per_second']:,.0f} rows/s", file=sys.stderr)
+
+
+def _write_csv_batches_(df: pd.DataFrame, path: str, chunksize: int = 100_000, compression: str = None,
+                        max_bytes: int = None, progress: Union[bool, Callable] = False, header: bool = True,
+                        encoding: str = 'utf-8', **kwargs) -> None:
+    """
+    Writes a dataframe to a csv file chunksize rows at a time, so only the text of a single batch is held in
+    memory, compressing it as it is written. If max_bytes is given, the file is split into parts of about
+    max_bytes each, each with its header: the compressed stream is flushed after every batch and a part is
+    closed when the next batch, taken to be as large as the last one, would make it exceed max_bytes.
+    The bz2 and xz compressors can only write the block they hold when their stream ends, so their parts
+    may exceed max_bytes by about a block.
+    If progress is True (or a function receiving a dict), the rows written and rows/s are reported
+    after every batch.
+    Every file (or part) is written to a temporary file and renamed once complete.
+    """
+    if chunksize < 1:
+        raise ValueError(f'chunksize must be a positive integer, got {chunksize}')
+
+    report = _print_progress_ if progress is True else progress
+    extension = '.csv' + _compression_extension_(compression)
+    paths = _part_paths_(path, extension) if max_bytes is not None else iter([path])
+
+    # an empty dataframe still gets a file with its header
+    starts = list(range(0, len(df), chunksize)) or [0]
+    state = {'batch': 0, 'rows': 0, 'started': time.perf_counter()}
+
+    def write(temporary: str, target: str) -> None:
+        with open(temporary, 'wb') as file, _compressor_(file, compression) as stream:
+            first = True
+            size = growth = 0
+
+            while state['batch'] < len(starts):
+                start = starts[state['batch']]
+                batch = df.iloc[start:start + chunksize]
+                stream.write(batch.to_csv(header=header and first, **kwargs).encode(encoding))
+                first = False
+
+                state['batch'] += 1
+                state['rows'] += len(batch)
+
+                if report:
+                    seconds = time.perf_counter() - state['started']
+                    report({'path': target, 'rows': state['rows'], 'total': len(df), 'seconds': seconds,
+                            'rows_per_second': state['rows'] / seconds if seconds else 0.0})
+
+                if max_bytes is None:
+                    continue
+
+                # the compressor holds what it did not write yet, the size on disk is only known after a flush
+                stream.flush()
+                size, growth = file.tell(), file.tell() - size
+
+                if size + growth > max_bytes:
+                    break
+
+    while state['batch'] < len(starts):
+        target = next(paths)
+        _atomic_write_(write, target, target)
@@ -29,6 +29,13 @@ setup(
     author_email='igor.magalhaes.r@gmail.com',
     license='BSD 3',
     packages=find_packages(exclude=("tests",)),
+    extras_require={
+        'arrow': ['pyarrow'],
+        'sql': ['duckdb'],
+        'excel': ['python-calamine', 'openpyxl'],
+        'zstd': ['zstandard'],
+        'all': ['pyarrow', 'duckdb', 'python-calamine', 'openpyxl', 'zstandard'],
+    },
     keyworks='Dataframes',
     project_urls={
         'Documentation': 'https://github.com/igormagalhaesr/dexter/blob/main/README.md',
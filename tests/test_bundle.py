@@ -0,0 +1,35 @@
+import zipfile
+import numpy as np
+import pandas as pd
+import pytest
+from dexter import FrameMap, readm_bundle
+from dexter.bundle import _read_manifest_
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    frames = [pd.DataFrame({'a': np.arange(n), 'b': np.linspace(0, 1, n), 's': ['x'] * n}) for n in (10, 333, 1000)]
+    path = str(tmp_path / 'frames.dexter')
+    FrameMap(frames, ['small', 'medium', 'large']).to_bundle(path)
+
+    return path, frames
+
+
+def test_members_start_at_a_64_byte_boundary(bundle):
+    path, _ = bundle
+    manifest, offsets = _read_manifest_(path)
+
+    assert zipfile.ZipFile(path).testzip() is None
+    assert all(offsets[entry['member']][0] % 64 == 0 for entry in manifest['frames'])
+
+
+def test_filtered_read(bundle):
+    path, frames = bundle
+
+    framemap = readm_bundle(path, filters=[('a', '>=', 5)])
+
+    for name, df in zip(['small', 'medium', 'large'], frames):
+        expected = df[df['a'] >= 5].reset_index(drop=True)
+        pd.testing.assert_frame_equal(framemap[name].reset_index(drop=True), expected, check_dtype=False)
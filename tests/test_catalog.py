@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from dexter import FrameMap
+
+
+def test_unnamed_and_int_named_maps():
+    df = pd.DataFrame({'a': [1, 2, None]})
+
+    assert FrameMap([df]).catalog().columns().loc[('0', 'a'), 'missing'] == 1
+    assert list(FrameMap([df, df], [1, 2]).catalog().entries) == ['1', '2']
+
+
+def test_overlaps_find_the_join_key():
+    rng = np.random.default_rng(0)
+    customers = pd.DataFrame({'id': np.arange(1000), 'other': np.arange(1000) + 10 ** 6})
+    orders = pd.DataFrame({'customer_id': rng.integers(0, 1000, 5000).astype(float)})
+    catalog = FrameMap([orders, customers], ['orders', 'customers']).catalog()
+
+    overlaps = catalog.overlaps('orders', 'customer_id')
+
+    assert overlaps.index[0] == ('customers', 'id')
+    assert ('customers', 'other') not in overlaps.index
+    assert abs(catalog.columns().loc[('customers', 'id'), 'distinct'] - 1000) < 50
+
+
+def test_incremental_updates():
+    a, b = pd.DataFrame({'x': [1, 2]}), pd.DataFrame({'y': [3]})
+    framemap = FrameMap([a, b], ['a', 'b'])
+    catalog = framemap.catalog()
+    entry = catalog.entries['a']
+
+    framemap.rename_frames(['renamed', None])
+
+    assert framemap.catalog().entries['renamed'] is entry
+    assert catalog.frames_with('y') == ['b']
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+from dexter import FrameList, FrameMap
+from dexter.display import _to_html_str_
+
+
+def frame(rows: int = 3, columns: int = 2) -> pd.DataFrame:
+    return pd.DataFrame({f'c{i}': range(rows) for i in range(columns)})
+
+
+@pytest.mark.parametrize('framemap', [
+    FrameMap([frame(), frame()]),
+    FrameMap([frame(), frame()], [1, 2]),
+    FrameMap([frame(), frame()]).reset_index(),
+])
+def test_repr_html_of_unnamed_and_int_named_maps(framemap):
+    html = framemap._repr_html_()
+
+    assert html.count('<table') == 3
+    assert str(framemap.names[1]) in html
+
+
+def test_frames_are_truncated():
+    html = FrameMap([frame(1000, 100)], ['wide'])._repr_html_()
+
+    assert '1000 rows × 100 columns' in html
+    assert html.count('<tr>') < 20
+
+
+def test_pages():
+    framemap = FrameMap([frame() for _ in range(5)], [f'df{i}' for i in range(5)])
+    html = _to_html_str_(framemap.frames, framemap.names, page=1, max_frames=2)
+
+    assert 'df2' in html and 'df3' in html and 'df1' not in html and 'df4' not in html
+    assert 'dataframes 3 to 4 of 5' in html
+
+    with pytest.raises(ValueError):
+        _to_html_str_(framemap.frames, framemap.names, page=3, max_frames=2)
+
+
+def test_cached_fragment_follows_changes():
+    df = frame()
+    framemap = FrameMap([df], ['df'])
+    first = framemap._repr_html_()
+
+    assert framemap._repr_html_() == first
+
+    df.iloc[0, 0] = 12345
+    assert '12345' in framemap._repr_html_()
+
+
+def test_frame_list():
+    assert FrameList([frame(), frame()])._repr_html_().count('<table') == 3
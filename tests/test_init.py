@@ -0,0 +1,22 @@
+import subprocess
+import sys
+import pytest
+import dexter
+
+
+def test_import_loads_no_submodule_nor_ipython():
+    code = ('import sys, dexter; '
+            'print(sorted(name for name in sys.modules if name.startswith("dexter.") or name == "IPython"))')
+
+    assert subprocess.check_output([sys.executable, '-c', code], text=True).strip() == '[]'
+
+
+def test_names_are_imported_when_first_used():
+    from dexter.framemap import FrameMap
+
+    assert dexter.FrameMap is FrameMap
+    assert set(dexter.__all__) <= set(dir(dexter))
+    assert dexter.parallel.options is not None
+
+    with pytest.raises(AttributeError):
+        dexter.missing
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from dexter import infer_csv_schema, optimize, optimize_chunks
+
+
+def test_duplicate_labels():
+    df = pd.DataFrame({'a': [0.5, 1.5], 'b': [1.0, 2.0], 'c': [1, 2]}).set_axis(['x', 'x', 'y'], axis=1)
+
+    out, report = optimize(df, report=True)
+
+    assert list(out.columns) == ['x', 'x', 'y']
+    assert out.dtypes.tolist() == [np.float32, np.float32, np.int8]
+    assert list(report.index[1:]) == ['x', 'x', 'y']
+    assert df.dtypes.tolist() == [np.float64, np.float64, np.int64]
+
+    optimize(df, inplace=True)
+    assert df.dtypes.tolist() == [np.float32, np.float32, np.int8]
+
+
+def test_optimize_chunks_falls_back_to_object_for_text_after_missing_values(tmp_path):
+    path = tmp_path / 'data.csv'
+    rows = [f',{i},x{i % 3}' for i in range(100)] + [f'text{i},{i * 10 ** 6},y' for i in range(100)]
+    path.write_text('a,b,c\n' + '\n'.join(rows) + '\n')
+
+    df = optimize_chunks(pd.read_csv(path, chunksize=30))
+    expected = pd.read_csv(path)
+
+    assert df.shape == (200, 3)
+    assert df['a'].isna().sum() == 100 and df['a'].iloc[-1] == 'text99'
+    assert (df['b'].astype('int64') == expected['b']).all()
+    assert isinstance(df['c'].dtype, pd.CategoricalDtype)
+    assert list(df['c'].astype(str)) == list(expected['c'])
+    assert df.index.equals(pd.RangeIndex(200))
+
+
+def test_optimize_chunks_promotes_numbers():
+    chunks = [pd.DataFrame({'x': [1, 2]}), pd.DataFrame({'x': [70000, None]})]
+
+    df = optimize_chunks(iter(chunks))
+
+    assert df['x'].dtype == np.float32 and df['x'].tolist()[:3] == [1, 2, 70000]
+
+
+def test_inferred_schema_does_not_round_values_outside_of_the_sample(tmp_path):
+    path = tmp_path / 'data.csv'
+    # the precise value is in none of the sampled head, middle and tail
+    rows = [f'{i % 10}.5' for i in range(5000)]
+    rows[1000] = '12345678.9'
+    path.write_text('x\n' + '\n'.join(rows) + '\n')
+
+    schema = infer_csv_schema(str(path), sample_bytes=100)
+    df = pd.read_csv(path, **schema)
+
+    assert df['x'].iloc[1000] == 12345678.9
+    assert optimize(df)['x'].dtype == np.float64
+    assert infer_csv_schema(str(path), sample_bytes=100, float32=True)['dtype'] == {'x': 'float32'}
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+from dexter import FrameMap, readm_csv
+
+pytest.importorskip('duckdb')
+
+
+def test_unnamed_and_int_named_maps():
+    df = pd.DataFrame({'a': [1, 2, 3]})
+
+    assert FrameMap([df]).sql('select sum(a) from "0"').iloc[0, 0] == 6
+    assert FrameMap([df, df], [1, 2]).sql('select count(*) from "2"').iloc[0, 0] == 3
+
+
+def test_join():
+    orders = pd.DataFrame({'customer_id': [1, 1, 2], 'total': [10.0, 5.0, 1.0]})
+    customers = pd.DataFrame({'customer_id': [1, 2], 'region': ['eu', 'us']})
+    framemap = FrameMap([orders, customers], ['orders', 'customers'])
+
+    result = framemap.sql('select region, sum(total) as total from orders join customers using (customer_id) '
+                          'group by region order by region')
+
+    assert result.to_dict('list') == {'region': ['eu', 'us'], 'total': [15.0, 1.0]}
+
+
+def test_lazy_files_are_scanned_and_only_when_mentioned(tmp_path):
+    for name in ('f1', 'f10'):
+        pd.DataFrame({'a': [1, 2]}).to_csv(tmp_path / f'{name}.csv', index=False)
+
+    framemap = readm_csv(str(tmp_path), lazy=True)
+
+    assert framemap.sql('select sum(a) from f10').iloc[0, 0] == 3
+    assert not framemap.is_loaded('f1') and not framemap.is_loaded('f10')
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from dexter import FrameMap
+
+
+@pytest.mark.parametrize('first, second', [
+    (pd.Series([1, 2], dtype='Int8'), pd.Series([300, None], dtype='Int16')),
+    (pd.Series([True, None], dtype='boolean'), pd.Series([False, True])),
+    (pd.Series([1, None], dtype='Int8'), pd.Series([0.5, 1.5], dtype='float32')),
+    (pd.Series([1, 2], dtype='UInt8'), pd.Series([-1, None], dtype='Int8')),
+    (pd.Series([True, False], dtype='boolean'), pd.Series([1, None], dtype='Int8')),
+])
+def test_extension_dtypes_match_pandas(first, second):
+    frames = [pd.DataFrame({'a': first}), pd.DataFrame({'a': second}), pd.DataFrame({'b': [1]})]
+
+    union = FrameMap(frames).concat()
+    expected = pd.concat(frames, ignore_index=True)
+
+    assert union['a'].dtype == expected['a'].dtype
+    assert union['a'].astype(object).equals(expected['a'].astype(object))
+
+
+def test_numbers_are_not_upcast_more_than_needed():
+    frames = [pd.DataFrame({'a': np.array([1, 2], dtype='int8')}),
+              pd.DataFrame({'a': np.array([300], dtype='int16')})]
+
+    union = FrameMap(frames).concat()
+
+    assert union['a'].dtype == np.int16
+    assert union['a'].tolist() == [1, 2, 300]
+
+
+def test_categoricals_keep_the_union_of_categories():
+    frames = [pd.DataFrame({'a': pd.Categorical(['x', 'y'])}), pd.DataFrame({'a': pd.Categorical(['z', 'x'])})]
+
+    union = FrameMap(frames).concat()
+
+    assert isinstance(union['a'].dtype, pd.CategoricalDtype)
+    assert set(union['a'].cat.categories) == {'x', 'y', 'z'}
+    assert union['a'].tolist() == ['x', 'y', 'z', 'x']
+
+
+def test_key_column():
+    frames = [pd.DataFrame({'a': [1, 2]}), pd.DataFrame({'a': [3.5]})]
+
+    union = FrameMap(frames, ['jan', 'feb']).concat(key='month')
+
+    assert list(union.columns) == ['month', 'a']
+    assert union['month'].tolist() == ['jan', 'jan', 'feb']
+    assert union['a'].tolist() == [1.0, 2.0, 3.5]
+
+    with pytest.raises(ValueError):
+        FrameMap(frames).concat(key='a')
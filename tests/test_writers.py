@@ -0,0 +1,23 @@
+import glob
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from dexter import FrameMap
+
+
+# bz2 and xz can not be flushed and may exceed max_bytes by about a block
+@pytest.mark.parametrize('compression', [None, 'gzip'])
+def test_parts_stay_under_max_bytes(tmp_path, compression):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.integers(0, 10 ** 6, 100_000), 'b': rng.random(100_000)})
+
+    FrameMap([df], ['df']).to_csv(filepath=str(tmp_path), compression=compression, chunksize=5_000,
+                                  max_bytes=300_000, index=False)
+    parts = sorted(glob.glob(str(tmp_path / 'df.part-*')))
+
+    assert len(parts) > 1
+    assert all(os.path.getsize(part) <= 300_000 for part in parts)
+
+    union = pd.concat([pd.read_csv(part) for part in parts], ignore_index=True)
+    pd.testing.assert_frame_equal(union, df)